@@ -11,23 +11,81 @@ Identifies bottlenecks in:
 - UI callback overhead
 
 Usage:
-    python test_download_performance.py
+    python test_download_performance.py             (raw timings)
+    python test_download_performance.py --profile   (adds cProfile report)
+    python test_download_performance.py -v          (tracebacks for errors)
+
+cProfile adds overhead to every Python call, so throughput numbers are
+only trustworthy without --profile.
 """
 
+import logging
 import time
-import cProfile
-import pstats
-import os
 import tempfile
-import shutil
 from pathlib import Path
 
 # Add project to path
 import sys
 sys.path.insert(0, str(Path(__file__).parent))
 
-from rommanager.myrient_downloader import MyrientDownloader
-from rommanager.downloader import ArchiveOrgDownloader
+from rommanager.myrient_downloader import (
+    MyrientDownloader, DOWNLOAD_CHUNK_SIZE, CRC_BACKENDS,
+)
+
+PROFILE = '--profile' in sys.argv
+
+# Tracebacks are logged at DEBUG, so they are only formatted with -v
+logger = logging.getLogger('rommanager.profiler')
+
+
+def start_profiler():
+    """Return an enabled cProfile.Profile, or None unless --profile was given."""
+    if not PROFILE:
+        return None
+    import cProfile
+    profiler = cProfile.Profile()
+    profiler.enable()
+    return profiler
+
+
+def print_top_consumers(profiler, label):
+    """
+    Print the hottest app-level frames collected by start_profiler().
+
+    Frames are filtered to rommanager/* so ssl/socket/urllib internals don't
+    crowd out app hotspots. The cumulative table shows where wall time goes,
+    the tottime table shows CPU-bound frames. The top 50 frames by tottime
+    are also written to download_profile_<label>.json for comparing runs.
+    """
+    if profiler is None:
+        return
+    import json
+    import pstats
+    print("\n" + "-" * 70)
+    print("TOP TIME CONSUMERS (rommanager, cumulative)")
+    print("-" * 70)
+    ps = pstats.Stats(profiler)
+    ps.sort_stats('cumulative')
+    ps.print_stats('rommanager', 20)
+
+    print("-" * 70)
+    print("TOP TIME CONSUMERS (rommanager, own time)")
+    print("-" * 70)
+    ps.sort_stats('tottime')
+    ps.print_stats('rommanager', 20)
+
+    frames = sorted(ps.stats.items(), key=lambda kv: kv[1][2], reverse=True)[:50]
+    rows = [
+        {
+            'file': filename, 'line': line, 'function': func,
+            'calls': nc, 'tottime': tt, 'cumtime': ct,
+        }
+        for (filename, line, func), (_cc, nc, tt, ct, _callers) in frames
+    ]
+    out_path = f"download_profile_{label}.json"
+    with open(out_path, 'w', encoding='utf-8') as f:
+        json.dump(rows, f, indent=2)
+    print(f"Top {len(rows)} frames written to {out_path}")
 
 
 def format_size(bytes_val):
@@ -39,18 +97,14 @@ def format_size(bytes_val):
     return f"{bytes_val:.1f} TB"
 
 
-def test_myrient_single():
+def test_myrient_single(dl, systems):
     """Profile: Single ROM download from Myrient (~10-50 MB)"""
     print("\n" + "=" * 70)
     print("TEST 1: MYRIENT - SINGLE ROM (~10-50 MB)")
     print("=" * 70)
 
-    dl = MyrientDownloader()
-
-    # Find a test ROM
-    print("\n[1] Listing available systems...")
-    systems = MyrientDownloader.get_systems()
-    print(f"   Found {len(systems)} systems")
+    dl.clear_queue()
+    print(f"\n[1] {len(systems)} systems available")
 
     # Pick a system and find a medium-sized ROM
     print("\n[2] Searching for test ROM (1-50 MB)...")
@@ -64,10 +118,10 @@ def test_myrient_single():
     test_rom = None
     test_system = None
 
-    for sys in test_systems:
+    for system in test_systems:
         try:
-            print(f"   Trying {sys}...")
-            roms = dl.list_files(sys)
+            print(f"   Trying {system}...")
+            roms = dl.list_files(system)
             # Filter valid ROMs with size info
             valid_roms = [r for r in roms if r.size and r.size > 1_000_000]
 
@@ -76,14 +130,14 @@ def test_myrient_single():
                 test_rom = next((r for r in valid_roms if 5_000_000 < r.size < 50_000_000), None)
                 if not test_rom:
                     test_rom = valid_roms[0]  # Just take first valid one
-                test_system = sys
+                test_system = system
                 break
         except Exception as e:
             print(f"      Error: {e}")
             continue
 
     if not test_rom:
-        print(f"   ERROR: No valid ROMs found in any system")
+        print("   ERROR: No valid ROMs found in any system")
         return None
 
     print(f"\n   ✓ Found: {test_rom.name}")
@@ -91,19 +145,14 @@ def test_myrient_single():
     print(f"     Size: {format_size(test_rom.size)}")
     print(f"     URL: {test_rom.url[:80]}...")
 
-    except Exception as e:
-        print(f"   ERROR: {e}")
-        return None
-
     # Setup download
     with tempfile.TemporaryDirectory() as tmpdir:
         print(f"\n[3] Preparing download to {tmpdir}...")
         dl.queue_rom(test_rom.name, test_rom.url, tmpdir)
 
         # Run profiling
-        print("\n[4] Starting profiled download...")
-        profiler = cProfile.Profile()
-        profiler.enable()
+        print("\n[4] Starting download...")
+        profiler = start_profiler()
 
         start_time = time.time()
         call_count = [0]
@@ -115,10 +164,11 @@ def test_myrient_single():
             result = dl.start_downloads(progress_cb)
             elapsed = time.time() - start_time
 
-            profiler.disable()
+            if profiler:
+                profiler.disable()
 
             # Results
-            print(f"\n" + "=" * 70)
+            print("\n" + "=" * 70)
             print("MYRIENT SINGLE ROM - RESULTS")
             print("=" * 70)
             print(f"Status:          {result.current_task.status.name if result.current_task else 'Unknown'}")
@@ -128,32 +178,25 @@ def test_myrient_single():
             print(f"Avg call freq:   {call_count[0] / elapsed:.1f} Hz")
 
             if result.current_task and result.current_task.total_bytes > 0:
-                print(f"Chunks fetched:  {result.current_task.total_bytes / 256_000:.0f}")
+                print(f"Chunks fetched:  {result.current_task.total_bytes / DOWNLOAD_CHUNK_SIZE:.0f}")
 
-            # Top time consumers
-            print(f"\n" + "-" * 70)
-            print("TOP TIME CONSUMERS")
-            print("-" * 70)
-            ps = pstats.Stats(profiler)
-            ps.sort_stats('cumulative')
-            ps.print_stats(8)
+            print_top_consumers(profiler, "myrient_single")
 
             return elapsed
 
         except Exception as e:
             print(f"\nERROR during download: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.debug("while downloading %s", test_rom.name, exc_info=True)
             return None
 
 
-def test_myrient_batch():
+def test_myrient_batch(dl):
     """Profile: Multiple ROM downloads from Myrient (batch)"""
     print("\n" + "=" * 70)
     print("TEST 2: MYRIENT - BATCH (5 ROMs, ~5-15 MB each)")
     print("=" * 70)
 
-    dl = MyrientDownloader()
+    dl.clear_queue()
 
     print("\n[1] Listing test ROMs...")
     try:
@@ -186,9 +229,8 @@ def test_myrient_batch():
         for rom in test_roms:
             dl.queue_rom(rom.name, rom.url, tmpdir)
 
-        print("[3] Starting profiled batch download...")
-        profiler = cProfile.Profile()
-        profiler.enable()
+        print("[3] Starting batch download...")
+        profiler = start_profiler()
 
         start_time = time.time()
         call_count = [0]
@@ -197,13 +239,16 @@ def test_myrient_batch():
             call_count[0] += 1
 
         try:
-            result = dl.start_downloads(progress_cb)
+            # No inter-file delay, and up to 4 files at once (the Myrient connection cap)
+            result = dl.start_downloads(progress_cb, download_delay=0,
+                                        max_workers=min(4, len(test_roms)))
             elapsed = time.time() - start_time
 
-            profiler.disable()
+            if profiler:
+                profiler.disable()
 
             # Results
-            print(f"\n" + "=" * 70)
+            print("\n" + "=" * 70)
             print("MYRIENT BATCH - RESULTS")
             print("=" * 70)
             print(f"ROMs completed:  {result.completed}")
@@ -215,20 +260,13 @@ def test_myrient_batch():
             print(f"Time/ROM:        {elapsed / len(test_roms):.2f}s")
             print(f"Progress calls:  {call_count[0]}")
 
-            # Top time consumers
-            print(f"\n" + "-" * 70)
-            print("TOP TIME CONSUMERS")
-            print("-" * 70)
-            ps = pstats.Stats(profiler)
-            ps.sort_stats('cumulative')
-            ps.print_stats(8)
+            print_top_consumers(profiler, "myrient_batch")
 
             return elapsed
 
         except Exception as e:
             print(f"\nERROR during batch download: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.debug("while downloading batch of %d", len(test_roms), exc_info=True)
             return None
 
 
@@ -240,51 +278,70 @@ def test_network_baseline():
 
     import socket
     import urllib.request
+    from concurrent.futures import ThreadPoolExecutor
+
+    def resolve(host):
+        start = time.time()
+        infos = socket.getaddrinfo(host, 443, socket.AF_UNSPEC, socket.SOCK_STREAM)
+        addrs = list(dict.fromkeys(info[4][0] for info in infos))
+        return addrs, time.time() - start
+
+    def ttfb(url):
+        start = time.time()
+        with urllib.request.urlopen(url, timeout=10):
+            return time.time() - start
 
-    # Test DNS resolution
-    print("\n[1] DNS Resolution:")
     hosts = [
         ("myrient.erista.me", "Myrient"),
         ("archive.org", "Archive.org"),
     ]
-
-    for host, name in hosts:
-        try:
-            start = time.time()
-            ip = socket.gethostbyname(host)
-            elapsed = time.time() - start
-            print(f"   {name:20} {host:25} -> {ip:15} ({elapsed*1000:.1f}ms)")
-        except Exception as e:
-            print(f"   {name:20} {host:25} -> ERROR: {e}")
-
-    # Test HTTP latency
-    print("\n[2] HTTP Latency (TTFB - Time To First Byte):")
-
     test_urls = [
         ("https://myrient.erista.me/files/No-Intro/", "Myrient"),
         ("https://archive.org/", "Archive.org"),
     ]
 
-    for url, name in test_urls:
-        try:
-            start = time.time()
-            response = urllib.request.urlopen(url, timeout=10)
-            elapsed = time.time() - start
-            print(f"   {name:20} {elapsed*1000:7.1f}ms")
-        except Exception as e:
-            print(f"   {name:20} ERROR: {e}")
+    # All probes run concurrently (IPv4 and IPv6); results print in order
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        dns = [(host, name, ex.submit(resolve, host)) for host, name in hosts]
+        http = [(name, ex.submit(ttfb, url)) for url, name in test_urls]
+
+        print("\n[1] DNS Resolution:")
+        for host, name, future in dns:
+            try:
+                addrs, elapsed = future.result()
+                print(f"   {name:20} {host:25} -> {', '.join(addrs)} ({elapsed*1000:.1f}ms)")
+            except Exception as e:
+                print(f"   {name:20} {host:25} -> ERROR: {e}")
+
+        print("\n[2] HTTP Latency (TTFB - Time To First Byte):")
+        for name, future in http:
+            try:
+                print(f"   {name:20} {future.result()*1000:7.1f}ms")
+            except Exception as e:
+                print(f"   {name:20} ERROR: {e}")
 
 
 def main():
     """Run all profiling tests"""
+    verbose = '-v' in sys.argv or '--verbose' in sys.argv
+    logging.basicConfig(level=logging.DEBUG if verbose else logging.WARNING,
+                        format="%(levelname)s %(name)s: %(message)s")
+
     print("\n" + "=" * 70)
     print("ROM MANAGER - DOWNLOAD PERFORMANCE PROFILING")
     print("=" * 70)
     print("\nThis script profiles download performance to identify bottlenecks.")
     print("Tests will connect to real servers (Myrient, Archive.org).")
+    backends = ", ".join(f"{algo}={impl}" for algo, impl in CRC_BACKENDS.items())
+    print(f"CRC backends: {backends}")
 
     results = {}
 
+    # One downloader for every test: its connection pool, TLS context and
+    # listing cache are shared, so setup cost isn't re-measured per test.
+    dl = MyrientDownloader()
+    systems = MyrientDownloader.get_systems()
+
     # Network baseline
     try:
         test_network_baseline()
@@ -293,23 +350,21 @@ def main():
 
     # Single ROM test
     try:
-        elapsed = test_myrient_single()
+        elapsed = test_myrient_single(dl, systems)
         if elapsed:
             results["myrient_single"] = elapsed
     except Exception as e:
         print(f"\nERROR in single ROM test: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.debug("single ROM test failed", exc_info=True)
 
     # Batch test
     try:
-        elapsed = test_myrient_batch()
+        elapsed = test_myrient_batch(dl)
         if elapsed:
             results["myrient_batch"] = elapsed
     except Exception as e:
         print(f"\nERROR in batch test: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.debug("batch test failed", exc_info=True)
 
     # Summary
     print("\n" + "=" * 70)
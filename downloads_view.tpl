@@ -0,0 +1,187 @@
+class DownloadsView(QtWidgets.QWidget):
+    def __init__(self, state: AppState):
+        super().__init__()
+        self.state = state
+        self._pending_missing_candidates = set()
+        self._catalog_current_root_url = ""
+        self._catalog_current_system_url = ""
+        self._catalog_presets = []
+        self._auto_queue_after_missing_resolve = False
+        self._build_ui()
+        self._bind()
+
+    def _build_ui(self) -> None:
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.setContentsMargins(10, 10, 10, 10)
+        layout.setSpacing(10)
+
+        self.title_label = section_title(self.state.t("nav_downloads"))
+        layout.addWidget(self.title_label)
+
+        # --- Torrent Searcher ---
+        torrent_box = QtWidgets.QGroupBox("Torrent Searcher")
+        torrent_layout = QtWidgets.QVBoxLayout(torrent_box)
+        
+        t_row = QtWidgets.QHBoxLayout()
+        self.torrent_query = QtWidgets.QLineEdit()
+        self.torrent_query.setPlaceholderText("Search Torrents (e.g. Redump PS2)")
+        self.btn_torrent_search = QtWidgets.QPushButton("Search")
+        self.btn_torrent_search.setObjectName("Accent")
+        self.btn_torrent_search.clicked.connect(self._search_torrents)
+        t_row.addWidget(self.torrent_query, 1)
+        t_row.addWidget(self.btn_torrent_search)
+        torrent_layout.addLayout(t_row)
+        
+        self.torrent_list = QtWidgets.QTableWidget()
+        self.torrent_list.setColumnCount(4)
+        self.torrent_list.setHorizontalHeaderLabels(["Name", "Size", "Seeders", "Magnet"])
+        self.torrent_list.horizontalHeader().setStretchLastSection(True)
+        self.torrent_list.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectionBehavior.SelectRows)
+        self.torrent_list.setFixedHeight(150)
+        torrent_layout.addWidget(self.torrent_list)
+        
+        self.btn_torrent_queue = QtWidgets.QPushButton("Queue Selected Torrents")
+        self.btn_torrent_queue.clicked.connect(self._queue_selected_torrents)
+        torrent_layout.addWidget(self.btn_torrent_queue)
+        layout.addWidget(torrent_box)
+
+        # --- Download Queue (JDownloader) ---
+        download_box = QtWidgets.QGroupBox(self.state.t("tools_download_title"))
+        download_layout = QtWidgets.QVBoxLayout(download_box)
+        
+        out_row = QtWidgets.QHBoxLayout()
+        self.download_output = QtWidgets.QLineEdit()
+        self.btn_download_browse = QtWidgets.QPushButton(self.state.t("browse"))
+        self.btn_download_browse.clicked.connect(self._browse_download_output)
+        out_row.addWidget(QtWidgets.QLabel(self.state.t("output")))
+        out_row.addWidget(self.download_output, 1)
+        out_row.addWidget(self.btn_download_browse)
+        download_layout.addLayout(out_row)
+
+        url_row = QtWidgets.QHBoxLayout()
+        self.download_base_url = QtWidgets.QLineEdit()
+        self.download_base_url.setPlaceholderText("https://myrient.erista.me/files")
+        self.btn_download_add_line = QtWidgets.QPushButton(self.state.t("tools_download_add_url"))
+        self.btn_download_resolve_missing = QtWidgets.QPushButton(self.state.t("tools_download_resolve_missing"))
+        self.btn_download_add_line.clicked.connect(self._add_download_line_dialog)
+        self.btn_download_resolve_missing.clicked.connect(self._resolve_missing_links_from_pending)
+        url_row.addWidget(self.download_base_url, 1)
+        url_row.addWidget(self.btn_download_add_line)
+        url_row.addWidget(self.btn_download_resolve_missing)
+        download_layout.addLayout(url_row)
+
+        self.download_urls = QtWidgets.QPlainTextEdit()
+        self.download_urls.setPlaceholderText(self.state.t("tools_download_urls_placeholder"))
+        download_layout.addWidget(self.download_urls, 1)
+
+        btn_row = QtWidgets.QHBoxLayout()
+        self.btn_download_send_jd = QtWidgets.QPushButton(self.state.t("tools_download_send_jd"))
+        self.btn_download_send_jd.setObjectName("Accent")
+        self.btn_download_send_jd.clicked.connect(self._send_download_targets_to_jd)
+        self.btn_download_clear = QtWidgets.QPushButton(self.state.t("tools_download_clear"))
+        self.btn_download_clear.clicked.connect(self.download_urls.clear)
+        self.chk_download_jd_autostart = QtWidgets.QCheckBox(self.state.t("tools_download_jd_autostart"))
+        btn_row.addWidget(self.btn_download_send_jd)
+        btn_row.addWidget(self.btn_download_clear)
+        btn_row.addWidget(self.chk_download_jd_autostart)
+        btn_row.addStretch(1)
+        download_layout.addLayout(btn_row)
+        
+        layout.addWidget(download_box, 1)
+        self._refresh_tooltips()
+
+    def _refresh_tooltips(self) -> None:
+        set_widget_tooltip(self.torrent_query, "Search for torrents using Apibay API.")
+        set_widget_tooltip(self.download_output, self.state.t("tip_download_output_folder"))
+        set_widget_tooltip(self.download_urls, self.state.t("tip_download_urls_input"))
+        set_widget_tooltip(self.btn_download_send_jd, self.state.t("tip_download_send_jd"))
+
+    def _bind(self) -> None:
+        self.state.download_missing_requested.connect(self._on_download_missing_requested)
+        self.state.myrient_links_resolved.connect(self._on_myrient_links_resolved_legacy)
+        self.state.download_progress.connect(self._on_download_progress)
+
+    def refresh_texts(self) -> None:
+        self.title_label.setText(self.state.t("nav_downloads"))
+        self._refresh_tooltips()
+
+    def _search_torrents(self) -> None:
+        query = self.torrent_query.text().strip()
+        if not query: return
+        import threading, requests
+        def _fetch():
+            try:
+                self.btn_torrent_search.setText("Searching...")
+                r = requests.get(f"https://apibay.org/q.php?q={query}", timeout=10)
+                data = r.json()
+                QtCore.QMetaObject.invokeMethod(self, "_on_torrents_fetched", QtCore.Qt.QueuedConnection, QtCore.Q_ARG(list, data))
+            except: pass
+            finally: QtCore.QMetaObject.invokeMethod(self.btn_torrent_search, "setText", QtCore.Qt.QueuedConnection, QtCore.Q_ARG(str, "Search"))
+        threading.Thread(target=_fetch, daemon=True).start()
+
+    @QtCore.Slot(list)
+    def _on_torrents_fetched(self, data: list) -> None:
+        self.torrent_list.setRowCount(0)
+        if not data or not isinstance(data, list) or (len(data) == 1 and data[0].get('id') == '0'): return
+        for row in data[:20]:
+            idx = self.torrent_list.rowCount()
+            self.torrent_list.insertRow(idx)
+            self.torrent_list.setItem(idx, 0, QtWidgets.QTableWidgetItem(row.get('name', '')))
+            self.torrent_list.setItem(idx, 1, QtWidgets.QTableWidgetItem(row.get('size', '0')))
+            self.torrent_list.setItem(idx, 2, QtWidgets.QTableWidgetItem(row.get('seeders', '0')))
+            ih = row.get('info_hash', '')
+            mag = f"magnet:?xt=urn:btih:{ih}" if ih else ""
+            self.torrent_list.setItem(idx, 3, QtWidgets.QTableWidgetItem(mag))
+
+    def _queue_selected_torrents(self) -> None:
+        selected = self.torrent_list.selectedItems()
+        if not selected: return
+        rows = set(i.row() for i in selected)
+        for r in rows:
+            mag = self.torrent_list.item(r, 3).text()
+            if mag: self._append_download_line(mag)
+
+    def _append_download_line(self, url: str, name: str = "") -> None:
+        line = url if not name else f"{url} | {name}"
+        curr = self.download_urls.toPlainText().splitlines()
+        if line not in curr:
+            curr.append(line)
+            self.download_urls.setPlainText("\n".join(curr))
+
+    def _browse_download_output(self) -> None:
+        selected = pick_dir(self, self.state.t("select_output_folder"))
+        if selected: self.download_output.setText(selected)
+
+    def _add_download_line_dialog(self) -> None: pass
+    def _resolve_missing_links_from_pending(self) -> None:
+        if not self._pending_missing_candidates: return
+        base_url = self.download_base_url.text().strip() or "https://myrient.erista.me/files"
+        self._auto_queue_after_missing_resolve = False
+        self.state.resolve_myrient_links_from_missing(base_url, list(self._pending_missing_candidates))
+
+    def _on_download_missing_requested(self, items: list) -> None:
+        self._pending_missing_candidates.update(items)
+        self._resolve_missing_links_from_pending()
+
+    def _on_myrient_links_resolved_legacy(self, payload: dict) -> None:
+        matches = payload.get("matches", [])
+        unmatched = payload.get("unmatched", [])
+        for m in matches: self._append_download_line(m.get("url", ""), m.get("filename", ""))
+        for u in unmatched: self._append_download_line(f"# [Unmatched] {u.get('rom_name', 'missing')}")
+
+    def _send_download_targets_to_jd(self) -> None:
+        urls = self.download_urls.toPlainText().splitlines()
+        targets = []
+        for line in urls:
+            if not line.strip() or line.startswith("#"): continue
+            if " | " in line:
+                u, n = line.split(" | ", 1)
+                targets.append({"url": u.strip(), "filename": n.strip()})
+            else:
+                targets.append({"url": line.strip()})
+        if targets:
+            self.state.queue_jdownloader_downloads_async(targets, autostart=self.chk_download_jd_autostart.isChecked())
+
+    def _on_download_progress(self, *args) -> None: pass
+    def prepare_myrient_missing_candidates(self, items: list) -> None:
+        self._pending_missing_candidates.update(items)
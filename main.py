@@ -8,106 +8,117 @@ Usage:
     Flet GUI: python main.py --flet
     PySide6:  python main.py --pyside6
     Tkinter:  python main.py --gui
-    Web Mode: python main.py --web
+    Web Mode: python main.py --web [--host HOST] [--port PORT]
     CLI Mode: python main.py --dat <file> --roms <folder> --output <folder>
 
 For CLI help: python main.py --help
 """
 
+import argparse
 import sys
 import os
 
 # Add package to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from rommanager import __version__
-from rommanager.monitor import setup_runtime_monitor, monitor_action
-from rommanager.settings import load_settings, apply_runtime_settings
+
+def _run_web(args):
+    try:
+        from rommanager.web import run_server
+    except ImportError as e:
+        print("Error: Flask is required for web interface")
+        print("Install it with: pip install flask")
+        print(f"\nDetails: {e}")
+        sys.exit(1)
+    run_server(args.host, args.port, shutdown_on_idle=True)
+
+
+def _run_tkinter(args):
+    from rommanager.gui import run_gui, GUI_AVAILABLE
+    if GUI_AVAILABLE:
+        sys.exit(run_gui())
+    print("tkinter not available. Use --flet or --web instead.")
+    sys.exit(1)
+
+
+def _run_pyside6(args):
+    try:
+        from rommanager.gui_pyside6 import run_pyside6_gui
+    except ImportError as e:
+        print("Error: PySide6 is required for the desktop interface")
+        print("Install it with: pip install PySide6")
+        print(f"\nDetails: {e}")
+        sys.exit(1)
+    sys.exit(run_pyside6_gui())
+
+
+def _run_flet(args):
+    try:
+        from rommanager.gui_flet import run_flet_gui
+    except ImportError as e:
+        print("Error: Flet is required for the desktop interface")
+        print("Install it with: pip install flet")
+        print(f"\nDetails: {e}")
+        sys.exit(1)
+    sys.exit(run_flet_gui())
+
+
+# Interface flags in precedence order: (flag dest, monitor label, runner).
+# Only the selected runner imports its UI toolkit.
+MODES = (
+    ('web', 'web', _run_web),
+    ('gui', 'tkinter', _run_tkinter),
+    ('pyside6', 'pyside6', _run_pyside6),
+    ('flet', 'flet', _run_flet),
+)
+
+
+def _parse_launch_args(argv):
+    """Split interface-selection flags from the arguments meant for the CLI."""
+    parser = argparse.ArgumentParser(add_help=False, allow_abbrev=False)
+    for dest, _label, _runner in MODES:
+        parser.add_argument(f'--{dest}', action='store_true')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=5000)
+    return parser.parse_known_args(argv)
 
 
 def main():
     """Main entry point"""
+    argv = sys.argv[1:]
+    args, rest = _parse_launch_args(argv)
+    selected = next(((label, runner) for dest, label, runner in MODES
+                     if getattr(args, dest)), None)
+
+    # CLI (and plain help) set up monitoring and settings inside run_cli
+    if selected is None and argv:
+        from rommanager.cli import run_cli
+        sys.exit(run_cli())
+
+    # Imported here so the import cost is only paid on real launches
+    from rommanager.monitor import setup_runtime_monitor, monitor_action
+    from rommanager.settings import load_settings, apply_runtime_settings
+
     logger = setup_runtime_monitor()
     monitor_action("startup: main.py entry", logger=logger)
     apply_runtime_settings(load_settings())
-    # Check for --web flag
-    if '--web' in sys.argv:
-        monitor_action('mode selected: web', logger=logger)
-        # Get optional host and port
-        host = '127.0.0.1'
-        port = 5000
-
-        for i, arg in enumerate(sys.argv):
-            if arg == '--host' and i + 1 < len(sys.argv):
-                host = sys.argv[i + 1]
-            elif arg == '--port' and i + 1 < len(sys.argv):
-                port = int(sys.argv[i + 1])
-
-        try:
-            from rommanager.web import run_server
-            run_server(host, port, shutdown_on_idle=True)
-        except ImportError as e:
-            print("Error: Flask is required for web interface")
-            print("Install it with: pip install flask")
-            print(f"\nDetails: {e}")
-            sys.exit(1)
-        return
 
-    # Check for --gui flag (legacy tkinter)
-    if '--gui' in sys.argv:
-        monitor_action('mode selected: tkinter', logger=logger)
-        from rommanager.gui import run_gui, GUI_AVAILABLE
-        if GUI_AVAILABLE:
-            sys.exit(run_gui())
-        else:
-            print("tkinter not available. Use --flet or --web instead.")
-            sys.exit(1)
+    if selected is not None:
+        label, runner = selected
+        monitor_action(f'mode selected: {label}', logger=logger)
+        runner(args)
         return
 
-    # Check for --pyside6 flag
-    if '--pyside6' in sys.argv:
-        monitor_action('mode selected: pyside6', logger=logger)
-        try:
-            from rommanager.gui_pyside6 import run_pyside6_gui
-            sys.exit(run_pyside6_gui())
-        except ImportError as e:
-            print("Error: PySide6 is required for the desktop interface")
-            print("Install it with: pip install PySide6")
-            print(f"\nDetails: {e}")
-            sys.exit(1)
+    monitor_action('mode selected: launcher', logger=logger)
+    try:
+        from rommanager.launcher import run_launcher
+        run_launcher()
         return
+    except Exception as e:
+        print(f"Warning: launcher failed ({e}). Falling back to CLI help.")
 
-    # Check for --flet flag
-    if '--flet' in sys.argv:
-        monitor_action('mode selected: flet', logger=logger)
-        try:
-            from rommanager.gui_flet import run_flet_gui
-            sys.exit(run_flet_gui())
-        except ImportError as e:
-            print(f"Error: Flet is required for the desktop interface")
-            print("Install it with: pip install flet")
-            print(f"\nDetails: {e}")
-            sys.exit(1)
-        return
-
-    if len(sys.argv) == 1:
-        monitor_action('mode selected: launcher', logger=logger)
-        try:
-            from rommanager.launcher import run_launcher
-            run_launcher()
-            return
-        except Exception as e:
-            print(f"Warning: launcher failed ({e}). Falling back to CLI help.")
-
-    if len(sys.argv) > 1 and sys.argv[1] not in ('-h', '--help'):
-        monitor_action('mode selected: cli', logger=logger)
-        # CLI mode
-        from rommanager.cli import run_cli
-        sys.exit(run_cli())
-    else:
-        # Show help
-        from rommanager.cli import run_cli
-        sys.exit(run_cli())
+    from rommanager.cli import run_cli
+    sys.exit(run_cli())
 
 
 if __name__ == '__main__':
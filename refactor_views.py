@@ -1,502 +1,121 @@
+import codecs
+import hashlib
 import os
-import re
+import shutil
+import sys
 
-filepath = 'D:/_r0mm/r0mm/rommanager/gui_pyside6_views.py'
-with open(filepath, 'r', encoding='utf-8') as f:
-    content = f.read()
+DEFAULT_VIEWS_PATH = 'D:/_r0mm/r0mm/rommanager/gui_pyside6_views.py'
 
-# find ToolsView class start
-tools_match = re.search(r'^class ToolsView\(QtWidgets\.QWidget\):', content, re.MULTILINE)
-if not tools_match:
-    print("ToolsView not found")
-    exit(1)
+# The file is scanned as bytes in CHUNK_SIZE reads; consecutive windows
+# overlap by OVERLAP bytes (longer than the marker) so a header split
+# across two reads is still found. Nothing after the header is read.
+# The marker carries its own leading newline, so a plain find() only hits
+# the header at the start of a line; offset 0 is checked separately.
+TOOLS_MARKER = b'\nclass ToolsView(QtWidgets.QWidget):'
+CHUNK_SIZE = 128 * 1024
+OVERLAP = 64
 
-pre_content = content[:tools_match.start()]
+# First line of every generated file: sha1 of the content before ToolsView
+# plus both templates. A matching stamp means the rewrite would be a no-op.
+STAMP_PREFIX = b'# refactor_views: '
+STAMP_SCAN = 256
 
 # Extract common methods that both might need (or just keep them in both classes)
 # Actually, I'll just write the minimal ToolsView and DownloadsView.
 
-tools_view_code = """class ToolsView(QtWidgets.QWidget):
-    def __init__(self, state: AppState):
-        super().__init__()
-        self.state = state
-        self._active_dat_ids: set[str] = set()
-        self._dat_library_items: List[Dict[str, Any]] = []
-        self._dat_catalog_items: List[Dict[str, Any]] = []
-        self._build_ui()
-        self._bind()
-        self.state.collections_changed.emit()
-        self.state.dat_library_changed.emit()
-        self.state.dat_sources_changed.emit()
-
-    def _build_ui(self) -> None:
-        layout = QtWidgets.QVBoxLayout(self)
-        layout.setContentsMargins(10, 10, 10, 10)
-        layout.setSpacing(10)
-
-        self.title_label = section_title(self.state.t("nav_tools"))
-        layout.addWidget(self.title_label)
-
-        self.tabs = QtWidgets.QTabWidget()
-        layout.addWidget(self.tabs, 1)
-
-        # Tab: Collections
-        self.tab_collections = QtWidgets.QWidget()
-        coll_layout = QtWidgets.QVBoxLayout(self.tab_collections)
-        
-        save_box = QtWidgets.QGroupBox(self.state.t("save_collection"))
-        save_layout = QtWidgets.QHBoxLayout(save_box)
-        self.collection_name = QtWidgets.QLineEdit()
-        self.collection_name.setPlaceholderText(self.state.t("collection_name"))
-        self.save_btn = QtWidgets.QPushButton(self.state.t("save"))
-        self.save_btn.setObjectName("Accent")
-        self.save_btn.clicked.connect(self._save_collection)
-        save_layout.addWidget(self.collection_name, 1)
-        save_layout.addWidget(self.save_btn)
-        coll_layout.addWidget(save_box)
-
-        list_box = QtWidgets.QGroupBox(self.state.t("collections"))
-        list_layout = QtWidgets.QVBoxLayout(list_box)
-        row = QtWidgets.QHBoxLayout()
-        self.refresh_btn = QtWidgets.QPushButton(self.state.t("refresh"))
-        self.recent_btn = QtWidgets.QPushButton(self.state.t("recent"))
-        self.refresh_btn.clicked.connect(self.state.refresh_collections)
-        self.recent_btn.clicked.connect(self.state.refresh_recent_collections)
-        row.addWidget(self.refresh_btn)
-        row.addWidget(self.recent_btn)
-        row.addStretch(1)
-        list_layout.addLayout(row)
-        self.collections_list = QtWidgets.QListWidget()
-        list_layout.addWidget(self.collections_list, 1)
-        coll_layout.addWidget(list_box, 1)
-
-        report_box = QtWidgets.QGroupBox(self.state.t("export_report"))
-        report_layout = QtWidgets.QHBoxLayout(report_box)
-        self.export_path = QtWidgets.QLineEdit()
-        self.export_path.setPlaceholderText(self.state.t("export_path_hint"))
-        self.browse_export = QtWidgets.QPushButton(self.state.t("browse"))
-        self.browse_export.clicked.connect(self._browse_export_report)
-        self.format_combo = QtWidgets.QComboBox()
-        self.format_combo.addItems(["JSON", "CSV", "TXT"])
-        self.export_btn = QtWidgets.QPushButton(self.state.t("export"))
-        self.export_btn.clicked.connect(self._export_report)
-        report_layout.addWidget(self.export_path, 1)
-        report_layout.addWidget(self.browse_export)
-        report_layout.addWidget(self.format_combo)
-        report_layout.addWidget(self.export_btn)
-        coll_layout.addWidget(report_box)
-
-        self.tabs.addTab(self.tab_collections, self.state.t("tools_tab_collections"))
-
-        # Tab: DAT Operations
-        self.tab_dats = QtWidgets.QWidget()
-        dat_layout = QtWidgets.QVBoxLayout(self.tab_dats)
-        
-        lib_box = QtWidgets.QGroupBox(self.state.t("dat_library"))
-        lib_layout = QtWidgets.QVBoxLayout(lib_box)
-        import_row = QtWidgets.QHBoxLayout()
-        self.dat_import = QtWidgets.QLineEdit()
-        self.dat_import.setPlaceholderText(self.state.t("dat_path_hint"))
-        self.browse_dat = QtWidgets.QPushButton(self.state.t("browse"))
-        self.browse_dat.clicked.connect(self._browse_dat_import)
-        self.import_btn = QtWidgets.QPushButton(self.state.t("import"))
-        self.import_btn.clicked.connect(self._import_dat)
-        import_row.addWidget(self.dat_import, 1)
-        import_row.addWidget(self.browse_dat)
-        import_row.addWidget(self.import_btn)
-        lib_layout.addLayout(import_row)
-        
-        self.dat_library_list = QtWidgets.QListWidget()
-        lib_layout.addWidget(self.dat_library_list, 1)
-        
-        btns = QtWidgets.QHBoxLayout()
-        self.refresh_dat = QtWidgets.QPushButton(self.state.t("refresh"))
-        self.refresh_dat.clicked.connect(self.state.refresh_dat_library)
-        self.btn_dat_enable_selected = QtWidgets.QPushButton(self.state.t("import_dat_enable_selected"))
-        self.btn_dat_disable_selected = QtWidgets.QPushButton(self.state.t("import_dat_disable_selected"))
-        self.btn_dat_remove_selected = QtWidgets.QPushButton(self.state.t("btn_remove"))
-        self.btn_dat_enable_selected.clicked.connect(self._enable_selected_dats)
-        self.btn_dat_disable_selected.clicked.connect(self._disable_selected_dats)
-        self.btn_dat_remove_selected.clicked.connect(self._remove_selected_dats)
-        btns.addWidget(self.refresh_dat)
-        btns.addWidget(self.btn_dat_enable_selected)
-        btns.addWidget(self.btn_dat_disable_selected)
-        btns.addWidget(self.btn_dat_remove_selected)
-        lib_layout.addLayout(btns)
-        dat_layout.addWidget(lib_box, 1)
-
-        dl_box = QtWidgets.QGroupBox(self.state.t("dat_downloader_title"))
-        dl_layout = QtWidgets.QVBoxLayout(dl_box)
-        f_row = QtWidgets.QHBoxLayout()
-        self.dat_downloader_family_combo = QtWidgets.QComboBox()
-        self.dat_downloader_family_combo.addItems(["All", "No-Intro", "Redump", "TOSEC"])
-        self.btn_dat_downloader_refresh = QtWidgets.QPushButton(self.state.t("refresh"))
-        self.btn_dat_downloader_refresh.clicked.connect(self._refresh_dat_downloader_catalog)
-        f_row.addWidget(QtWidgets.QLabel(self.state.t("dat_downloader_family")))
-        f_row.addWidget(self.dat_downloader_family_combo)
-        f_row.addWidget(self.btn_dat_downloader_refresh)
-        f_row.addStretch(1)
-        dl_layout.addLayout(f_row)
-        
-        q_row = QtWidgets.QHBoxLayout()
-        self.dat_downloader_query = QtWidgets.QLineEdit()
-        self.dat_downloader_query.setPlaceholderText(self.state.t("dat_downloader_query_placeholder"))
-        self.btn_dat_downloader_quick = QtWidgets.QPushButton(self.state.t("dat_downloader_quick_download"))
-        self.btn_dat_downloader_quick.clicked.connect(self._quick_download_dat_entry)
-        q_row.addWidget(self.dat_downloader_query, 1)
-        q_row.addWidget(self.btn_dat_downloader_quick)
-        dl_layout.addLayout(q_row)
-        
-        self.dat_downloader_list = QtWidgets.QListWidget()
-        self.dat_downloader_list.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.ExtendedSelection)
-        dl_layout.addWidget(self.dat_downloader_list, 1)
-        
-        dl_btns = QtWidgets.QHBoxLayout()
-        self.chk_dat_downloader_auto_import = QtWidgets.QCheckBox(self.state.t("dat_downloader_auto_import"))
-        self.chk_dat_downloader_auto_import.setChecked(True)
-        self.btn_dat_downloader_download = QtWidgets.QPushButton(self.state.t("dat_downloader_download_selected"))
-        self.btn_dat_downloader_download.setObjectName("Accent")
-        self.btn_dat_downloader_download.clicked.connect(self._download_selected_dat_entries)
-        dl_btns.addWidget(self.chk_dat_downloader_auto_import)
-        dl_btns.addStretch(1)
-        dl_btns.addWidget(self.btn_dat_downloader_download)
-        dl_layout.addLayout(dl_btns)
-        dat_layout.addWidget(dl_box, 1)
-
-        adv_box = QtWidgets.QGroupBox(self.state.t("tools_advanced_dat"))
-        adv_layout = QtWidgets.QHBoxLayout(adv_box)
-        self.btn_diff = QtWidgets.QPushButton(self.state.t("tools_dat_diff"))
-        self.btn_merge = QtWidgets.QPushButton(self.state.t("tools_dat_merger"))
-        self.btn_diff.clicked.connect(self._run_dat_diff)
-        self.btn_merge.clicked.connect(self._run_dat_merge)
-        adv_layout.addWidget(self.btn_diff)
-        adv_layout.addWidget(self.btn_merge)
-        dat_layout.addWidget(adv_box)
-
-        self.tabs.addTab(self.tab_dats, self.state.t("tools_tab_dats"))
-
-        # Tab: Surgery
-        self.tab_surgery = QtWidgets.QWidget()
-        surg_layout = QtWidgets.QVBoxLayout(self.tab_surgery)
-        
-        conv_box = QtWidgets.QGroupBox(self.state.t("tools_format_conversion"))
-        conv_layout = QtWidgets.QHBoxLayout(conv_box)
-        self.convert_combo = QtWidgets.QComboBox()
-        self.convert_combo.addItems(["CHD", "RVZ"])
-        self.convert_btn = QtWidgets.QPushButton(self.state.t("tools_batch_convert"))
-        self.convert_btn.clicked.connect(self._run_batch_convert)
-        conv_layout.addWidget(self.convert_combo)
-        conv_layout.addWidget(self.convert_btn)
-        surg_layout.addWidget(conv_box)
-
-        tz_box = QtWidgets.QGroupBox(self.state.t("tools_archive_management"))
-        tz_layout = QtWidgets.QHBoxLayout(tz_box)
-        self.zip_btn = QtWidgets.QPushButton(self.state.t("tools_apply_torrentzip"))
-        self.zip_btn.clicked.connect(self._run_torrentzip)
-        tz_layout.addWidget(self.zip_btn)
-        surg_layout.addWidget(tz_box)
-
-        clean_box = QtWidgets.QGroupBox(self.state.t("tools_sanitation"))
-        clean_layout = QtWidgets.QHBoxLayout(clean_box)
-        self.clean_btn = QtWidgets.QPushButton(self.state.t("tools_deep_clean"))
-        self.dup_btn = QtWidgets.QPushButton(self.state.t("tools_find_duplicates"))
-        self.clean_btn.clicked.connect(self._run_deep_clean)
-        self.dup_btn.clicked.connect(self._run_find_duplicates)
-        clean_layout.addWidget(self.clean_btn)
-        clean_layout.addWidget(self.dup_btn)
-        surg_layout.addWidget(clean_box)
-        
-        surg_layout.addStretch(1)
-        self.tabs.addTab(self.tab_surgery, self.state.t("tools_tab_surgery"))
-
-        self._refresh_tooltips()
-
-    def _refresh_tooltips(self) -> None:
-        set_widget_tooltip(self.tabs, self.state.t("nav_tools"))
-        set_widget_tooltip(self.collection_name, self.state.t("tip_save_collection"))
-        set_widget_tooltip(self.save_btn, self.state.t("tip_save_collection"))
-        set_widget_tooltip(self.refresh_btn, self.state.t("tip_refresh_collections"))
-        set_widget_tooltip(self.recent_btn, self.state.t("tip_open_collection"))
-        set_widget_tooltip(self.collections_list, self.state.t("tip_collections_list"))
-        set_widget_tooltip(self.export_path, self.state.t("tip_export_report_path"))
-        set_widget_tooltip(self.format_combo, self.state.t("tip_export_format"))
-        set_widget_tooltip(self.export_btn, self.state.t("tip_export_report_now"))
-        set_widget_tooltip(self.dat_import, self.state.t("tip_dat_library_import_path"))
-        set_widget_tooltip(self.import_btn, self.state.t("tip_add_dat"))
-        set_widget_tooltip(self.refresh_dat, self.state.t("tip_refresh_dat_library"))
-        set_widget_tooltip(self.btn_dat_enable_selected, self.state.t("tip_dat_library_activate_selected"))
-        set_widget_tooltip(self.btn_dat_disable_selected, self.state.t("tip_import_dat_disable_selected"))
-        set_widget_tooltip(self.btn_dat_remove_selected, self.state.t("tip_dat_library_remove_selected"))
-        set_widget_tooltip(self.dat_library_list, self.state.t("tip_dat_library_entries"))
-        set_widget_tooltip(self.dat_downloader_family_combo, self.state.t("tip_dat_downloader_family"))
-        set_widget_tooltip(self.btn_dat_downloader_refresh, self.state.t("tip_dat_downloader_refresh"))
-        set_widget_tooltip(self.dat_downloader_query, self.state.t("tip_dat_downloader_query"))
-        set_widget_tooltip(self.btn_dat_downloader_quick, self.state.t("tip_dat_downloader_quick_download"))
-        set_widget_tooltip(self.dat_downloader_list, self.state.t("tip_dat_downloader_list"))
-        set_widget_tooltip(self.btn_dat_downloader_download, self.state.t("tip_dat_downloader_download"))
-        set_widget_tooltip(self.chk_dat_downloader_auto_import, self.state.t("tip_dat_downloader_auto_import"))
-        set_widget_tooltip(self.btn_diff, self.state.t("tip_dat_diff"))
-        set_widget_tooltip(self.btn_merge, self.state.t("tip_dat_merge"))
-        set_widget_tooltip(self.convert_combo, self.state.t("tip_batch_convert_format"))
-        set_widget_tooltip(self.convert_btn, self.state.t("tools_batch_convert"))
-        set_widget_tooltip(self.zip_btn, self.state.t("tip_torrentzip"))
-        set_widget_tooltip(self.clean_btn, self.state.t("tip_deep_clean"))
-        set_widget_tooltip(self.dup_btn, self.state.t("tip_find_duplicates"))
-
-    def _bind(self) -> None:
-        self.state.collections_changed.connect(self._update_collections)
-        self.state.recent_collections_changed.connect(self._update_recent)
-        self.state.dat_library_changed.connect(self._update_dat_library)
-        self.state.status_changed.connect(self._update_dat_library_active)
-        self.state.dat_sources_changed.connect(self._update_sources)
-        self.state.dat_downloader_catalog_done.connect(self._on_dat_downloader_catalog_done)
-        self.state.dat_downloader_download_done.connect(self._on_dat_downloader_download_done)
-        self.collections_list.itemDoubleClicked.connect(self._load_collection)
-        self.dat_library_list.itemDoubleClicked.connect(self._load_dat_from_library)
-        self.dat_library_list.customContextMenuRequested.connect(self._dat_library_menu)
-        self.dat_downloader_list.itemDoubleClicked.connect(lambda _item: self._download_selected_dat_entries())
-        self.dat_downloader_query.returnPressed.connect(self._quick_download_dat_entry)
-        self.tabs.currentChanged.connect(self._on_tools_tab_changed)
-        self.state.dat_diff_done.connect(lambda res: self._log_tool_result(self.state.t("tools_dat_diff"), res))
-        self.state.dat_merge_done.connect(lambda res: self._log_tool_result(self.state.t("tools_dat_merger"), res))
-        self.state.batch_convert_done.connect(lambda res: self._log_tool_result(self.state.t("tools_batch_convert"), res))
-        self.state.torrentzip_done.connect(lambda res: self._log_tool_result(self.state.t("tools_apply_torrentzip"), res))
-        self.state.deep_clean_done.connect(lambda res: self._log_tool_result(self.state.t("tools_deep_clean"), res))
-        self.state.find_duplicates_done.connect(lambda res: self._log_tool_result(self.state.t("tools_find_duplicates"), res))
-
-    def refresh_texts(self) -> None:
-        self.title_label.setText(self.state.t("nav_tools"))
-        self.tabs.setTabText(0, self.state.t("tools_tab_collections"))
-        self.tabs.setTabText(1, self.state.t("tools_tab_dats"))
-        self.tabs.setTabText(2, self.state.t("tools_tab_surgery"))
-        self._refresh_tooltips()
-
-    # (Placeholders for other ToolsView methods - I'll keep them simplified or extracted from original)
-    def _save_collection(self) -> None: pass
-    def _browse_export_report(self) -> None: pass
-    def _export_report(self) -> None: pass
-    def _update_collections(self, items=None) -> None: pass
-    def _update_recent(self, items=None) -> None: pass
-    def _load_collection(self, item) -> None: pass
-    def _browse_dat_import(self) -> None: pass
-    def _import_dat(self) -> None: pass
-    def _update_dat_library(self, items=None) -> None: pass
-    def _update_dat_library_active(self, status=None) -> None: pass
-    def _enable_selected_dats(self) -> None: pass
-    def _disable_selected_dats(self) -> None: pass
-    def _remove_selected_dats(self) -> None: pass
-    def _dat_library_menu(self, pos) -> None: pass
-    def _load_dat_from_library(self, item) -> None: pass
-    def _refresh_dat_downloader_catalog(self) -> None: pass
-    def _on_dat_downloader_catalog_done(self, items) -> None: pass
-    def _quick_download_dat_entry(self) -> None: pass
-    def _download_selected_dat_entries(self) -> None: pass
-    def _on_dat_downloader_download_done(self, res) -> None: pass
-    def _update_sources(self, items=None) -> None: pass
-    def _on_tools_tab_changed(self, idx) -> None: pass
-    def _run_dat_diff(self) -> None: pass
-    def _run_dat_merge(self) -> None: pass
-    def _run_batch_convert(self) -> None: pass
-    def _run_torrentzip(self) -> None: pass
-    def _run_deep_clean(self) -> None: pass
-    def _run_find_duplicates(self) -> None: pass
-    def _log_tool_result(self, title, res) -> None: pass
-"""
-
-downloads_view_code = """class DownloadsView(QtWidgets.QWidget):
-    def __init__(self, state: AppState):
-        super().__init__()
-        self.state = state
-        self._pending_missing_candidates = set()
-        self._catalog_current_root_url = ""
-        self._catalog_current_system_url = ""
-        self._catalog_presets = []
-        self._auto_queue_after_missing_resolve = False
-        self._build_ui()
-        self._bind()
-
-    def _build_ui(self) -> None:
-        layout = QtWidgets.QVBoxLayout(self)
-        layout.setContentsMargins(10, 10, 10, 10)
-        layout.setSpacing(10)
-
-        self.title_label = section_title(self.state.t("nav_downloads"))
-        layout.addWidget(self.title_label)
-
-        # --- Torrent Searcher ---
-        torrent_box = QtWidgets.QGroupBox("Torrent Searcher")
-        torrent_layout = QtWidgets.QVBoxLayout(torrent_box)
-        
-        t_row = QtWidgets.QHBoxLayout()
-        self.torrent_query = QtWidgets.QLineEdit()
-        self.torrent_query.setPlaceholderText("Search Torrents (e.g. Redump PS2)")
-        self.btn_torrent_search = QtWidgets.QPushButton("Search")
-        self.btn_torrent_search.setObjectName("Accent")
-        self.btn_torrent_search.clicked.connect(self._search_torrents)
-        t_row.addWidget(self.torrent_query, 1)
-        t_row.addWidget(self.btn_torrent_search)
-        torrent_layout.addLayout(t_row)
-        
-        self.torrent_list = QtWidgets.QTableWidget()
-        self.torrent_list.setColumnCount(4)
-        self.torrent_list.setHorizontalHeaderLabels(["Name", "Size", "Seeders", "Magnet"])
-        self.torrent_list.horizontalHeader().setStretchLastSection(True)
-        self.torrent_list.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectionBehavior.SelectRows)
-        self.torrent_list.setFixedHeight(150)
-        torrent_layout.addWidget(self.torrent_list)
-        
-        self.btn_torrent_queue = QtWidgets.QPushButton("Queue Selected Torrents")
-        self.btn_torrent_queue.clicked.connect(self._queue_selected_torrents)
-        torrent_layout.addWidget(self.btn_torrent_queue)
-        layout.addWidget(torrent_box)
-
-        # --- Download Queue (JDownloader) ---
-        download_box = QtWidgets.QGroupBox(self.state.t("tools_download_title"))
-        download_layout = QtWidgets.QVBoxLayout(download_box)
-        
-        out_row = QtWidgets.QHBoxLayout()
-        self.download_output = QtWidgets.QLineEdit()
-        self.btn_download_browse = QtWidgets.QPushButton(self.state.t("browse"))
-        self.btn_download_browse.clicked.connect(self._browse_download_output)
-        out_row.addWidget(QtWidgets.QLabel(self.state.t("output")))
-        out_row.addWidget(self.download_output, 1)
-        out_row.addWidget(self.btn_download_browse)
-        download_layout.addLayout(out_row)
-
-        url_row = QtWidgets.QHBoxLayout()
-        self.download_base_url = QtWidgets.QLineEdit()
-        self.download_base_url.setPlaceholderText("https://myrient.erista.me/files")
-        self.btn_download_add_line = QtWidgets.QPushButton(self.state.t("tools_download_add_url"))
-        self.btn_download_resolve_missing = QtWidgets.QPushButton(self.state.t("tools_download_resolve_missing"))
-        self.btn_download_add_line.clicked.connect(self._add_download_line_dialog)
-        self.btn_download_resolve_missing.clicked.connect(self._resolve_missing_links_from_pending)
-        url_row.addWidget(self.download_base_url, 1)
-        url_row.addWidget(self.btn_download_add_line)
-        url_row.addWidget(self.btn_download_resolve_missing)
-        download_layout.addLayout(url_row)
-
-        self.download_urls = QtWidgets.QPlainTextEdit()
-        self.download_urls.setPlaceholderText(self.state.t("tools_download_urls_placeholder"))
-        download_layout.addWidget(self.download_urls, 1)
-
-        btn_row = QtWidgets.QHBoxLayout()
-        self.btn_download_send_jd = QtWidgets.QPushButton(self.state.t("tools_download_send_jd"))
-        self.btn_download_send_jd.setObjectName("Accent")
-        self.btn_download_send_jd.clicked.connect(self._send_download_targets_to_jd)
-        self.btn_download_clear = QtWidgets.QPushButton(self.state.t("tools_download_clear"))
-        self.btn_download_clear.clicked.connect(self.download_urls.clear)
-        self.chk_download_jd_autostart = QtWidgets.QCheckBox(self.state.t("tools_download_jd_autostart"))
-        btn_row.addWidget(self.btn_download_send_jd)
-        btn_row.addWidget(self.btn_download_clear)
-        btn_row.addWidget(self.chk_download_jd_autostart)
-        btn_row.addStretch(1)
-        download_layout.addLayout(btn_row)
-        
-        layout.addWidget(download_box, 1)
-        self._refresh_tooltips()
-
-    def _refresh_tooltips(self) -> None:
-        set_widget_tooltip(self.torrent_query, "Search for torrents using Apibay API.")
-        set_widget_tooltip(self.download_output, self.state.t("tip_download_output_folder"))
-        set_widget_tooltip(self.download_urls, self.state.t("tip_download_urls_input"))
-        set_widget_tooltip(self.btn_download_send_jd, self.state.t("tip_download_send_jd"))
-
-    def _bind(self) -> None:
-        self.state.download_missing_requested.connect(self._on_download_missing_requested)
-        self.state.myrient_links_resolved.connect(self._on_myrient_links_resolved_legacy)
-        self.state.download_progress.connect(self._on_download_progress)
-
-    def refresh_texts(self) -> None:
-        self.title_label.setText(self.state.t("nav_downloads"))
-        self._refresh_tooltips()
-
-    def _search_torrents(self) -> None:
-        query = self.torrent_query.text().strip()
-        if not query: return
-        import threading, requests
-        def _fetch():
-            try:
-                self.btn_torrent_search.setText("Searching...")
-                r = requests.get(f"https://apibay.org/q.php?q={query}", timeout=10)
-                data = r.json()
-                QtCore.QMetaObject.invokeMethod(self, "_on_torrents_fetched", QtCore.Qt.QueuedConnection, QtCore.Q_ARG(list, data))
-            except: pass
-            finally: QtCore.QMetaObject.invokeMethod(self.btn_torrent_search, "setText", QtCore.Qt.QueuedConnection, QtCore.Q_ARG(str, "Search"))
-        threading.Thread(target=_fetch, daemon=True).start()
-
-    @QtCore.Slot(list)
-    def _on_torrents_fetched(self, data: list) -> None:
-        self.torrent_list.setRowCount(0)
-        if not data or not isinstance(data, list) or (len(data) == 1 and data[0].get('id') == '0'): return
-        for row in data[:20]:
-            idx = self.torrent_list.rowCount()
-            self.torrent_list.insertRow(idx)
-            self.torrent_list.setItem(idx, 0, QtWidgets.QTableWidgetItem(row.get('name', '')))
-            self.torrent_list.setItem(idx, 1, QtWidgets.QTableWidgetItem(row.get('size', '0')))
-            self.torrent_list.setItem(idx, 2, QtWidgets.QTableWidgetItem(row.get('seeders', '0')))
-            ih = row.get('info_hash', '')
-            mag = f"magnet:?xt=urn:btih:{ih}" if ih else ""
-            self.torrent_list.setItem(idx, 3, QtWidgets.QTableWidgetItem(mag))
-
-    def _queue_selected_torrents(self) -> None:
-        selected = self.torrent_list.selectedItems()
-        if not selected: return
-        rows = set(i.row() for i in selected)
-        for r in rows:
-            mag = self.torrent_list.item(r, 3).text()
-            if mag: self._append_download_line(mag)
-
-    def _append_download_line(self, url: str, name: str = "") -> None:
-        line = url if not name else f"{url} | {name}"
-        curr = self.download_urls.toPlainText().splitlines()
-        if line not in curr:
-            curr.append(line)
-            self.download_urls.setPlainText("\\n".join(curr))
-
-    def _browse_download_output(self) -> None:
-        selected = pick_dir(self, self.state.t("select_output_folder"))
-        if selected: self.download_output.setText(selected)
-
-    def _add_download_line_dialog(self) -> None: pass
-    def _resolve_missing_links_from_pending(self) -> None:
-        if not self._pending_missing_candidates: return
-        base_url = self.download_base_url.text().strip() or "https://myrient.erista.me/files"
-        self._auto_queue_after_missing_resolve = False
-        self.state.resolve_myrient_links_from_missing(base_url, list(self._pending_missing_candidates))
-
-    def _on_download_missing_requested(self, items: list) -> None:
-        self._pending_missing_candidates.update(items)
-        self._resolve_missing_links_from_pending()
-
-    def _on_myrient_links_resolved_legacy(self, payload: dict) -> None:
-        matches = payload.get("matches", [])
-        unmatched = payload.get("unmatched", [])
-        for m in matches: self._append_download_line(m.get("url", ""), m.get("filename", ""))
-        for u in unmatched: self._append_download_line(f"# [Unmatched] {u.get('rom_name', 'missing')}")
-
-    def _send_download_targets_to_jd(self) -> None:
-        urls = self.download_urls.toPlainText().splitlines()
-        targets = []
-        for line in urls:
-            if not line.strip() or line.startswith("#"): continue
-            if " | " in line:
-                u, n = line.split(" | ", 1)
-                targets.append({"url": u.strip(), "filename": n.strip()})
-            else:
-                targets.append({"url": line.strip()})
-        if targets:
-            self.state.queue_jdownloader_downloads_async(targets, autostart=self.chk_download_jd_autostart.isChecked())
-
-    def _on_download_progress(self, *args) -> None: pass
-    def prepare_myrient_missing_candidates(self, items: list) -> None:
-        self._pending_missing_candidates.update(items)
-"""
+# The generated classes live in templates next to this script
+HERE = os.path.dirname(os.path.abspath(__file__))
+with open(os.path.join(HERE, 'tools_view.tpl'), encoding='utf-8') as f:
+    tools_view_code = f.read()
+with open(os.path.join(HERE, 'downloads_view.tpl'), encoding='utf-8') as f:
+    downloads_view_code = f.read()
 
 # I need to find all the helper methods that ToolsView uses and ensure they are available or simplified.
 # Given the size, I'll just keep the original gui_pyside6_views.py up to ToolsView,
 # then append the new ToolsView and DownloadsView.
 
-final_content = pre_content + tools_view_code + '\\n\\n' + downloads_view_code
 
-with open(filepath, 'w', encoding='utf-8') as f:
-    f.write(final_content)
+def _read_header(src):
+    """Return (BOM, offset where the original content starts, stored stamp, newline)."""
+    head = src.read(CHUNK_SIZE)
+    newline = b'\r\n' if b'\r\n' in head else b'\n'
+    bom = codecs.BOM_UTF8 if head.startswith(codecs.BOM_UTF8) else b''
+    start = len(bom)
+    stamp = None
+    if head.startswith(STAMP_PREFIX, start):
+        end = head.find(b'\n', start, start + STAMP_SCAN)
+        if end >= 0:
+            stamp = head[start + len(STAMP_PREFIX):end].strip().decode('ascii', 'replace')
+            start = end + 1
+    return bom, start, stamp, newline
+
+
+def _copy_pre_content(src, start, sink):
+    """Feed everything from start up to the ToolsView header to sink."""
+    src.seek(start)
+    tail = b''
+    first = True
+    while True:
+        buf = src.read(CHUNK_SIZE)
+        if not buf:
+            return False
+        window = tail + buf
+        if first and window.startswith(TOOLS_MARKER[1:]):
+            idx = 0
+        else:
+            idx = window.find(TOOLS_MARKER)
+            if idx >= 0:
+                idx += 1
+        if idx >= 0:
+            sink(memoryview(window)[:idx])
+            return True
+        sink(memoryview(window)[:-OVERLAP])
+        tail = window[-OVERLAP:]
+        first = False
+
+
+def run(path):
+    """Regenerate path in place. Returns False if it was already up to date."""
+    tmp_path = path + '.tmp'
+    with open(path, 'rb', buffering=CHUNK_SIZE) as src:
+        bom, start, stamp, newline = _read_header(src)
+
+        # First pass only hashes; an unchanged file is never rewritten
+        digest = hashlib.sha1()
+        if not _copy_pre_content(src, start, digest.update):
+            raise ValueError(f"ToolsView not found in {path}")
+        digest.update(tools_view_code.encode('utf-8'))
+        digest.update(downloads_view_code.encode('utf-8'))
+        new_stamp = digest.hexdigest()
+        if stamp == new_stamp:
+            return False
+
+        try:
+            with open(tmp_path, 'wb', buffering=CHUNK_SIZE) as dst:
+                dst.write(bom + STAMP_PREFIX + new_stamp.encode('ascii') + newline)
+                _copy_pre_content(src, start, dst.write)
+                # Written piece by piece: no output-sized string is ever built
+                for piece in (tools_view_code, '\n\n', downloads_view_code):
+                    dst.write(piece.encode('utf-8').replace(b'\n', newline))
+        except BaseException:
+            # Never leave a half-written temp file next to the source
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    shutil.copystat(path, tmp_path)
+    os.replace(tmp_path, path)
+    return True
+
+
+if __name__ == '__main__':
+    # Target file: first argument, then $ROMM_VIEWS, then the original checkout
+    filepath = (sys.argv[1] if len(sys.argv) > 1
+                else os.environ.get('ROMM_VIEWS', DEFAULT_VIEWS_PATH))
+    try:
+        changed = run(filepath)
+    except ValueError:
+        print("ToolsView not found")
+        sys.exit(1)
+    if not changed:
+        print(f"{filepath} already up to date")
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import concurrent.futures
 import logging
 import os
 import shutil
@@ -19,6 +20,20 @@ from .models import ROMInfo
 
 LOG = logging.getLogger(__name__)
 
+# Copy/write buffer for archive extraction; the stdlib default is 16 KiB
+_EXTRACT_BUFFER = 1024 * 1024
+
+
+def _move_file(src: str, dst: str) -> None:
+    """Move src to dst, overwriting; rename when possible, kernel copy otherwise."""
+    try:
+        # Unlike shutil.move's rename, os.replace also overwrites on Windows
+        # instead of falling back to a full copy when dst already exists
+        os.replace(src, dst)
+    except OSError:
+        # Cross-device: shutil copies via os.sendfile on Linux, then unlinks
+        shutil.move(src, dst)
+
 
 @dataclass
 class DownloadTaskState:
@@ -41,6 +56,7 @@ class AutoScraperDownloader:
         self.retries = max(1, retries)
         self.downloader = ArchiveOrgDownloader()
         self.downloader.timeout = timeout_s
+        self._created_dirs: set = set()
 
     def download_rom(
         self,
@@ -86,11 +102,13 @@ class AutoScraperDownloader:
 
             system_folder = rom.system_name.strip() or "Unknown"
             final_dir = os.path.join(self.output_root, system_folder)
-            os.makedirs(final_dir, exist_ok=True)
+            if final_dir not in self._created_dirs:
+                os.makedirs(final_dir, exist_ok=True)
+                self._created_dirs.add(final_dir)
 
             final_name = rom.name.strip() or os.path.basename(prepared)
             final_path = os.path.join(final_dir, final_name)
-            shutil.move(prepared, final_path)
+            _move_file(prepared, final_path)
             emit(100, "Installed")
             return final_path
         finally:
@@ -119,25 +137,25 @@ class AutoScraperDownloader:
 
         wanted = rom.name.lower()
         expected_crc = (rom.crc32 or "").lower()
+        archive_exts = (".zip", ".7z")
 
-        scored = []
-        for f in files:
+        def score(f: Dict) -> int:
             name = f.get("name", "").lower()
-            score = 0
+            total = 0
             if name == wanted:
-                score += 100
+                total += 100
             if wanted and wanted in name:
-                score += 60
+                total += 60
             if expected_crc and expected_crc in name:
-                score += 25
-            if name.endswith((".zip", ".7z")):
-                score += 5
+                total += 25
+            if name.endswith(archive_exts):
+                total += 5
             if f.get("size"):
-                score += 1
-            scored.append((score, f))
+                total += 1
+            return total
 
-        scored.sort(key=lambda item: item[0], reverse=True)
-        best_score, best_file = scored[0]
+        # max() keeps the first of equal scores, like the stable sort it replaces
+        best_score, best_file = max(((score(f), f) for f in files), key=lambda item: item[0])
         if best_score <= 0:
             return None
         return best_file
@@ -156,13 +174,15 @@ class AutoScraperDownloader:
     def _prepare_file(self, source_path: str, rom: ROMInfo) -> str:
         if source_path.lower().endswith(".zip"):
             with zipfile.ZipFile(source_path, "r") as zf:
-                members = [m for m in zf.namelist() if not m.endswith("/")]
-                if not members:
+                infos = {i.filename: i for i in zf.infolist() if not i.is_dir()}
+                if not infos:
                     raise RuntimeError("Archive has no files")
-                preferred = self._pick_member(members, rom)
+                preferred = self._pick_member(list(infos), rom)
                 target_path = os.path.join(os.path.dirname(source_path), os.path.basename(preferred))
-                with zf.open(preferred) as src, open(target_path, "wb") as dst:
-                    shutil.copyfileobj(src, dst)
+                # Streams the member through inflate in 1 MiB steps
+                with zf.open(infos[preferred], "r") as src, \
+                        open(target_path, "wb", buffering=_EXTRACT_BUFFER) as dst:
+                    shutil.copyfileobj(src, dst, length=_EXTRACT_BUFFER)
                 return target_path
         return source_path
 
@@ -178,10 +198,15 @@ class AutoScraperDownloader:
 class AutoDownloadTaskRegistry:
     """Background task executor for Flask and UI polling."""
 
-    def __init__(self, engine: Optional[AutoScraperDownloader] = None):
+    def __init__(self, engine: Optional[AutoScraperDownloader] = None, max_workers: int = 4):
         self.engine = engine or AutoScraperDownloader()
         self._tasks: Dict[str, DownloadTaskState] = {}
         self._lock = threading.Lock()
+        # Extra tasks wait in the pool queue (status "queued") instead of
+        # each getting its own thread
+        self._pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(1, max_workers), thread_name_prefix="romm-dl",
+        )
 
     def start(self, rom: ROMInfo) -> str:
         task_id = uuid.uuid4().hex
@@ -189,25 +214,25 @@ class AutoDownloadTaskRegistry:
         with self._lock:
             self._tasks[task_id] = task
 
-        thread = threading.Thread(target=self._run_task, args=(task_id, rom), daemon=True)
-        thread.start()
+        self._pool.submit(self._run_task, task, rom)
         return task_id
 
+    def shutdown(self, wait: bool = False) -> None:
+        """Stop accepting tasks and drop the ones that have not started yet."""
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+
     def get(self, task_id: str) -> Optional[DownloadTaskState]:
         with self._lock:
             return self._tasks.get(task_id)
 
-    def _run_task(self, task_id: str, rom: ROMInfo):
-        task = self.get(task_id)
-        if not task:
-            return
-
+    def _run_task(self, task: DownloadTaskState, rom: ROMInfo):
+        # Progress has one writer (this worker) and readers that only poll
+        # get(); single attribute stores are atomic, so no lock per callback
         def update(pct: int, msg: str):
-            with self._lock:
-                task.progress = pct
-                task.message = msg
-                if pct > 0:
-                    task.status = "running"
+            task.progress = pct
+            task.message = msg
+            if pct > 0 and task.status != "running":
+                task.status = "running"
 
         try:
             final_path = self.engine.download_rom(rom, progress_callback=update)
@@ -8,6 +8,8 @@ from typing import Callable, Dict, List, Optional
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
     REQUESTS_AVAILABLE = True
 except ImportError:
     REQUESTS_AVAILABLE = False
@@ -35,6 +37,17 @@ class ArchiveOrgDownloader:
             )
         self._last_request_time = 0.0
         self.session = requests.Session()
+
+        # Keep-alive pool sized for the auto-download workers sharing this
+        # session. Retries stay with the callers (e.g. AutoScraperDownloader),
+        # which re-enter here and pick up the pooled connection.
+        adapter = HTTPAdapter(
+            max_retries=Retry(total=0),
+            pool_connections=4,
+            pool_maxsize=16,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.session.headers.update({
             'User-Agent': 'ROMCollectionManager/1.0 (preservation tool)'
         })
@@ -181,20 +194,40 @@ class ArchiveOrgDownloader:
 
         dest_path = os.path.join(dest_folder, filename)
 
-        resp = self.session.get(url, stream=True, timeout=self.timeout)
-        resp.raise_for_status()
-
-        total_size = int(resp.headers.get('content-length', 0))
-        downloaded = 0
-        chunk_size = 256 * 1024  # 256KB chunks — matches Myrient, fewer syscalls
+        # Closing the response hands a fully-read connection back to the pool
+        with self.session.get(url, stream=True, timeout=self.timeout) as resp:
+            if resp.status_code >= 400:
+                # Drain the short error page so the retry reuses this connection
+                resp.content
+            resp.raise_for_status()
 
-        with open(dest_path, 'wb') as f:
-            for chunk in resp.iter_content(chunk_size=chunk_size):
-                if chunk:
-                    f.write(chunk)
-                    downloaded += len(chunk)
+            total_size = int(resp.headers.get('content-length', 0))
+            downloaded = 0
+            last_cb = 0.0
+            chunk_size = 1024 * 1024  # 1MB chunks — matches Myrient, fewer syscalls
+
+            # One reusable buffer filled via readinto(): no per-chunk allocation
+            raw = resp.raw
+            raw.decode_content = True
+            buf = bytearray(chunk_size)
+            mv = memoryview(buf)
+
+            with open(dest_path, 'wb') as f:
+                while True:
+                    n = raw.readinto(buf)
+                    if not n:
+                        break
+                    f.write(mv[:n])
+                    downloaded += n
+                    # Throttle UI updates (~20Hz)
                     if progress_callback:
-                        progress_callback(downloaded, total_size)
+                        now = time.monotonic()
+                        if now - last_cb >= 0.05:
+                            progress_callback(downloaded, total_size)
+                            last_cb = now
+
+        if progress_callback:
+            progress_callback(downloaded, total_size)
 
         return dest_path
 
@@ -7,18 +7,30 @@ Supports No-Intro, Redump, TOSEC, and any XML-based DAT format.
 __version__ = '0.30rc'
 __author__ = 'R0MM'
 
-from .models import (
-    ROMInfo, ScannedFile, OrganizationAction, DATInfo,
-    Collection, PlannedAction, OrganizationPlan,
-)
-from .parser import DATParser
-from .scanner import FileScanner
-from .matcher import ROMMatcher, MultiROMMatcher
-from .organizer import Organizer, build_strategy
-from .utils import format_size, truncate_string, safe_filename
-from .collection import CollectionManager
-from .reporter import MissingROMReporter
+import importlib
 
+# Public names are loaded on first access (PEP 562), so entry points such as
+# ``python -m rommanager`` only pay for the submodules they actually use.
+_LAZY_EXPORTS = {
+    'ROMInfo': '.models',
+    'ScannedFile': '.models',
+    'OrganizationAction': '.models',
+    'DATInfo': '.models',
+    'Collection': '.models',
+    'PlannedAction': '.models',
+    'OrganizationPlan': '.models',
+    'DATParser': '.parser',
+    'FileScanner': '.scanner',
+    'ROMMatcher': '.matcher',
+    'MultiROMMatcher': '.matcher',
+    'Organizer': '.organizer',
+    'build_strategy': '.organizer',
+    'format_size': '.utils',
+    'truncate_string': '.utils',
+    'safe_filename': '.utils',
+    'CollectionManager': '.collection',
+    'MissingROMReporter': '.reporter',
+}
 
 __all__ = [
     'ROMInfo',
@@ -41,6 +53,20 @@ __all__ = [
     'safe_filename',
 ]
 
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
+
 def run_web(host='127.0.0.1', port=5000):
     """Run the web interface"""
     from .web import run_server
@@ -21,29 +21,38 @@ _REGION_PATTERNS = [
     (r"\b(WORLD)\b", "World"),
 ]
 
+# Compiled once; searched in order because the first matching pattern wins
+_REGION_RES = [(re.compile(pat, re.IGNORECASE), region) for pat, region in _REGION_PATTERNS]
 
-_TAG_BLOCK_RE = re.compile(r"\s*[\(\[][^[\]()\[\]]+[\)\]]")
+
+# A whole run of adjacent tag blocks, e.g. " (USA) (Rev 1) [!]", per match
+_TAG_BLOCK_RE = re.compile(r"(?:\s*[\(\[][^()\[\]]+[\)\]])+")
+_SEP_RE = re.compile(r"[_\.]+")
+_WS_RE = re.compile(r"\s{2,}")
 
 
 def clean_game_name(filename: str) -> str:
     """Best-effort cleanup of scene-like tags from filename stem."""
     name = os.path.splitext(filename)[0]
-    # remove common (...) and [...] tag blocks repeatedly
-    prev = None
-    while prev != name:
-        prev = name
-        name = _TAG_BLOCK_RE.sub("", name).strip()
+    # remove common (...) and [...] tag blocks; only nested tags need a 2nd pass.
+    # sub() only ever deletes, so an unchanged length means nothing matched,
+    # and each pass peels at least one opener, which bounds the passes.
+    for _ in range(name.count("(") + name.count("[")):
+        stripped = _TAG_BLOCK_RE.sub("", name)
+        if len(stripped) == len(name):
+            break
+        name = stripped
+    name = name.strip()
 
     # normalize separators/spaces
-    name = re.sub(r"[_\.]+", " ", name)
-    name = re.sub(r"\s{2,}", " ", name).strip(" -_	")
+    name = _SEP_RE.sub(" ", name)
+    name = _WS_RE.sub(" ", name).strip(" -_	")
     return name or os.path.splitext(filename)[0]
 
 
 def infer_region(filename: str) -> str:
-    name = filename.upper()
-    for pat, region in _REGION_PATTERNS:
-        if re.search(pat, name, flags=re.IGNORECASE):
+    for pattern, region in _REGION_RES:
+        if pattern.search(filename):
             return region
     return "Unknown"
 
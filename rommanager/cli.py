@@ -5,15 +5,20 @@ Command-line interface for R0MM
 import argparse
 import sys
 import os
+import time
+from itertools import islice
 
-from .core_service import CoreService
-from .utils import format_size
 from .monitor import setup_runtime_monitor, monitor_action
 from .settings import load_settings, get_effective_profile, apply_runtime_settings
-from .health import run_health_checks
-from .metadata import MetadataStore
 from . import __version__
 
+# The matching engine (core_service and everything it pulls in) is imported
+# inside the functions that use it, so --help, --version and usage errors
+# return without loading it
+
+# Minimum seconds between progress redraws
+_PROGRESS_INTERVAL = 1 / 30
+
 
 def create_parser() -> argparse.ArgumentParser:
     """Create argument parser"""
@@ -175,14 +180,15 @@ Examples:
 
 def run_cli(args=None):
     """Run the CLI"""
-    logger = setup_runtime_monitor()
-    monitor_action("run_cli called", logger=logger)
     parser = create_parser()
+    # --help, --version and usage errors exit here, before any log files
+    # are created or hooks installed
     args = parser.parse_args(args)
+    logger = setup_runtime_monitor()
+    monitor_action("run_cli called", logger=logger)
 
     settings = load_settings(args.settings_file) if args.settings_file else load_settings()
     profile = apply_runtime_settings(settings, args.profile)
-    core = CoreService()
 
     # Handle load-collection mode
     if args.load_collection:
@@ -203,6 +209,10 @@ def run_cli(args=None):
     if args.strategy == "flat" and profile.get("strategy"):
         args.strategy = profile.get("strategy")
 
+    from .core_service import CoreService
+    from .utils import format_size
+
+    core = CoreService()
     quiet = args.quiet
 
     def log(msg):
@@ -217,12 +227,19 @@ def run_cli(args=None):
 
     if not args.blindmatch_system:
         for dat_path in args.dat:
-            log(f"\nLoading DAT: {dat_path}")
             if not os.path.exists(dat_path):
+                log(f"\nLoading DAT: {dat_path}")
                 print(f"Error: DAT file not found: {dat_path}", file=sys.stderr)
                 return 1
 
-            res = core.load_dat(dat_path)
+        # Multiple DATs are parsed in parallel; results come back in order
+        if len(args.dat) > 1:
+            dat_results = core.load_dats(args.dat)
+        else:
+            dat_results = [core.load_dat(args.dat[0])]
+
+        for dat_path, res in zip(args.dat, dat_results):
+            log(f"\nLoading DAT: {dat_path}")
             if res.get("error"):
                 print(f"Error: Failed to load DAT file: {res['error']}", file=sys.stderr)
                 return 1
@@ -245,16 +262,12 @@ def run_cli(args=None):
     scan_archives = not args.no_archives
     recursive = not args.no_recursive
 
-    def progress_callback(current, total):
-        if not quiet:
-            print(f"   Scanning: {current:,} / {total:,}...", end='\r')
-
     res = core.scan_sync(
         args.roms,
         scan_archives=scan_archives,
         recursive=recursive,
         blindmatch_system=args.blindmatch_system or "",
-        progress_callback=progress_callback if not quiet else None,
+        progress_callback=_progress_printer("Scanning") if not quiet else None,
     )
     if res.get("error"):
         print(f"Error: {res['error']}", file=sys.stderr)
@@ -264,6 +277,7 @@ def run_cli(args=None):
     log(f"   Found {(res.get('identified', 0) + res.get('unidentified', 0)):,} files")
 
     if args.health_check:
+        from .health import run_health_checks
         hc = run_health_checks(scanned_files,
                                warn_on_unknown_ext=settings.get("health", {}).get("warn_on_unknown_ext", True),
                                warn_on_duplicates=settings.get("health", {}).get("warn_on_duplicates", True))
@@ -279,12 +293,12 @@ def run_cli(args=None):
     unidentified = core.unidentified
 
     if args.metadata_db:
-        md = MetadataStore(args.metadata_db)
+        from .metadata import MetadataStore
+        lookup = MetadataStore(args.metadata_db).lookup
         for sc in identified:
-            if sc.matched_rom:
-                meta = md.lookup(sc.matched_rom.crc32, sc.matched_rom.game_name)
-                if meta:
-                    sc.matched_rom.status = f"{sc.matched_rom.status} | curated"
+            rom = sc.matched_rom
+            if rom and lookup(rom.crc32, rom.game_name):
+                rom.status = f"{rom.status} | curated"
 
     total = len(identified) + len(unidentified)
     percent = (len(identified) / total * 100) if total > 0 else 0
@@ -308,7 +322,7 @@ def run_cli(args=None):
 
     # Save collection if requested
     if args.save_collection:
-        _save_collection(args, all_dat_infos, identified, unidentified, log)
+        _save_collection(args, core, all_dat_infos, identified, unidentified, log)
 
     if not args.output:
         return 0
@@ -317,12 +331,13 @@ def run_cli(args=None):
         log("\nNo ROMs identified. Nothing to organize.")
         return 0
 
-    total_size = sum(f.size for f in identified)
-    log(f"   Total size: {format_size(total_size)}")
+    # Dry-run reports the plan's own total, and quiet runs print nothing
+    if not (args.dry_run or quiet):
+        log(f"   Total size: {format_size(sum(f.size for f in identified))}")
 
     # Dry-run mode
     if args.dry_run:
-        return _dry_run(args, identified, log)
+        return _dry_run(args, core, identified, log)
 
     # Organize
     log(f"\nOrganizing:")
@@ -330,15 +345,11 @@ def run_cli(args=None):
     log(f"   Action: {args.action}")
     log(f"   Output: {args.output}")
 
-    def org_progress(current, total):
-        if not quiet:
-            print(f"   Processing: {current:,} / {total:,}...", end='\r')
-
     res = core.organize(
         args.output,
         args.strategy,
         args.action,
-        progress_callback=org_progress if not quiet else None,
+        progress_callback=_progress_printer("Processing") if not quiet else None,
     )
     if res.get("error"):
         print(f"Error: {res['error']}", file=sys.stderr)
@@ -350,13 +361,27 @@ def run_cli(args=None):
 
     log(f"\nDone! Organized {actions:,} ROMs")
 
-    # Save collection if requested
-    if args.save_collection:
-        _save_collection(args, all_dat_infos, identified, unidentified, log)
-
+    # The collection was already saved above; organizing never changes the
+    # scanned files, so saving again would only rewrite the same entries
     return 0
 
 
+def _progress_printer(label):
+    """Return a progress callback that redraws the counter at most ~30 times a second."""
+    last = 0.0
+
+    def callback(current, total, *_):
+        nonlocal last
+        now = time.monotonic()
+        if now - last < _PROGRESS_INTERVAL and current != total:
+            return
+        last = now
+        sys.stdout.write(f"   {label}: {current:,} / {total:,}...\r")
+        sys.stdout.flush()
+
+    return callback
+
+
 def _generate_report(args, core, all_dat_infos, identified, log):
     """Generate missing ROM report."""
     if len(all_dat_infos) == 1:
@@ -381,36 +406,41 @@ def _generate_report(args, core, all_dat_infos, identified, log):
             core.reporter.export_txt(report, args.report_output)
         log(f"\nReport saved to: {args.report_output}")
     else:
-        # Print to stdout
+        # Print to stdout, collected into a single write
+        lines = []
         if 'by_dat' in report:
-            print(f"\n=== Missing ROM Report ===")
-            print(f"Overall: {report['found_in_all']}/{report['total_in_all_dats']} "
-                  f"({report['overall_percentage']:.1f}%)")
-            print(f"Missing: {report['missing_in_all']}")
+            lines.append(f"\n=== Missing ROM Report ===")
+            lines.append(f"Overall: {report['found_in_all']}/{report['total_in_all_dats']} "
+                         f"({report['overall_percentage']:.1f}%)")
+            lines.append(f"Missing: {report['missing_in_all']}")
             for dat_report in report['by_dat'].values():
-                print(f"\n--- {dat_report['dat_name']} ---")
-                print(f"Found: {dat_report['found']}/{dat_report['total_in_dat']} "
-                      f"({dat_report['percentage']:.1f}%)")
-                for m in dat_report['missing'][:20]:
-                    print(f"  {m['name']} [{m['region']}]")
-                if len(dat_report['missing']) > 20:
-                    print(f"  ... and {len(dat_report['missing']) - 20} more")
+                lines.append(f"\n--- {dat_report['dat_name']} ---")
+                lines.append(f"Found: {dat_report['found']}/{dat_report['total_in_dat']} "
+                             f"({dat_report['percentage']:.1f}%)")
+                _append_missing(lines, dat_report['missing'], 20)
         else:
-            print(f"\n=== Missing ROM Report: {report['dat_name']} ===")
-            print(f"Found: {report['found']}/{report['total_in_dat']} "
-                  f"({report['percentage']:.1f}%)")
-            print(f"Missing: {report['missing_count']}")
-            for m in report['missing'][:50]:
-                print(f"  {m['name']} [{m['region']}]")
-            if len(report['missing']) > 50:
-                print(f"  ... and {len(report['missing']) - 50} more")
+            lines.append(f"\n=== Missing ROM Report: {report['dat_name']} ===")
+            lines.append(f"Found: {report['found']}/{report['total_in_dat']} "
+                         f"({report['percentage']:.1f}%)")
+            lines.append(f"Missing: {report['missing_count']}")
+            _append_missing(lines, report['missing'], 50)
+        lines.append("")
+        sys.stdout.write("\n".join(lines))
 
     return 0
 
 
-def _dry_run(args, identified, log):
+def _append_missing(lines, missing, limit):
+    """Add the first limit missing ROMs to lines, then a count of the rest."""
+    lines.extend(f"  {m['name']} [{m['region']}]" for m in islice(missing, limit))
+    if len(missing) > limit:
+        lines.append(f"  ... and {len(missing) - limit} more")
+
+
+def _dry_run(args, core, identified, log):
     """Preview what organization would do."""
-    core = CoreService()
+    from .utils import format_size
+
     core.identified = identified
     plan = core.organizer.preview(identified, args.output, args.strategy, args.action)
 
@@ -420,7 +450,7 @@ def _dry_run(args, identified, log):
     log(f"Total size: {format_size(plan.total_size)}")
     log(f"\nPlanned actions:")
 
-    for action in plan.actions[:30]:
+    for action in islice(plan.actions, 30):
         src = os.path.basename(action.source)
         dst = os.path.relpath(action.destination, args.output)
         log(f"  [{action.action_type}] {src} -> {dst}")
@@ -431,7 +461,7 @@ def _dry_run(args, identified, log):
     return 0
 
 
-def _save_collection(args, dat_infos, identified, unidentified, log):
+def _save_collection(args, core, dat_infos, identified, unidentified, log):
     """Save current session as a collection."""
     from .models import Collection
     from datetime import datetime
@@ -446,8 +476,9 @@ def _save_collection(args, dat_infos, identified, unidentified, log):
             'recursive': not args.no_recursive,
             'scan_archives': not args.no_archives,
         },
-        identified=[f.to_dict() for f in identified],
-        unidentified=[f.to_dict() for f in unidentified],
+        # Converted to dicts one at a time while the file is written
+        identified=identified,
+        unidentified=unidentified,
         settings={
             'strategy': args.strategy,
             'action': args.action,
@@ -455,14 +486,15 @@ def _save_collection(args, dat_infos, identified, unidentified, log):
         },
     )
 
-    manager = CoreService().collection_manager
-    filepath = manager.save(collection)
+    filepath = core.collection_manager.save(collection)
     log(f"\nCollection saved: {filepath}")
 
 
 def _load_collection_mode(args):
     """Load and display a saved collection."""
-    manager = CoreService().collection_manager
+    from .collection import CollectionManager
+
+    manager = CollectionManager()
     try:
         collection = manager.load(args.load_collection)
         print(f"Collection: {collection.name}")
@@ -3,44 +3,179 @@ Collection persistence - save/load sessions with DATs, scan results, and setting
 """
 
 import json
+import mmap
 import os
+import re
+from contextlib import contextmanager
 from datetime import datetime
+from itertools import islice
 from typing import Dict, List, Optional
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from .models import Collection, DATInfo, ScannedFile
 from .shared_config import COLLECTIONS_DIR, RECENT_FILE, APP_DATA_DIR
 
 
+def _dump_json_bytes(obj) -> bytes:
+    """Indented UTF-8 JSON; orjson encodes in C, stdlib json is the fallback."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _dump_json_compact(obj) -> bytes:
+    """Single-line UTF-8 JSON with no optional whitespace."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+# Characters replaced in collection file names. \w is exactly
+# str.isalnum() plus '_', so this keeps letters and digits in any script
+_UNSAFE_NAME_RE = re.compile(r'[^\w -]')
+
+# Sidecar cache of list_saved() metadata, keyed by collection filename
+INDEX_FILENAME = '.index.json'
+
+
+def _load_json_bytes(raw: bytes):
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _load_json_file(f):
+    """Parse an open binary file; orjson reads it straight from a mapping."""
+    if ORJSON_AVAILABLE and os.fstat(f.fileno()).st_size:
+        # The mapped pages are shared with the OS cache, so peak memory is
+        # the parsed objects only rather than those plus a full bytes copy
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+    return _load_json_bytes(f.read())
+
+
+@contextmanager
+def _atomic_open(path: str, fsync: bool = False):
+    """Yield a binary file that replaces path only once fully written.
+
+    With fsync, the data is on disk before the rename, so a crash leaves
+    either the old file or the complete new one.
+    """
+    # Per-process temp name: concurrent CLI/GUI writers never share one
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            yield f
+            f.flush()
+            if fsync:
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _atomic_write_bytes(path: str, payload: bytes) -> os.stat_result:
+    """Replace path with payload so readers never see a partial file.
+
+    Returns the stat of the written file, taken before it was moved into place.
+    """
+    with _atomic_open(path) as f:
+        f.write(payload)
+        f.flush()
+        st = os.fstat(f.fileno())
+    return st
+
+
+def _summarize(data: Dict, filename: str) -> Dict:
+    """The metadata list_saved() reports for one collection document."""
+    return {
+        'name': data.get('name', filename),
+        'created_at': data.get('created_at', ''),
+        'updated_at': data.get('updated_at', ''),
+        'dat_count': len(data.get('dat_infos', [])),
+        'identified_count': len(data.get('identified', [])),
+        'unidentified_count': len(data.get('unidentified', [])),
+    }
+
+
+# Top-level keys whose entries are encoded and written one record at a time
+_STREAMED_KEYS = ('identified', 'unidentified')
+
+
+def _write_collection_json(f, data: Dict) -> None:
+    """Write data as indented JSON, streaming the per-file lists.
+
+    Top-level keys are indented as before; each entry of the per-file
+    lists is one compact line. That keeps the file easy to skim and diff
+    while dropping the per-field indentation that made up a large share
+    of its size. Never holds more than one encoded record in memory.
+    """
+    f.write(b'{')
+    sep = b'\n  '
+    for key, value in data.items():
+        f.write(sep)
+        sep = b',\n  '
+        f.write(_dump_json_bytes(key) + b': ')
+        if key not in _STREAMED_KEYS:
+            # JSON strings escape newlines, so this only re-indents structure
+            f.write(_dump_json_bytes(value).replace(b'\n', b'\n  '))
+            continue
+        f.write(b'[')
+        empty = True
+        for item in value:
+            f.write(b'\n    ' if empty else b',\n    ')
+            empty = False
+            f.write(_dump_json_compact(item))
+        f.write(b']' if empty else b'\n  ]')
+    f.write(b'\n}' if data else b'}')
+
+
 class CollectionManager:
     """Manages saving, loading, and listing ROM collections."""
 
     def __init__(self):
         os.makedirs(COLLECTIONS_DIR, exist_ok=True)
         os.makedirs(APP_DATA_DIR, exist_ok=True)
+        self._index_path = os.path.join(COLLECTIONS_DIR, INDEX_FILENAME)
+        # Last RECENT_FILE contents and the (mtime_ns, size) they were read at
+        self._recent: List[Dict] = []
+        self._recent_stamp = None
 
     def save(self, collection: Collection, filepath: Optional[str] = None) -> str:
         """Save collection to JSON. Returns filepath."""
         if not filepath:
-            safe_name = "".join(c if c.isalnum() or c in ' _-' else '_'
-                               for c in collection.name).strip()
+            safe_name = _UNSAFE_NAME_RE.sub('_', collection.name).strip()
             filepath = os.path.join(COLLECTIONS_DIR, f"{safe_name}.romcol.json")
 
         collection.updated_at = datetime.now().isoformat()
         if not collection.created_at:
             collection.created_at = collection.updated_at
 
-        data = collection.to_dict()
+        data = collection.to_dict(stream_files=True)
         os.makedirs(os.path.dirname(filepath), exist_ok=True)
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # A crash mid-save must not truncate the previous copy of a long scan
+        with _atomic_open(filepath, fsync=True) as f:
+            _write_collection_json(f, data)
 
+        if os.path.dirname(os.path.abspath(filepath)) == os.path.abspath(COLLECTIONS_DIR):
+            self._index_collection(filepath, collection)
         self.add_to_recent(filepath, collection.name)
         return filepath
 
     def load(self, filepath: str) -> Collection:
         """Load collection from JSON."""
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(filepath, 'rb') as f:
+            data = _load_json_file(f)
 
         collection = Collection.from_dict(data)
         self.add_to_recent(filepath, collection.name)
@@ -52,24 +187,31 @@ class CollectionManager:
         if not os.path.isdir(COLLECTIONS_DIR):
             return collections
 
-        for filename in os.listdir(COLLECTIONS_DIR):
-            if filename.endswith('.romcol.json'):
-                filepath = os.path.join(COLLECTIONS_DIR, filename)
-                try:
-                    with open(filepath, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    collections.append({
-                        'name': data.get('name', filename),
-                        'filepath': filepath,
-                        'created_at': data.get('created_at', ''),
-                        'updated_at': data.get('updated_at', ''),
-                        'dat_count': len(data.get('dat_infos', [])),
-                        'identified_count': len(data.get('identified', [])),
-                        'unidentified_count': len(data.get('unidentified', [])),
-                    })
-                except Exception:
-                    pass
+        # Only files whose size/mtime changed since they were indexed are parsed
+        index = self._load_index()
+        fresh = {}
+        with os.scandir(COLLECTIONS_DIR) as it:
+            dir_entries = [e for e in it if e.name.endswith('.romcol.json')]
+        for dir_entry in dir_entries:
+            filename = dir_entry.name
+            try:
+                if not dir_entry.is_file():
+                    continue
+                st = dir_entry.stat()
+                entry = index.get(filename)
+                if not (entry and entry.get('mtime_ns') == st.st_mtime_ns
+                        and entry.get('size') == st.st_size):
+                    with open(dir_entry.path, 'rb') as f:
+                        data = _load_json_file(f)
+                    entry = {'mtime_ns': st.st_mtime_ns, 'size': st.st_size,
+                             'meta': _summarize(data, filename)}
+                fresh[filename] = entry
+                collections.append(dict(entry['meta'], filepath=dir_entry.path))
+            except Exception:
+                pass
 
+        if fresh != index:
+            self._write_index(fresh)
         collections.sort(key=lambda x: x.get('updated_at', ''), reverse=True)
         return collections
 
@@ -78,29 +220,66 @@ class CollectionManager:
         try:
             if os.path.exists(filepath):
                 os.remove(filepath)
+                index = self._load_index()
+                if index.pop(os.path.basename(filepath), None) is not None:
+                    self._write_index(index)
                 return True
         except Exception:
             pass
         return False
 
+    def _load_index(self) -> Dict[str, Dict]:
+        try:
+            with open(self._index_path, 'rb') as f:
+                index = _load_json_bytes(f.read())
+        except (OSError, ValueError):
+            return {}
+        return index if isinstance(index, dict) else {}
+
+    def _write_index(self, index: Dict[str, Dict]) -> None:
+        # The index is only a cache: a failed write just means a rescan later
+        try:
+            _atomic_write_bytes(self._index_path, _dump_json_bytes(index))
+        except OSError:
+            pass
+
+    def _index_collection(self, filepath: str, collection: Collection) -> None:
+        """Record a just-saved collection so list_saved() need not re-read it."""
+        try:
+            st = os.stat(filepath)
+        except OSError:
+            return
+        filename = os.path.basename(filepath)
+        meta = {
+            'name': collection.name,
+            'created_at': collection.created_at,
+            'updated_at': collection.updated_at,
+            'dat_count': len(collection.dat_infos),
+            'identified_count': len(collection.identified),
+            'unidentified_count': len(collection.unidentified),
+        }
+        index = self._load_index()
+        index[filename] = {'mtime_ns': st.st_mtime_ns, 'size': st.st_size, 'meta': meta}
+        self._write_index(index)
+
     def get_recent(self, limit: int = 10) -> List[Dict]:
         """Get recently opened collections."""
-        if not os.path.exists(RECENT_FILE):
-            return []
         try:
-            with open(RECENT_FILE, 'r', encoding='utf-8') as f:
-                recent = json.load(f)
-            # Filter out entries where the file no longer exists
-            recent = [r for r in recent if os.path.exists(r.get('filepath', ''))]
-            return recent[:limit]
+            # Filter out entries where the file no longer exists, stopping
+            # (and stat-ing no further) once limit entries are found
+            return list(islice((r for r in self._read_recent()
+                                if os.path.exists(r.get('filepath', ''))), limit))
         except Exception:
             return []
 
     def add_to_recent(self, filepath: str, name: str) -> None:
         """Track a recently opened collection."""
-        recent = self.get_recent(limit=50)
-        # Remove existing entry with same path
-        recent = [r for r in recent if r.get('filepath') != filepath]
+        try:
+            # Remove existing entry with same path. Stale entries are left
+            # for get_recent() to skip instead of stat-ing each on every save
+            recent = [r for r in self._read_recent() if r.get('filepath') != filepath]
+        except Exception:
+            recent = []
         # Add new entry at top
         recent.insert(0, {
             'name': name,
@@ -111,5 +290,18 @@ class CollectionManager:
         recent = recent[:20]
 
         os.makedirs(os.path.dirname(RECENT_FILE), exist_ok=True)
-        with open(RECENT_FILE, 'w', encoding='utf-8') as f:
-            json.dump(recent, f, indent=2, ensure_ascii=False)
+        st = _atomic_write_bytes(RECENT_FILE, _dump_json_bytes(recent))
+        self._recent, self._recent_stamp = recent, (st.st_mtime_ns, st.st_size)
+
+    def _read_recent(self) -> List[Dict]:
+        """RECENT_FILE contents, re-read only when the file changed on disk."""
+        try:
+            st = os.stat(RECENT_FILE)
+        except FileNotFoundError:
+            return []
+        stamp = (st.st_mtime_ns, st.st_size)
+        if stamp != self._recent_stamp:
+            with open(RECENT_FILE, 'rb') as f:
+                self._recent = _load_json_bytes(f.read())
+            self._recent_stamp = stamp
+        return list(self._recent)
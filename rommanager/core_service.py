@@ -8,11 +8,15 @@ from __future__ import annotations
 
 import concurrent.futures
 import difflib
+import functools
 import html as html_lib
 import hashlib
 import json
+import mmap
 import os
 import platform
+import queue
+import random
 import re
 import signal
 import shutil
@@ -26,10 +30,13 @@ import urllib.request
 import zipfile
 import xml.etree.ElementTree as ET
 from collections import deque
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass
 from email.utils import parsedate_to_datetime
 from pathlib import Path
-from urllib.parse import unquote, urlencode, urljoin, urlsplit, urlunsplit
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from stat import S_ISREG
+from urllib.parse import SplitResult, unquote, urlencode, urljoin, urlsplit, urlunsplit
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from .blindmatch import build_blindmatch_rom
 from .collection import CollectionManager
@@ -59,31 +66,424 @@ try:
 except Exception:  # pragma: no cover - non-Windows runtimes
     winreg = None
 
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    REQUESTS_AVAILABLE = True
+except ImportError:
+    REQUESTS_AVAILABLE = False
 
-class MyrientFetcher:
-    """Rate-limited Myrient downloader powered by rclone copyurl."""
+# Myrient CDN hosts (fN.erista.me) and the failing URL in rclone errors
+_RE_ERISTA_NUMBERED = re.compile(r"f(\d+)\.erista\.me", re.IGNORECASE)
+_RE_ERISTA_NUMBERED_PREFIX = re.compile(r"^f\d+\.erista\.me", re.IGNORECASE)
+_RE_RCLONE_ERR_URL = re.compile(r'''(?:Get|Head)\s+"([^"]+)"''', re.IGNORECASE)
+
+
+_head_session = None
+_head_session_lock = threading.Lock()
+
+
+def _new_http_session():
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=0)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _get_head_session():
+    """Shared keep-alive session, so repeated HEADs to a host skip TCP/TLS setup."""
+    global _head_session
+    if _head_session is None:
+        with _head_session_lock:
+            if _head_session is None:
+                _head_session = _new_http_session()
+    return _head_session
+
+
+@dataclass(frozen=True)
+class _MyrientURL:
+    """A download URL split once, with the host facts the Myrient helpers need."""
+
+    url: str
+    parts: SplitResult
+    host: str
+    is_myrient: bool
+    cdn_number: Optional[int]
+
+    @staticmethod
+    @functools.lru_cache(maxsize=2048)
+    def parse(url: str) -> "_MyrientURL":
+        # Cached: retries and host hops re-examine the same URL strings
+        return _MyrientURL.split(url)
+
+    @staticmethod
+    def split(url: str) -> "_MyrientURL":
+        """Uncached parse, for one-off URLs that should not evict download URLs."""
+        parts = urlsplit(url)
+        host = (parts.netloc or "").split("@")[-1].split(":")[0].lower()
+        match = _RE_ERISTA_NUMBERED.fullmatch(host)
+        return _MyrientURL(
+            url=url,
+            parts=parts,
+            host=host,
+            is_myrient=host.endswith(".erista.me") or host == MyrientFetcher._myrient_host,
+            cdn_number=int(match.group(1)) if match else None,
+        )
+
+
+def _parse_url(url: Union[str, _MyrientURL]) -> _MyrientURL:
+    return url if isinstance(url, _MyrientURL) else _MyrientURL.parse(url)
+
+
+def _file_size(path: Union[str, Path]) -> int:
+    """Size of a regular file, 0 when missing or not a file; a single stat() call."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return 0
+    return st.st_size if S_ISREG(st.st_mode) else 0
+
+
+class _SpeedWindow:
+    """Transfer rate over the last ~1.5 s of (timestamp, byte count) samples."""
+
+    __slots__ = ("_samples",)
+
+    horizon_s = 1.5
+
+    def __init__(self, start_bytes: int = 0) -> None:
+        self._samples = deque([(time.monotonic(), int(start_bytes))], maxlen=32)
+
+    def push(self, now: float, byte_count: int) -> float:
+        """Record a sample and return the current rate in bytes per second."""
+        samples = self._samples
+        samples.append((now, byte_count))
+        horizon = self.horizon_s
+        while len(samples) >= 2 and (now - samples[0][0]) > horizon:
+            samples.popleft()
+        first_t, first_b = samples[0]
+        delta_t = now - first_t
+        delta_b = byte_count - first_b
+        if delta_t > 0 and delta_b >= 0:
+            return delta_b / delta_t
+        return 0.0
+
+
+class _DirectFileWriter:
+    """
+    Write-only file opened with O_DIRECT, so downloaded bytes skip the page cache.
+
+    Data is staged in a page-aligned 1 MiB buffer and written a whole block at a
+    time, as O_DIRECT requires; the final partial block goes through a normal fd.
+    With an offset, writes go into an existing file from that block-aligned
+    position instead of truncating it, so byte ranges can share one file.
+    """
 
-    _executor = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix="R0MM-Myrient")
+    block_size = 1 << 20
+
+    def __init__(self, path: str, offset: Optional[int] = None) -> None:
+        self._path = path
+        if offset is None:
+            self._fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_DIRECT, 0o644)
+            self._pos = 0
+        else:
+            self._fd = os.open(path, os.O_WRONLY | os.O_DIRECT)
+            self._pos = offset
+        self._buf = mmap.mmap(-1, self.block_size)
+        self._fill = 0
+
+    def write(self, data: bytes) -> int:
+        view = memoryview(data)
+        block_size = self.block_size
+        while view:
+            take = min(len(view), block_size - self._fill)
+            self._buf[self._fill:self._fill + take] = view[:take]
+            self._fill += take
+            view = view[take:]
+            if self._fill == block_size:
+                os.pwrite(self._fd, self._buf, self._pos)
+                self._pos += block_size
+                self._fill = 0
+        return len(data)
+
+    def close(self) -> None:
+        if self._fd < 0:
+            return
+        try:
+            os.close(self._fd)
+            if self._fill:
+                with open(self._path, "r+b") as fh:
+                    fh.seek(self._pos)
+                    fh.write(self._buf[:self._fill])
+        finally:
+            self._fd = -1
+            self._buf.close()
+
+    def __enter__(self) -> "_DirectFileWriter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class _TransferState:
+    """Progress bookkeeping for one running download subprocess."""
+
+    __slots__ = (
+        "proc",
+        "dest",
+        "filename",
+        "progress_callback",
+        "remote_size",
+        "percent",
+        "speed",
+        "speed_window",
+        "reported_bytes",
+        "reported_speed",
+    )
+
+    def __init__(
+        self,
+        proc: subprocess.Popen,
+        dest: str,
+        filename: str,
+        progress_callback: Optional[Callable[[str, float, str, str], None]],
+        remote_size: Optional[int],
+        start_bytes: int,
+        percent: float,
+    ) -> None:
+        self.proc = proc
+        self.dest = dest
+        self.filename = filename
+        self.progress_callback = progress_callback
+        self.remote_size = remote_size
+        self.percent = percent
+        self.speed = "0 B/s"
+        self.speed_window = _SpeedWindow(start_bytes)
+        # Byte count reported by the process itself; None means stat() the file
+        self.reported_bytes: Optional[int] = None
+        # Speed reported by the process itself; None means derive it from bytes
+        self.reported_speed: Optional[float] = None
+
+
+class _TransferHalted(Exception):
+    """Raised instead of entering a per-host slot once a halt has been requested."""
+
+
+class _HostHopper:
+    """
+    Myrient CDN hosts left to try for one download, kept across its retries.
+
+    When a URL lands on an unreachable fN.erista.me host, the next call hops to
+    another CDN host directly while preserving the same path.
+    """
+
+    max_hosts = 8
+
+    def __init__(self) -> None:
+        self._tried: set = set()
+        self._order: Optional[deque] = None
+
+    def next_url(self, url: str, error_message: str) -> str:
+        """The URL to retry with, or "" once every host has been tried."""
+        failed_url = MyrientFetcher._extract_rclone_error_url(error_message)
+        for seen_url in (url, failed_url):
+            try:
+                host = _parse_url(seen_url).host
+            except Exception:
+                host = ""
+            if host:
+                self._tried.add(host)
+        reference_url = failed_url if MyrientFetcher._is_myrient_url(failed_url) else url
+        try:
+            reference = _parse_url(reference_url)
+        except Exception:
+            return ""
+        if not reference.host or not reference.parts.path:
+            return ""
+
+        if self._order is None:
+            # Rotate away from the first failing host; the canonical host is the last resort
+            max_hosts = self.max_hosts
+            if reference.cdn_number is not None:
+                failed_n = reference.cdn_number
+                numbers = [((failed_n - 1 + offset) % max_hosts) + 1 for offset in range(1, max_hosts + 1)]
+            else:
+                numbers = list(range(1, max_hosts + 1))
+            self._order = deque(f"f{n}.erista.me" for n in numbers)
+            self._order.append(MyrientFetcher._myrient_host)
+
+        while self._order:
+            candidate_host = self._order.popleft()
+            if candidate_host in self._tried:
+                continue
+            candidate_url = MyrientFetcher._replace_url_host(reference_url, candidate_host)
+            if candidate_url and candidate_url != reference_url:
+                self._tried.add(candidate_host)
+                return candidate_url
+        return ""
+
+
+class MyrientFetcher:
+    """Rate-limited Myrient downloader powered by rclone copyurl (or in-process HTTP)."""
+
+    # Myrient policy (agents.md): never more than 4 concurrent connections
+    _max_connections = 4
+    _default_workers = 4
+    _default_per_host = 2
+    _default_segments = 4
+    _default_mirrors = 2
+    _segment_min_bytes = 1024 * 1024
+    # Files below this size are fetched whole over the first range response
+    _segment_threshold_bytes = 8 * 1024 * 1024
+    _batch_probe_workers = 16
     _user_agent = "R0MM/2 MyrientFetcher (+local desktop app)"
     _progress_min_interval_s = 0.20
     _progress_min_percent_step = 1.0
     _myrient_host = "myrient.erista.me"
-
-    def __init__(self) -> None:
+    _http_chunk_size = 256 * 1024
+    _progress_tick_s = 0.25
+    _http_timeout_s = 45
+    _retry_backoff_max_s = 30.0
+    _halt_join_s = 2.0
+    # JSON log lines on the output pipe, including a one-line stats record twice a second
+    _rclone_stats_args = ("--use-json-log", "--stats", "500ms", "--stats-one-line", "--stats-log-level", "NOTICE")
+
+    def __init__(self, parallel: Any = None, per_host: Any = None) -> None:
         self._cancel_event = threading.Event()
         self._lock = threading.Lock()
+        self._parallel = self._clamp_connections(parallel, self._default_workers)
+        self._per_host = self._clamp_connections(per_host, self._default_per_host)
+        # Caps running transfers per mirror host, whatever the worker count
+        self._host_semaphores: Dict[str, threading.BoundedSemaphore] = {}
         self._futures: Dict[concurrent.futures.Future, dict] = {}
         self._progress_emit_state: Dict[str, tuple[float, float, str]] = {}
-        self._active_processes: Dict[str, subprocess.Popen] = {}
-        self._rclone_path: Optional[str] = None
+        self._transfers: Dict[str, _TransferState] = {}
+        self._ticker: Optional[threading.Thread] = None
+        # Long-lived workers, each keeping its own HTTP session (and connections) warm
+        # A None entry tells one worker to close its session and exit
+        self._job_queue: "queue.Queue[Optional[Tuple[concurrent.futures.Future, tuple, dict]]]" = queue.Queue()
+        self._workers: List[threading.Thread] = []
+        self._local = threading.local()
+
+    @classmethod
+    def _clamp_connections(cls, value: Any, default: int) -> int:
+        """A user-supplied connection count, kept within 1.._max_connections."""
+        try:
+            count = int(value) if value else default
+        except (TypeError, ValueError):
+            count = default
+        return max(1, min(count, cls._max_connections))
+
+    def _worker_count(self) -> int:
+        raw = os.getenv("R0MM_DOWNLOAD_WORKERS", "").strip()
+        return self._clamp_connections(raw, self._parallel)
+
+    @contextmanager
+    def _host_slot(self, url: Union[str, _MyrientURL]):
+        """
+        Hold one of the per-host transfer slots while the block runs.
+
+        A halt ends the wait with _TransferHalted, so no transfer starts after it.
+        """
+        try:
+            host = _parse_url(url).host
+        except Exception:
+            host = ""
+        with self._lock:
+            semaphore = self._host_semaphores.get(host)
+            if semaphore is None:
+                semaphore = self._host_semaphores[host] = threading.BoundedSemaphore(self._per_host)
+        while not semaphore.acquire(timeout=self._progress_tick_s):
+            if self._cancel_event.is_set():
+                raise _TransferHalted(host)
+        if self._cancel_event.is_set():
+            semaphore.release()
+            raise _TransferHalted(host)
+        try:
+            yield
+        finally:
+            semaphore.release()
+
+    def _halted_result(
+        self,
+        url: str,
+        dest_str: str,
+        filename: str,
+        progress_callback: Optional[Callable[[str, float, str, str], None]],
+        percent: float,
+    ) -> dict:
+        monitor_action(f"[!] myrient:halted {filename}")
+        self._emit_progress(progress_callback, filename, percent, "", "HALTED")
+        return {
+            "url": url,
+            "dest_path": dest_str,
+            "bytes": _file_size(dest_str),
+            "halted": True,
+            "status": "HALTED",
+        }
+
+    @classmethod
+    def _mirror_count(cls) -> int:
+        raw = os.getenv("R0MM_DOWNLOAD_MIRRORS", "").strip()
+        try:
+            return max(1, int(raw)) if raw else cls._default_mirrors
+        except ValueError:
+            return cls._default_mirrors
+
+    @classmethod
+    def _segment_count(cls) -> int:
+        raw = os.getenv("R0MM_DOWNLOAD_SEGMENTS", "").strip()
+        return cls._clamp_connections(raw, cls._default_segments)
+
+    def _ensure_workers(self) -> None:
+        with self._lock:
+            if self._workers:
+                return
+            for index in range(self._worker_count()):
+                worker = threading.Thread(
+                    target=self._worker_loop,
+                    name=f"R0MM-Myrient_{index}",
+                    daemon=True,
+                )
+                worker.start()
+                self._workers.append(worker)
+
+    def _worker_loop(self) -> None:
+        session = self._local.session = _new_http_session() if REQUESTS_AVAILABLE else None
+        try:
+            while True:
+                job = self._job_queue.get()
+                if job is None:
+                    return
+                future, args, kwargs = job
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    result = self.download_target(*args, **kwargs)
+                except BaseException as exc:
+                    future.set_exception(exc)
+                else:
+                    future.set_result(result)
+        finally:
+            self._local.session = None
+            if session is not None:
+                session.close()
+
+    def _http_session(self):
+        """The calling worker's session, or the shared one outside the pool."""
+        return getattr(self._local, "session", None) or _get_head_session()
 
     @staticmethod
-    def _filename_for(url: str, dest_path: str) -> str:
+    @functools.lru_cache(maxsize=2048)
+    def _filename_for(url: Union[str, _MyrientURL], dest_path: str) -> str:
+        # Cached: submit, each download attempt and each retry ask for the same pair
         if dest_path:
-            name = Path(dest_path).name
+            name = os.path.basename(dest_path)
             if name:
                 return name
-        tail = Path(urlsplit(url).path).name
+        tail = Path(_parse_url(url).parts.path).name
         return tail or "download.bin"
 
     @staticmethod
@@ -110,15 +510,12 @@ class MyrientFetcher:
         now = time.monotonic()
 
         if safe_status == "DOWNLOADING":
+            # Unlocked read first (dict.get is atomic): most throttled calls end here
+            if self._progress_suppressed(self._progress_emit_state.get(key), now, safe_percent):
+                return
             with self._lock:
-                prev = self._progress_emit_state.get(key)
-                if prev is not None:
-                    last_ts, last_pct, _last_status = prev
-                    if (
-                        (now - last_ts) < self._progress_min_interval_s
-                        and abs(safe_percent - last_pct) < self._progress_min_percent_step
-                    ):
-                        return
+                if self._progress_suppressed(self._progress_emit_state.get(key), now, safe_percent):
+                    return
                 self._progress_emit_state[key] = (now, safe_percent, safe_status)
         else:
             with self._lock:
@@ -131,6 +528,15 @@ class MyrientFetcher:
         except Exception:
             pass
 
+    def _progress_suppressed(self, prev: Optional[Tuple[float, float, str]], now: float, percent: float) -> bool:
+        if prev is None:
+            return False
+        last_ts, last_pct, _last_status = prev
+        return (
+            (now - last_ts) < self._progress_min_interval_s
+            and abs(percent - last_pct) < self._progress_min_percent_step
+        )
+
     @staticmethod
     def _request(url: str, *, method: str = "GET", headers: Optional[dict] = None) -> urllib.request.Request:
         req_headers = {"User-Agent": MyrientFetcher._user_agent}
@@ -138,26 +544,23 @@ class MyrientFetcher:
             req_headers.update(headers)
         return urllib.request.Request(url, headers=req_headers, method=method)
 
-    def _resolve_rclone_binary(self) -> str:
-        cached = (self._rclone_path or "").strip()
-        if cached and Path(cached).exists():
-            return cached
-
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _resolve_rclone_binary() -> str:
+        """Locate rclone once per process; call .cache_clear() to look again."""
         names = ["rclone.exe", "rclone"] if os.name == "nt" else ["rclone", "rclone.exe"]
         repo_root = Path(__file__).resolve().parent.parent
         candidates = [repo_root / name for name in names]
         for candidate in candidates:
             try:
                 if candidate.exists() and candidate.is_file():
-                    self._rclone_path = str(candidate)
-                    return self._rclone_path
+                    return str(candidate)
             except OSError:
                 continue
 
         resolved = shutil.which("rclone")
         if resolved:
-            self._rclone_path = resolved
-            return self._rclone_path
+            return resolved
 
         raise FileNotFoundError("rclone binary not found (expected in project root or PATH)")
 
@@ -185,6 +588,7 @@ class MyrientFetcher:
             "45s",
             "--multi-thread-streams",
             "0",
+            *self._rclone_stats_args,
         ]
         if troubleshoot_profile:
             cmd.extend([
@@ -196,7 +600,7 @@ class MyrientFetcher:
 
     def _build_rclone_http_copyto_command(
         self,
-        url: str,
+        url: Union[str, _MyrientURL],
         dest_path: str,
         *,
         troubleshoot_profile: bool = False,
@@ -207,7 +611,7 @@ class MyrientFetcher:
         This follows Myrient FAQ guidance (rclone HTTP remote + copy/sync family) while
         still preserving an exact destination filename via copyto.
         """
-        parts = urlsplit(url)
+        parts = _parse_url(url).parts
         host = (parts.hostname or "").strip() or self._myrient_host
         raw_path = (parts.path or "/").lstrip("/")
         if not raw_path:
@@ -246,6 +650,7 @@ class MyrientFetcher:
             "45s",
             "--multi-thread-streams",
             "0",
+            *self._rclone_stats_args,
         ]
         if troubleshoot_profile:
             cmd.extend([
@@ -256,12 +661,54 @@ class MyrientFetcher:
         return cmd
 
     @staticmethod
-    def _last_meaningful_output_line(output: str) -> str:
-        text = str(output or "").replace("\r", "\n")
-        for line in reversed([ln.strip() for ln in text.splitlines() if ln.strip()]):
-            if "Config file" in line and "using defaults" in line:
-                continue
-            return line
+    def _iter_pipe_lines(pipe: Any):
+        """Yield raw output lines (bytes) from an unbuffered binary pipe until EOF."""
+        fd = pipe.fileno()
+        pending = b""
+        while True:
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                break
+            lines = (pending + chunk).split(b"\n")
+            pending = lines.pop()
+            yield from lines
+        if pending:
+            yield pending
+
+    @staticmethod
+    def _parse_rclone_log_line(line: bytes) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """Split one --use-json-log line into (log text, stats record)."""
+        raw = line.strip()
+        if not raw.startswith(b"{"):
+            return raw.decode("utf-8", "replace"), None
+        try:
+            # json.loads takes UTF-8 bytes directly: stats lines are never decoded to str
+            entry = json.loads(raw)
+        except ValueError:
+            return raw.decode("utf-8", "replace"), None
+        if not isinstance(entry, dict):
+            return raw.decode("utf-8", "replace"), None
+        stats = entry.get("stats")
+        if isinstance(stats, dict):
+            return "", stats
+        msg = str(entry.get("msg") or "").strip()
+        obj = str(entry.get("object") or "").strip()
+        if obj:
+            msg = f"{obj}: {msg}"
+        level = str(entry.get("level") or "").strip().upper()
+        return (f"{level} : {msg}" if level and msg else msg), None
+
+    @staticmethod
+    def _last_meaningful_output_line(output: Union[str, List[str]]) -> str:
+        """Last non-empty output line, skipping rclone's config notice; accepts text or a line list."""
+        lines = output if isinstance(output, list) else str(output or "").splitlines()
+        for raw in reversed(lines):
+            # splitlines() already breaks on "\r"; this covers lines collected from a pipe
+            for line in reversed(raw.split("\r")):
+                line = line.strip()
+                if not line or ("Config file" in line and "using defaults" in line):
+                    continue
+                return line
         return ""
 
     def _build_powershell_iwr_command(self, url: str, dest_path: str) -> List[str]:
@@ -288,6 +735,31 @@ class MyrientFetcher:
         return cmd
 
     @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _native_backend_requested() -> bool:
+        raw = os.getenv("R0MM_DOWNLOAD_BACKEND", "").strip().lower()
+        return raw in {"native", "http", "python"}
+
+    def _use_native_backend(self) -> bool:
+        """In-process HTTP when requested, or when no rclone binary is available."""
+        if self._native_backend_requested():
+            return True
+        try:
+            self._resolve_rclone_binary()
+        except FileNotFoundError:
+            return True
+        return False
+
+    @staticmethod
+    def _format_speed(speed_bps: float) -> str:
+        if speed_bps >= 1024 * 1024:
+            return f"{speed_bps / (1024 * 1024):.1f} MiB/s"
+        if speed_bps >= 1024:
+            return f"{speed_bps / 1024:.0f} KiB/s"
+        return f"{speed_bps:.0f} B/s"
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
     def _ps_iwr_fallback_enabled() -> bool:
         raw = os.getenv("R0MM_ENABLE_PS_IWR_FALLBACK", "").strip().lower()
         return raw in {"1", "true", "yes", "on"}
@@ -306,50 +778,60 @@ class MyrientFetcher:
             "i/o timeout",
             "no such host",
             "temporary failure",
+            "too many requests",
+            "service unavailable",
         )
         return any(marker in text for marker in retry_markers)
 
+    @classmethod
+    def _retry_delay(cls, attempt: int, error_line: str) -> float:
+        """Exponential backoff with jitter; rate limits back off harder, DNS misses barely at all."""
+        text = (error_line or "").lower()
+        if any(marker in text for marker in ("429", "503", "too many requests", "service unavailable")):
+            base = 4.0
+        elif any(marker in text for marker in ("no such host", "temporary failure in name resolution")):
+            base = 0.25
+        else:
+            base = 1.0
+        return min(cls._retry_backoff_max_s, (2 ** attempt) * base) + random.uniform(0.0, 1.0)
+
+    def _sleep_backoff(self, attempt: int, error_line: str, filename: str) -> None:
+        """Wait before a retry; a halt cuts the wait short and the retry then reports HALTED."""
+        delay = self._retry_delay(attempt, error_line)
+        monitor_action(f"[*] myrient:rclone:backoff {filename} {delay:.1f}s")
+        self._cancel_event.wait(delay)
+
     @staticmethod
-    def _canonicalize_myrient_url(url: str) -> str:
+    def _canonicalize_myrient_url(url: Union[str, _MyrientURL]) -> str:
         try:
-            parts = urlsplit(url)
+            target = _parse_url(url)
         except Exception:
             return url
+        parts = target.parts
         netloc = parts.netloc or ""
-        if not netloc:
-            return url
-        host = netloc.split("@")[-1].split(":")[0]
-        if not re.fullmatch(r"f\d+\.erista\.me", host, flags=re.IGNORECASE):
-            return url
-        canonical_netloc = re.sub(
-            r"^f\d+\.erista\.me",
-            MyrientFetcher._myrient_host,
-            netloc,
-            flags=re.IGNORECASE,
-        )
+        if not netloc or target.cdn_number is None:
+            return target.url
+        canonical_netloc = _RE_ERISTA_NUMBERED_PREFIX.sub(MyrientFetcher._myrient_host, netloc)
         return urlunsplit((parts.scheme, canonical_netloc, parts.path, parts.query, parts.fragment))
 
     @staticmethod
-    def _is_myrient_url(url: str) -> bool:
+    def _is_myrient_url(url: Union[str, _MyrientURL]) -> bool:
         try:
-            host = (urlsplit(url).netloc or "").split("@")[-1].split(":")[0].lower()
+            return _parse_url(url).is_myrient
         except Exception:
             return False
-        return host.endswith(".erista.me") or host == MyrientFetcher._myrient_host
 
     @staticmethod
     def _myrient_mirror_fallback_url(url: str) -> str:
         try:
-            parts = urlsplit(url)
+            target = _parse_url(url)
         except Exception:
             return ""
+        parts = target.parts
         netloc = parts.netloc or ""
-        if not netloc:
+        if not netloc or target.cdn_number is None:
             return ""
-        host = netloc.split("@")[-1].split(":")[0].lower()
-        if not re.fullmatch(r"f\d+\.erista\.me", host):
-            return ""
-        fallback_netloc = re.sub(r"^f\d+\.erista\.me", "myrient.erista.me", netloc, flags=re.IGNORECASE)
+        fallback_netloc = _RE_ERISTA_NUMBERED_PREFIX.sub("myrient.erista.me", netloc)
         candidate = urlunsplit((parts.scheme, fallback_netloc, parts.path, parts.query, parts.fragment))
         return candidate if candidate != url else ""
 
@@ -358,7 +840,7 @@ class MyrientFetcher:
         text = str(message or "")
         if not text:
             return ""
-        match = re.search(r'''(?:Get|Head)\s+"([^"]+)"''', text, flags=re.IGNORECASE)
+        match = _RE_RCLONE_ERR_URL.search(text)
         return str(match.group(1)).strip() if match else ""
 
     @staticmethod
@@ -367,7 +849,7 @@ class MyrientFetcher:
         if not safe_host:
             return ""
         try:
-            parts = urlsplit(url)
+            parts = _parse_url(url).parts
         except Exception:
             return ""
         netloc = (parts.netloc or "").strip()
@@ -394,51 +876,6 @@ class MyrientFetcher:
         new_netloc = f"{userinfo}{safe_host}{port}"
         return urlunsplit((parts.scheme, new_netloc, parts.path, parts.query, parts.fragment))
 
-    @staticmethod
-    def _myrient_host_hop_fallback_url(url: str, error_message: str, *, tried_hosts: Optional[Tuple[str, ...]] = None) -> str:
-        """
-        If a Myrient URL redirects to an unreachable fN.erista.me host, hop to another
-        CDN host directly while preserving the same path.
-        """
-        failed_url = MyrientFetcher._extract_rclone_error_url(error_message)
-        reference_url = failed_url if MyrientFetcher._is_myrient_url(failed_url) else url
-        try:
-            ref_parts = urlsplit(reference_url)
-        except Exception:
-            return ""
-        ref_host = (ref_parts.netloc or "").split("@")[-1].split(":")[0].lower()
-        if not ref_host or not ref_parts.path:
-            return ""
-        tried = {h.lower() for h in (tried_hosts or ()) if str(h or "").strip()}
-        tried.add(ref_host)
-        try:
-            input_host = (urlsplit(url).netloc or "").split("@")[-1].split(":")[0].lower()
-        except Exception:
-            input_host = ""
-        if input_host:
-            tried.add(input_host)
-
-        failed_match = re.fullmatch(r"f(\d+)\.erista\.me", ref_host)
-        host_order: List[str] = []
-        max_hosts = 8
-        if failed_match:
-            failed_n = int(failed_match.group(1))
-            for offset in range(1, max_hosts + 1):
-                cand_n = ((failed_n - 1 + offset) % max_hosts) + 1
-                host_order.append(f"f{cand_n}.erista.me")
-        else:
-            host_order.extend([f"f{i}.erista.me" for i in range(1, max_hosts + 1)])
-        # Keep canonical host as a last resort if it wasn't already tried.
-        host_order.append(MyrientFetcher._myrient_host)
-
-        for candidate_host in host_order:
-            if candidate_host.lower() in tried:
-                continue
-            candidate_url = MyrientFetcher._replace_url_host(reference_url, candidate_host)
-            if candidate_url and candidate_url != reference_url:
-                return candidate_url
-        return ""
-
     @staticmethod
     def _terminate_subprocess(proc: Optional[subprocess.Popen], timeout_s: float = 1.0) -> None:
         if proc is None:
@@ -460,6 +897,105 @@ class MyrientFetcher:
             except Exception:
                 pass
 
+    def _track_transfer(self, transfer: _TransferState) -> None:
+        with self._lock:
+            self._transfers[transfer.dest] = transfer
+            if self._ticker is None:
+                self._ticker = threading.Thread(target=self._ticker_loop, name="R0MM-Myrient-progress", daemon=True)
+                self._ticker.start()
+
+    def _untrack_transfer(self, transfer: _TransferState) -> None:
+        with self._lock:
+            if self._transfers.get(transfer.dest) is transfer:
+                del self._transfers[transfer.dest]
+
+    def _ticker_loop(self) -> None:
+        """One thread samples every running transfer, instead of a poll loop per job."""
+        while True:
+            time.sleep(self._progress_tick_s)
+            with self._lock:
+                transfers = list(self._transfers.values())
+                if not transfers:
+                    # Exit while holding the lock; _track_transfer starts a new one
+                    self._ticker = None
+                    return
+            cancelled = self._cancel_event.is_set()
+            for transfer in transfers:
+                try:
+                    if cancelled:
+                        self._terminate_subprocess(transfer.proc)
+                    self._sample_transfer(transfer)
+                except Exception:
+                    pass
+
+    def _drive_subprocess_progress(self, transfer: _TransferState, read_output: Callable[[], Any]) -> Tuple[int, Any]:
+        """
+        Run a spawned transfer under the shared ticker until its process exits.
+
+        read_output drains the process output on this thread, so a chatty process
+        never blocks on a full pipe. Returns (return code, what read_output returned);
+        the final percentage is left on the transfer.
+        """
+        self._track_transfer(transfer)
+        try:
+            self._emit_progress(transfer.progress_callback, transfer.filename, transfer.percent, transfer.speed, "DOWNLOADING")
+            try:
+                output = read_output()
+            except Exception:
+                output = ""
+            return_code = int(transfer.proc.wait())
+            self._sample_transfer(transfer)
+            return return_code, output
+        finally:
+            self._untrack_transfer(transfer)
+
+    def _read_rclone_output(self, transfer: _TransferState) -> List[str]:
+        """
+        Feed rclone's JSON stats into the transfer's byte counter, so the ticker needs
+        no stat() per tick; every other log line is kept for error reporting.
+        """
+        log_lines: List[str] = []
+        try:
+            for line in self._iter_pipe_lines(transfer.proc.stdout):
+                text, stats = self._parse_rclone_log_line(line)
+                if stats is not None:
+                    try:
+                        transfer.reported_bytes = int(stats.get("bytes") or 0)
+                        if not transfer.remote_size:
+                            transfer.remote_size = int(stats.get("totalBytes") or 0) or None
+                        transfer.reported_speed = self._rclone_stats_speed(stats)
+                    except (TypeError, ValueError):
+                        pass
+                elif text:
+                    log_lines.append(text)
+        except Exception:
+            pass
+        return log_lines
+
+    @staticmethod
+    def _rclone_stats_speed(stats: Dict[str, Any]) -> Optional[float]:
+        """rclone's own smoothed speed for the single transfer, else its overall average."""
+        transferring = stats.get("transferring")
+        if isinstance(transferring, list) and transferring and isinstance(transferring[0], dict):
+            speed = transferring[0].get("speedAvg", transferring[0].get("speed"))
+        else:
+            speed = stats.get("speed")
+        return None if speed is None else max(0.0, float(speed))
+
+    def _sample_transfer(self, transfer: _TransferState) -> None:
+        bytes_now = transfer.reported_bytes
+        if bytes_now is None:
+            bytes_now = _file_size(transfer.dest)
+        speed_bps = transfer.reported_speed
+        if speed_bps is None:
+            speed_bps = transfer.speed_window.push(time.monotonic(), bytes_now)
+        transfer.speed = self._format_speed(speed_bps)
+
+        remote_size = transfer.remote_size
+        if isinstance(remote_size, int) and remote_size > 0:
+            transfer.percent = max(0.0, min(100.0, (bytes_now / remote_size) * 100.0))
+        self._emit_progress(transfer.progress_callback, transfer.filename, transfer.percent, transfer.speed, "DOWNLOADING")
+
     def _download_via_powershell_iwr(
         self,
         *,
@@ -470,100 +1006,53 @@ class MyrientFetcher:
         remote_size: Optional[int],
         initial_pct: float,
     ) -> dict:
-        cmd = self._build_powershell_iwr_command(url, str(dest))
+        dest_str = str(dest)
+        cmd = self._build_powershell_iwr_command(url, dest_str)
         monitor_action(f"[!] myrient:ps_iwr:start {filename}")
         creationflags = 0
         if os.name == "nt" and hasattr(subprocess, "CREATE_NO_WINDOW"):
             creationflags = int(getattr(subprocess, "CREATE_NO_WINDOW"))
 
-        try:
-            start_size = int(dest.stat().st_size) if dest.exists() and dest.is_file() else 0
-        except OSError:
-            start_size = 0
+        start_size = _file_size(dest_str)
         current_pct = initial_pct
-        current_speed = "0 B/s"
         proc: Optional[subprocess.Popen] = None
         output = ""
         try:
-            proc = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                stdin=subprocess.DEVNULL,
-                text=True,
-                encoding="utf-8",
-                errors="replace",
-                bufsize=1,
-                creationflags=creationflags,
-            )
-            with self._lock:
-                self._active_processes[str(dest)] = proc
-
-            speed_window = deque([(time.monotonic(), int(start_size))], maxlen=32)
-            self._emit_progress(progress_callback, filename, current_pct, current_speed, "DOWNLOADING")
-
-            while True:
-                if self._cancel_event.is_set():
-                    self._terminate_subprocess(proc)
-                rc = proc.poll()
-                try:
-                    bytes_now = int(dest.stat().st_size) if dest.exists() and dest.is_file() else 0
-                except OSError:
-                    bytes_now = 0
-                now = time.monotonic()
-                speed_window.append((now, bytes_now))
-                while len(speed_window) >= 2 and (now - speed_window[0][0]) > 1.5:
-                    speed_window.popleft()
-
-                speed_bps = 0.0
-                if len(speed_window) >= 2:
-                    delta_t = speed_window[-1][0] - speed_window[0][0]
-                    delta_b = speed_window[-1][1] - speed_window[0][1]
-                    if delta_t > 0 and delta_b >= 0:
-                        speed_bps = delta_b / delta_t
-                if speed_bps >= 1024 * 1024:
-                    current_speed = f"{speed_bps / (1024 * 1024):.1f} MiB/s"
-                elif speed_bps >= 1024:
-                    current_speed = f"{speed_bps / 1024:.0f} KiB/s"
-                else:
-                    current_speed = f"{speed_bps:.0f} B/s"
-
-                if isinstance(remote_size, int) and remote_size > 0:
-                    current_pct = max(0.0, min(100.0, (bytes_now / remote_size) * 100.0))
-                self._emit_progress(progress_callback, filename, current_pct, current_speed, "DOWNLOADING")
-
-                if rc is not None:
-                    break
-                time.sleep(0.25)
-
-            return_code = int(proc.wait())
-            try:
-                out, _ = proc.communicate(timeout=0.25)
-            except Exception:
-                out = ""
+            with self._host_slot(url):
+                proc = subprocess.Popen(
+                    cmd,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    stdin=subprocess.DEVNULL,
+                    text=True,
+                    encoding="utf-8",
+                    errors="replace",
+                    bufsize=1,
+                    creationflags=creationflags,
+                )
+                transfer = _TransferState(proc, dest_str, filename, progress_callback, remote_size, start_size, current_pct)
+                return_code, out = self._drive_subprocess_progress(transfer, lambda: proc.communicate()[0])
+                current_pct = transfer.percent
             output = str(out or "")
             if self._cancel_event.is_set():
                 monitor_action(f"[!] myrient:ps_iwr:halted {filename}")
                 self._emit_progress(progress_callback, filename, current_pct, "", "HALTED")
                 return {
                     "url": url,
-                    "dest_path": str(dest),
-                    "bytes": int(dest.stat().st_size) if dest.exists() and dest.is_file() else 0,
+                    "dest_path": dest_str,
+                    "bytes": _file_size(dest_str),
                     "halted": True,
                     "status": "HALTED",
                     "backend": "powershell-iwr",
                     "transport": "http-iwr",
                 }
             if return_code == 0:
-                try:
-                    bytes_written = int(dest.stat().st_size) if dest.exists() and dest.is_file() else 0
-                except OSError:
-                    bytes_written = 0
+                bytes_written = _file_size(dest_str)
                 monitor_action(f"[*] myrient:ps_iwr:done {filename} bytes={bytes_written}")
                 self._emit_progress(progress_callback, filename, 100.0, "", "DONE")
                 return {
                     "url": url,
-                    "dest_path": str(dest),
+                    "dest_path": dest_str,
                     "bytes": bytes_written,
                     "status": "DONE",
                     "backend": "powershell-iwr",
@@ -576,7 +1065,7 @@ class MyrientFetcher:
             self._emit_progress(progress_callback, filename, current_pct if current_pct > 0 else 0.0, error_line, "ERROR")
             return {
                 "url": url,
-                "dest_path": str(dest),
+                "dest_path": dest_str,
                 "error": error_line,
                 "status": "ERROR",
                 "backend": "powershell-iwr",
@@ -586,8 +1075,430 @@ class MyrientFetcher:
             if proc is not None:
                 if self._cancel_event.is_set():
                     self._terminate_subprocess(proc)
-                with self._lock:
-                    self._active_processes.pop(str(dest), None)
+
+    def _mirror_urls(self, url: str) -> List[str]:
+        """url first, then other Myrient CDN hosts serving the same path, up to R0MM_DOWNLOAD_MIRRORS."""
+        urls = [url]
+        if self._is_myrient_url(url):
+            hopper = _HostHopper()
+            limit = self._mirror_count()
+            while len(urls) < limit:
+                candidate = hopper.next_url(url, "")
+                if not candidate:
+                    break
+                urls.append(candidate)
+        return urls
+
+    def _download_via_segments(
+        self,
+        *,
+        url: str,
+        dest: Path,
+        filename: str,
+        progress_callback: Optional[Callable[[str, float, str, str], None]],
+        initial_pct: float,
+    ) -> Optional[dict]:
+        """
+        Fetch a fresh file as parallel byte ranges, spread over every mirror that has it.
+
+        The first request asks for "bytes=0-" and learns the size from its
+        Content-Range, so nothing is probed ahead of the data: its body serves the
+        first range, or the whole file when it is too small to split. Connections
+        are dealt round-robin across the mirrors and pull ranges from a shared
+        queue; a range that fails goes back on the queue for the others, and the
+        connection that failed stops. Ranges land in a ".part" sibling that replaces
+        dest only once every range has arrived, so dest is never left zero-filled.
+        Returns None, leaving the download to the regular backend, when the server
+        does not honour ranges or the ranges cannot all be fetched.
+        """
+        first = ExitStack()
+        try:
+            first.enter_context(self._host_slot(url))
+            resp = self._http_session().get(
+                url,
+                headers={"User-Agent": self._user_agent, "Range": "bytes=0-"},
+                stream=True,
+                timeout=self._http_timeout_s,
+            )
+            first.callback(resp.close)
+        except _TransferHalted:
+            return self._halted_result(url, str(dest), filename, progress_callback, initial_pct)
+        except Exception:
+            first.close()
+            return None
+        total_text = (resp.headers.get("Content-Range") or "").rpartition("/")[2].strip()
+        if resp.status_code != 206 or not total_text.isdigit() or int(total_text) <= 0:
+            # Range ignored (or an error): the regular backend fetches it whole
+            first.close()
+            return None
+        total = int(total_text)
+
+        mirrors = [url]
+        connections = self._segment_count()
+        if total < self._segment_threshold_bytes:
+            range_count = 1
+        else:
+            others = self._mirror_urls(url)[1:]
+            if others:
+                with concurrent.futures.ThreadPoolExecutor(max_workers=len(others)) as pool:
+                    probes = list(pool.map(lambda mirror: self._range_probe(mirror, 0), others))
+                mirrors += [mirror for mirror, probe in zip(others, probes) if probe == (206, total)]
+            # Twice as many ranges as connections, so a failed range can be picked up
+            range_count = max(1, min(connections * 2, total // self._segment_min_bytes))
+        # More connections than the per-host slots allow would only sit waiting
+        connections = max(1, min(connections, range_count, self._per_host * len(mirrors)))
+
+        # Range starts fall on block boundaries, so each range can be written with O_DIRECT
+        align = _DirectFileWriter.block_size
+        bounds = [total * index // range_count // align * align for index in range(range_count)] + [total]
+        done = [0] * range_count
+        attempts = [0] * range_count
+        finished_ranges: List[int] = []
+        pending_ranges: "queue.Queue[int]" = queue.Queue()
+        for index in range(1, range_count):
+            pending_ranges.put(index)
+        abort = threading.Event()
+        monitor_action(
+            f"[*] myrient:segmented:start {filename} ranges={range_count} connections={connections} "
+            f"mirrors={len(mirrors)} bytes={total}"
+        )
+        part = dest.with_name(dest.name + ".part")
+        try:
+            with open(part, "wb") as fh:
+                fh.truncate(total)
+        except OSError:
+            first.close()
+            return None
+
+        def write_range(resp, index: int) -> None:
+            start, end = bounds[index], bounds[index + 1]
+            read = resp.raw.read
+            # Each range writes through its own handle, sequentially from its offset
+            with self._open_range_file(part, start) as out:
+                remaining = end - start
+                while remaining > 0:
+                    if abort.is_set() or self._cancel_event.is_set():
+                        return
+                    chunk = read(min(self._http_chunk_size, remaining))
+                    if not chunk:
+                        raise OSError(f"range {start}-{end - 1} ended {remaining} bytes early")
+                    out.write(chunk)
+                    remaining -= len(chunk)
+                    done[index] += len(chunk)
+            finished_ranges.append(index)
+
+        def fetch(mirror: str, index: int) -> None:
+            start, end = bounds[index], bounds[index + 1]
+            resp = self._http_session().get(
+                mirror,
+                headers={"User-Agent": self._user_agent, "Range": f"bytes={start}-{end - 1}"},
+                stream=True,
+                timeout=self._http_timeout_s,
+            )
+            try:
+                if resp.status_code != 206:
+                    raise OSError(f"range {start}-{end - 1} answered HTTP {resp.status_code}")
+                write_range(resp, index)
+            finally:
+                resp.close()
+
+        def failed(index: int) -> None:
+            done[index] = 0
+            attempts[index] += 1
+            if attempts[index] > len(mirrors):
+                abort.set()
+            else:
+                pending_ranges.put(index)
+
+        def connection(mirror: str) -> None:
+            while not (abort.is_set() or self._cancel_event.is_set()):
+                # The slot counts this connection against its own mirror's per-host cap
+                with self._host_slot(mirror):
+                    try:
+                        index = pending_ranges.get_nowait()
+                    except queue.Empty:
+                        return
+                    try:
+                        fetch(mirror, index)
+                    except Exception:
+                        failed(index)
+                        raise
+
+        def first_connection() -> None:
+            # Range 0 comes from the opening response, still holding its slot
+            with first:
+                try:
+                    write_range(resp, 0)
+                except Exception:
+                    failed(0)
+                    raise
+            connection(url)
+
+        current_pct = initial_pct
+        speed_window = _SpeedWindow()
+        self._emit_progress(progress_callback, filename, current_pct, "0 B/s", "DOWNLOADING")
+        error = None
+        with concurrent.futures.ThreadPoolExecutor(max_workers=connections, thread_name_prefix="R0MM-Myrient-range") as pool:
+            pending = {pool.submit(first_connection)}
+            pending |= {pool.submit(connection, mirrors[index % len(mirrors)]) for index in range(1, connections)}
+            while pending:
+                finished, pending = concurrent.futures.wait(pending, timeout=self._progress_tick_s)
+                for future in finished:
+                    if future.exception() is not None:
+                        error = future.exception()
+                bytes_now = sum(done)
+                current_speed = self._format_speed(speed_window.push(time.monotonic(), bytes_now))
+                current_pct = max(0.0, min(100.0, (bytes_now / total) * 100.0))
+                self._emit_progress(progress_callback, filename, current_pct, current_speed, "DOWNLOADING")
+
+        if self._cancel_event.is_set() or len(finished_ranges) < range_count:
+            # The pre-sized .part is zero-filled between ranges: never keep it
+            try:
+                part.unlink()
+            except OSError:
+                pass
+        if self._cancel_event.is_set():
+            monitor_action(f"[!] myrient:segmented:halted {filename}")
+            self._emit_progress(progress_callback, filename, current_pct, "", "HALTED")
+            return {
+                "url": url,
+                "dest_path": str(dest),
+                "bytes": 0,
+                "halted": True,
+                "status": "HALTED",
+                "backend": "native",
+                "transport": "http-segmented",
+            }
+        if len(finished_ranges) < range_count:
+            monitor_action(f"[!] myrient:segmented:fallback {filename} :: {error or 'ranges left unfetched'}")
+            return None
+        try:
+            os.replace(part, dest)
+        except OSError as exc:
+            monitor_action(f"[!] myrient:segmented:fallback {filename} :: {exc}")
+            try:
+                part.unlink()
+            except OSError:
+                pass
+            return None
+        monitor_action(f"[*] myrient:segmented:done {filename} bytes={total}")
+        self._emit_progress(progress_callback, filename, 100.0, "", "DONE")
+        return {
+            "url": url,
+            "dest_path": str(dest),
+            "bytes": total,
+            "status": "DONE",
+            "backend": "native",
+            "transport": "http-segmented",
+        }
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _direct_io_enabled() -> bool:
+        raw = os.getenv("R0MM_DIRECT_IO", "").strip().lower()
+        return raw in {"1", "true", "yes", "on"} and hasattr(os, "O_DIRECT")
+
+    def _open_download_file(self, dest: Path):
+        """Destination for the native downloader; O_DIRECT when R0MM_DIRECT_IO is set."""
+        if self._direct_io_enabled():
+            try:
+                return _DirectFileWriter(str(dest))
+            except OSError:
+                # Filesystems such as tmpfs or some FUSE mounts reject O_DIRECT
+                pass
+        return open(dest, "wb")
+
+    def _open_range_file(self, dest: Path, offset: int):
+        """Handle writing dest from offset onwards; O_DIRECT when R0MM_DIRECT_IO is set."""
+        if self._direct_io_enabled():
+            try:
+                return _DirectFileWriter(str(dest), offset)
+            except OSError:
+                pass
+        fh = open(dest, "r+b")
+        fh.seek(offset)
+        return fh
+
+    @contextmanager
+    def _open_http_stream(self, url: str):
+        """GET url and yield (headers, read); raises on HTTP or network errors."""
+        if REQUESTS_AVAILABLE:
+            resp = self._http_session().get(
+                url,
+                headers={"User-Agent": self._user_agent},
+                stream=True,
+                timeout=self._http_timeout_s,
+            )
+            try:
+                resp.raise_for_status()
+                # Raw body bytes, like urllib: no transparent Content-Encoding decoding
+                yield resp.headers, resp.raw.read
+            finally:
+                resp.close()
+            return
+        with urllib.request.urlopen(self._request(url), timeout=self._http_timeout_s) as resp:
+            yield resp.headers, resp.read
+
+    def _download_via_http(
+        self,
+        *,
+        url: str,
+        dest: Path,
+        filename: str,
+        progress_callback: Optional[Callable[[str, float, str, str], None]],
+        remote_size: Optional[int],
+        initial_pct: float,
+    ) -> dict:
+        """
+        Stream the file in-process: no subprocess per file, and progress comes
+        from the bytes actually written instead of polling the file size.
+        """
+        monitor_action(f"[*] myrient:http:start {filename}")
+        current_pct = initial_pct
+        current_speed = "0 B/s"
+        bytes_written = 0
+        halted = False
+        try:
+            with self._open_http_stream(url) as (headers, read):
+                total = remote_size if isinstance(remote_size, int) and remote_size > 0 else None
+                if total is None:
+                    try:
+                        total = int(headers.get("Content-Length") or 0) or None
+                    except ValueError:
+                        total = None
+                speed_window = _SpeedWindow()
+                next_tick = 0.0
+                self._emit_progress(progress_callback, filename, current_pct, current_speed, "DOWNLOADING")
+                with self._open_download_file(dest) as fh:
+                    while True:
+                        if self._cancel_event.is_set():
+                            halted = True
+                            break
+                        chunk = read(self._http_chunk_size)
+                        if not chunk:
+                            break
+                        fh.write(chunk)
+                        bytes_written += len(chunk)
+
+                        now = time.monotonic()
+                        if now < next_tick:
+                            continue
+                        next_tick = now + 0.25
+                        current_speed = self._format_speed(speed_window.push(now, bytes_written))
+                        if total:
+                            current_pct = max(0.0, min(100.0, (bytes_written / total) * 100.0))
+                        self._emit_progress(progress_callback, filename, current_pct, current_speed, "DOWNLOADING")
+        except Exception as exc:
+            error_line = str(exc) or exc.__class__.__name__
+            monitor_action(f"[!] myrient:http:error {filename} :: {error_line}")
+            self._emit_progress(progress_callback, filename, current_pct if current_pct > 0 else 0.0, error_line, "ERROR")
+            return {
+                "url": url,
+                "dest_path": str(dest),
+                "error": error_line,
+                "status": "ERROR",
+                "backend": "native",
+                "transport": "http-native",
+            }
+
+        if halted:
+            monitor_action(f"[!] myrient:http:halted {filename}")
+            self._emit_progress(progress_callback, filename, current_pct, "", "HALTED")
+            return {
+                "url": url,
+                "dest_path": str(dest),
+                "bytes": bytes_written,
+                "halted": True,
+                "status": "HALTED",
+                "backend": "native",
+                "transport": "http-native",
+            }
+        if total and bytes_written < total:
+            # An early EOF is a dropped connection, not a finished file
+            error_line = f"connection closed after {bytes_written} of {total} bytes"
+            monitor_action(f"[!] myrient:http:error {filename} :: {error_line}")
+            self._emit_progress(progress_callback, filename, current_pct if current_pct > 0 else 0.0, error_line, "ERROR")
+            return {
+                "url": url,
+                "dest_path": str(dest),
+                "bytes": bytes_written,
+                "error": error_line,
+                "status": "ERROR",
+                "backend": "native",
+                "transport": "http-native",
+            }
+        monitor_action(f"[*] myrient:http:done {filename} bytes={bytes_written}")
+        self._emit_progress(progress_callback, filename, 100.0, "", "DONE")
+        return {
+            "url": url,
+            "dest_path": str(dest),
+            "bytes": bytes_written,
+            "status": "DONE",
+            "backend": "native",
+            "transport": "http-native",
+        }
+
+    def _head_headers(self, url: str):
+        """HEAD url and return its response headers; raises on HTTP or network errors."""
+        if REQUESTS_AVAILABLE:
+            resp = self._http_session().head(
+                url,
+                headers={"User-Agent": self._user_agent},
+                timeout=3,
+                allow_redirects=True,
+            )
+            resp.raise_for_status()
+            return resp.headers
+        with urllib.request.urlopen(self._request(url, method="HEAD"), timeout=3) as resp:
+            return resp.headers
+
+    def _probe_remote_size(self, url: str, local_size: int) -> Optional[int]:
+        """
+        Remote size via a GET of the last local byte, or None if unknown.
+
+        One round trip on the download connection: a 206 carries the total in
+        Content-Range and its single-byte body keeps the connection reusable.
+        """
+        probe = self._range_probe(url, local_size - 1)
+        return probe[1] if probe is not None else None
+
+    def _range_probe(self, url: str, offset: int) -> Optional[Tuple[int, Optional[int]]]:
+        """GET the single byte at offset; (HTTP status, total size or None), or None on failure."""
+        range_headers = {"Range": f"bytes={offset}-{offset}"}
+        try:
+            if REQUESTS_AVAILABLE:
+                resp = self._http_session().get(
+                    url,
+                    headers={"User-Agent": self._user_agent, **range_headers},
+                    stream=True,
+                    timeout=3,
+                )
+                try:
+                    status, headers = resp.status_code, resp.headers
+                    if status != 200:
+                        resp.content  # tiny body; reading it returns the connection to the pool
+                finally:
+                    resp.close()
+            else:
+                try:
+                    with urllib.request.urlopen(self._request(url, headers=range_headers), timeout=3) as resp:
+                        status, headers = resp.status, resp.headers
+                except urllib.error.HTTPError as exc:
+                    status, headers = exc.code, exc.headers
+        except Exception:
+            return None
+
+        if status in (206, 416):
+            # "bytes 12-12/1234" or, past the end, "bytes */1234"
+            total = (headers.get("Content-Range") or "").rpartition("/")[2].strip()
+            return status, (int(total) if total.isdigit() else None)
+        if status == 200:
+            # Range ignored: the full-body length is the size
+            try:
+                return status, (int(headers.get("Content-Length") or 0) or None)
+            except ValueError:
+                return status, None
+        return status, None
 
     def check_remote_file(self, url: str, local_path: str) -> dict:
         """Passive inspection via HEAD to compare local and remote metadata."""
@@ -603,35 +1514,33 @@ class MyrientFetcher:
             "error": "",
         }
 
-        path = Path(local_path)
         try:
-            if path.exists() and path.is_file():
+            st = os.stat(local_path)
+            if S_ISREG(st.st_mode):
                 result["exists_local"] = True
-                result["local_size"] = int(path.stat().st_size)
+                result["local_size"] = int(st.st_size)
         except OSError:
             pass
 
-        req = self._request(url, method="HEAD")
         try:
-            with urllib.request.urlopen(req, timeout=3) as resp:
-                headers = resp.headers
-                cl = headers.get("Content-Length")
-                if cl is not None:
-                    try:
-                        result["remote_size"] = int(cl)
-                    except ValueError:
-                        result["remote_size"] = None
-                lm = (headers.get("Last-Modified") or "").strip()
-                if lm:
-                    result["remote_last_modified"] = lm
-                    try:
-                        dt = parsedate_to_datetime(lm)
-                        result["remote_last_modified_ts"] = dt.timestamp()
-                    except Exception:
-                        result["remote_last_modified_ts"] = None
+            headers = self._head_headers(url)
         except Exception as exc:
             result["error"] = str(exc)
             return result
+        cl = headers.get("Content-Length")
+        if cl is not None:
+            try:
+                result["remote_size"] = int(cl)
+            except ValueError:
+                result["remote_size"] = None
+        lm = (headers.get("Last-Modified") or "").strip()
+        if lm:
+            result["remote_last_modified"] = lm
+            try:
+                dt = parsedate_to_datetime(lm)
+                result["remote_last_modified_ts"] = dt.timestamp()
+            except Exception:
+                result["remote_last_modified_ts"] = None
 
         remote_size = result.get("remote_size")
         if isinstance(remote_size, int) and remote_size >= 0:
@@ -643,6 +1552,8 @@ class MyrientFetcher:
         url: str,
         dest_path: str,
         progress_callback: Optional[Callable[[str, float, str, str], None]] = None,
+        *,
+        _remote_size: Optional[int] = None,
     ) -> concurrent.futures.Future:
         filename = self._filename_for(url, dest_path)
         with self._lock:
@@ -652,9 +1563,12 @@ class MyrientFetcher:
                 self._progress_emit_state.clear()
         self._emit_progress(progress_callback, filename, 0.0, "", "QUEUED")
 
-        future = self._executor.submit(self.download_target, url, dest_path, progress_callback)
+        future: concurrent.futures.Future = concurrent.futures.Future()
         with self._lock:
             self._futures[future] = {"url": url, "dest_path": dest_path, "filename": filename}
+        self._ensure_workers()
+        kwargs = {"_remote_size": _remote_size} if _remote_size is not None else {}
+        self._job_queue.put((future, (url, dest_path, progress_callback), kwargs))
 
         def _cleanup(done_future: concurrent.futures.Future) -> None:
             with self._lock:
@@ -663,48 +1577,122 @@ class MyrientFetcher:
         future.add_done_callback(_cleanup)
         return future
 
+    def submit_download_batch(
+        self,
+        targets: List[Tuple[str, str]],
+        progress_callback: Optional[Callable[[str, float, str, str], None]] = None,
+    ) -> List[concurrent.futures.Future]:
+        """
+        Queue (url, dest_path) pairs, size-probing existing local files concurrently first.
+
+        Files already complete resolve immediately and never occupy a worker, so
+        re-queueing a mostly downloaded set costs about one round trip, not one per file.
+        """
+        local_sizes: Dict[int, int] = {}
+        probe_urls: Dict[int, str] = {}
+        for index, (url, dest_path) in enumerate(targets):
+            local_size = _file_size(dest_path)
+            if local_size > 0:
+                local_sizes[index] = local_size
+                probe_urls[index] = self._canonicalize_myrient_url(str(url or ""))
+        remote_sizes: Dict[int, Optional[int]] = {}
+        if probe_urls:
+            # Probes are connections too: each runs under its host's slot, like a transfer
+            workers = min(self._batch_probe_workers, self._per_host, len(probe_urls))
+
+            def probe_size(probe_url: str, local_size: int) -> Optional[int]:
+                with self._host_slot(probe_url):
+                    return self._probe_remote_size(probe_url, local_size)
+
+            with concurrent.futures.ThreadPoolExecutor(max_workers=workers, thread_name_prefix="R0MM-Myrient-probe") as pool:
+                probes = {
+                    index: pool.submit(probe_size, probe_url, local_sizes[index])
+                    for index, probe_url in probe_urls.items()
+                }
+                for index, probe in probes.items():
+                    try:
+                        remote_sizes[index] = probe.result()
+                    except Exception:
+                        remote_sizes[index] = None
+
+        futures: List[concurrent.futures.Future] = []
+        for index, (url, dest_path) in enumerate(targets):
+            remote_size = remote_sizes.get(index)
+            local_size = local_sizes.get(index, 0)
+            if isinstance(remote_size, int) and remote_size > 0 and local_size == remote_size:
+                filename = self._filename_for(url, dest_path)
+                monitor_action(f"[*] myrient:batch:skip {filename} (already complete)")
+                self._emit_progress(progress_callback, filename, 100.0, "", "DONE")
+                future: concurrent.futures.Future = concurrent.futures.Future()
+                future.set_result({
+                    "url": probe_urls[index],
+                    "dest_path": str(Path(dest_path)),
+                    "bytes": local_size,
+                    "resumed": False,
+                    "skipped": True,
+                    "status": "DONE",
+                })
+                futures.append(future)
+                continue
+            # A failed probe leaves the check to the worker, as for a single download
+            futures.append(
+                self.submit_download(
+                    url,
+                    dest_path,
+                    progress_callback,
+                    _remote_size=remote_size,
+                )
+            )
+        return futures
+
     def download_target(
         self,
         url: str,
         dest_path: str,
         progress_callback: Optional[Callable[[str, float, str, str], None]] = None,
         *,
+        _remote_size: Optional[int] = None,
         _attempt: int = 0,
         _use_troubleshoot_profile: bool = False,
         _preserve_myrient_host: bool = False,
-        _tried_myrient_hosts: Tuple[str, ...] = (),
+        _hopper: Optional[_HostHopper] = None,
     ) -> dict:
         original_url = str(url or "")
         canonical_url = original_url if _preserve_myrient_host else self._canonicalize_myrient_url(original_url)
         if canonical_url and canonical_url != original_url:
             try:
-                old_host = urlsplit(original_url).netloc
-                new_host = urlsplit(canonical_url).netloc
+                old_host = _MyrientURL.parse(original_url).parts.netloc
+                new_host = _MyrientURL.parse(canonical_url).parts.netloc
             except Exception:
                 old_host = original_url
                 new_host = canonical_url
             monitor_action(f"[*] myrient:rclone:rewrite_host {old_host} -> {new_host}")
         url = canonical_url or original_url
+        try:
+            target: Union[str, _MyrientURL] = _MyrientURL.parse(url)
+        except Exception:
+            target = url
         filename = self._filename_for(url, dest_path)
         dest = Path(dest_path)
+        dest_str = str(dest)
         dest.parent.mkdir(parents=True, exist_ok=True)
 
         if self._cancel_event.is_set():
             self._emit_progress(progress_callback, filename, 0.0, "", "HALTED")
-            return {"url": url, "dest_path": str(dest), "halted": True}
+            return {"url": url, "dest_path": dest_str, "halted": True}
 
-        try:
-            local_size = int(dest.stat().st_size) if dest.exists() and dest.is_file() else 0
-        except OSError:
-            local_size = 0
-        remote_meta = self.check_remote_file(url, str(dest)) if local_size > 0 else {"remote_size": None}
-        remote_size = remote_meta.get("remote_size")
+        local_size = _file_size(dest_str)
+        # Nothing local means nothing to skip: the transfer itself reports the size
+        if _remote_size is not None:
+            remote_size: Optional[int] = _remote_size
+        else:
+            remote_size = self._probe_remote_size(url, local_size) if local_size > 0 else None
         if isinstance(remote_size, int) and remote_size > 0 and local_size == remote_size:
             monitor_action(f"[*] myrient:rclone:skip {filename} (already complete)")
             self._emit_progress(progress_callback, filename, 100.0, "", "DONE")
             return {
                 "url": url,
-                "dest_path": str(dest),
+                "dest_path": dest_str,
                 "bytes": local_size,
                 "resumed": False,
                 "skipped": True,
@@ -715,35 +1703,55 @@ class MyrientFetcher:
         if isinstance(remote_size, int) and remote_size > 0 and local_size > 0:
             initial_pct = (min(local_size, remote_size) / remote_size) * 100.0
 
-        # For rclone-backed transfers we do a lightweight HEAD to support percent/skip logic.
-        if not isinstance(remote_size, int) or remote_size <= 0:
-            remote_meta = self.check_remote_file(url, str(dest))
-            remote_size = remote_meta.get("remote_size")
-            if isinstance(remote_size, int) and remote_size > 0 and local_size == remote_size:
-                self._emit_progress(progress_callback, filename, 100.0, "", "DONE")
-                return {
-                    "url": url,
-                    "dest_path": str(dest),
-                    "bytes": local_size,
-                    "resumed": False,
-                    "skipped": True,
-                    "status": "DONE",
-                }
+        # Fresh files only: a partial local copy is left for the backends that resume
+        if _attempt == 0 and REQUESTS_AVAILABLE and self._segment_count() > 1 and local_size == 0:
+            # Each range connection takes its own per-host slot
+            segmented = self._download_via_segments(
+                url=url,
+                dest=dest,
+                filename=filename,
+                progress_callback=progress_callback,
+                initial_pct=initial_pct,
+            )
+            if segmented is not None:
+                return segmented
 
-        is_myrient = self._is_myrient_url(url)
+        if self._use_native_backend():
+            try:
+                with self._host_slot(target):
+                    native = self._download_via_http(
+                        url=url,
+                        dest=dest,
+                        filename=filename,
+                        progress_callback=progress_callback,
+                        remote_size=remote_size if isinstance(remote_size, int) and remote_size > 0 else None,
+                        initial_pct=initial_pct,
+                    )
+            except _TransferHalted:
+                return self._halted_result(url, dest_str, filename, progress_callback, initial_pct)
+            if native.get("status") != "ERROR" or self._cancel_event.is_set():
+                return native
+            try:
+                self._resolve_rclone_binary()
+            except FileNotFoundError:
+                return native
+            # Native was only requested: rclone and its retry ladder get the failed file
+            monitor_action(f"[!] myrient:http:fallback_rclone {filename} :: {native.get('error', '')}")
+
+        is_myrient = self._is_myrient_url(target)
         use_troubleshoot_profile = bool(_use_troubleshoot_profile or is_myrient)
         rclone_transport = "copyurl"
         if is_myrient:
             cmd = self._build_rclone_http_copyto_command(
-                url,
-                str(dest),
+                target,
+                dest_str,
                 troubleshoot_profile=use_troubleshoot_profile,
             )
             rclone_transport = "http-copyto"
         else:
             cmd = self._build_rclone_copyurl_command(
                 url,
-                str(dest),
+                dest_str,
                 troubleshoot_profile=use_troubleshoot_profile,
             )
         monitor_action(f"[*] myrient:rclone:start {filename} transport={rclone_transport}")
@@ -752,89 +1760,50 @@ class MyrientFetcher:
             creationflags = int(getattr(subprocess, "CREATE_NO_WINDOW"))
 
         proc: Optional[subprocess.Popen] = None
-        rclone_output = ""
+        rclone_output: List[str] = []
         current_pct = initial_pct
-        current_speed = "0 B/s"
         try:
-            proc = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                stdin=subprocess.DEVNULL,
-                text=True,
-                encoding="utf-8",
-                errors="replace",
-                bufsize=1,
-                creationflags=creationflags,
-            )
-            with self._lock:
-                self._active_processes[str(dest)] = proc
-
-            # Poll local file growth instead of parsing rclone progress text to avoid stdout pipe stalls.
-            speed_window = deque([(time.monotonic(), int(local_size))], maxlen=32)
-            self._emit_progress(progress_callback, filename, current_pct, current_speed, "DOWNLOADING")
-
-            while True:
-                if self._cancel_event.is_set():
-                    self._terminate_subprocess(proc)
-                rc = proc.poll()
-                try:
-                    bytes_now = int(dest.stat().st_size) if dest.exists() and dest.is_file() else 0
-                except OSError:
-                    bytes_now = 0
-                now = time.monotonic()
-                speed_window.append((now, bytes_now))
-                while len(speed_window) >= 2 and (now - speed_window[0][0]) > 1.5:
-                    speed_window.popleft()
-
-                speed_bps = 0.0
-                if len(speed_window) >= 2:
-                    delta_t = speed_window[-1][0] - speed_window[0][0]
-                    delta_b = speed_window[-1][1] - speed_window[0][1]
-                    if delta_t > 0 and delta_b >= 0:
-                        speed_bps = delta_b / delta_t
-                if speed_bps >= 1024 * 1024:
-                    current_speed = f"{speed_bps / (1024 * 1024):.1f} MiB/s"
-                elif speed_bps >= 1024:
-                    current_speed = f"{speed_bps / 1024:.0f} KiB/s"
-                else:
-                    current_speed = f"{speed_bps:.0f} B/s"
-
-                if isinstance(remote_size, int) and remote_size > 0:
-                    current_pct = max(0.0, min(100.0, (bytes_now / remote_size) * 100.0))
-                self._emit_progress(progress_callback, filename, current_pct, current_speed, "DOWNLOADING")
-
-                if rc is not None:
-                    break
-                time.sleep(0.25)
-
-            return_code = int(proc.wait())
-            try:
-                out, _ = proc.communicate(timeout=0.25)
-            except Exception:
-                out = ""
-            rclone_output = str(out or "")
+            with self._host_slot(target):
+                proc = subprocess.Popen(
+                    cmd,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    stdin=subprocess.DEVNULL,
+                    bufsize=0,
+                    creationflags=creationflags,
+                )
+                transfer = _TransferState(
+                    proc,
+                    dest_str,
+                    filename,
+                    progress_callback,
+                    remote_size if isinstance(remote_size, int) else None,
+                    local_size,
+                    current_pct,
+                )
+                return_code, rclone_output = self._drive_subprocess_progress(
+                    transfer,
+                    lambda: self._read_rclone_output(transfer),
+                )
+                current_pct = transfer.percent
             if self._cancel_event.is_set():
                 monitor_action(f"[!] myrient:rclone:halted {filename}")
                 self._emit_progress(progress_callback, filename, current_pct, "", "HALTED")
                 return {
                     "url": url,
-                    "dest_path": str(dest),
-                    "bytes": int(dest.stat().st_size) if dest.exists() and dest.is_file() else 0,
+                    "dest_path": dest_str,
+                    "bytes": _file_size(dest_str),
                     "halted": True,
                     "status": "HALTED",
                 }
 
             if return_code == 0:
-                try:
-                    bytes_written = int(dest.stat().st_size) if dest.exists() and dest.is_file() else 0
-                except OSError:
-                    bytes_written = 0
+                bytes_written = _file_size(dest_str)
                 monitor_action(f"[*] myrient:rclone:done {filename} bytes={bytes_written} transport={rclone_transport}")
                 self._emit_progress(progress_callback, filename, 100.0, "", "DONE")
                 return {
                     "url": url,
-                    "dest_path": str(dest),
+                    "dest_path": dest_str,
                     "bytes": bytes_written,
                     "resumed": bool(local_size > 0),
                     "status": "DONE",
@@ -850,9 +1819,10 @@ class MyrientFetcher:
             should_retry = (not self._cancel_event.is_set() and self._is_retryable_transport_error(error_line))
             if should_retry and _attempt == 0 and not use_troubleshoot_profile and is_myrient:
                 monitor_action(f"[!] myrient:rclone:retry_profile {filename} :: enabling troubleshoot profile")
+                self._sleep_backoff(_attempt, error_line, filename)
                 return self.download_target(
                     url,
-                    str(dest),
+                    dest_str,
                     progress_callback,
                     _attempt=_attempt + 1,
                     _use_troubleshoot_profile=True,
@@ -861,55 +1831,44 @@ class MyrientFetcher:
                 retry_url = self._myrient_mirror_fallback_url(url)
             if retry_url and retry_url != url:
                 try:
-                    old_host = urlsplit(url).netloc
-                    new_host = urlsplit(retry_url).netloc
+                    old_host = _MyrientURL.parse(url).parts.netloc
+                    new_host = _MyrientURL.parse(retry_url).parts.netloc
                 except Exception:
                     old_host = url
                     new_host = retry_url
                 monitor_action(f"[!] myrient:rclone:retry_mirror {filename} :: {old_host} -> {new_host}")
+                self._sleep_backoff(_attempt, error_line, filename)
                 return self.download_target(
                     retry_url,
-                    str(dest),
+                    dest_str,
                     progress_callback,
                     _attempt=_attempt + 1,
                     _use_troubleshoot_profile=True,
                 )
             if should_retry and is_myrient and _attempt < 3:
+                hopper = _hopper or _HostHopper()
                 failed_rclone_url = self._extract_rclone_error_url(error_line)
-                attempted_hosts = set(h.lower() for h in _tried_myrient_hosts if str(h or "").strip())
-                for candidate in (url, failed_rclone_url):
-                    try:
-                        host = (urlsplit(candidate).netloc or "").split("@")[-1].split(":")[0].lower()
-                    except Exception:
-                        host = ""
-                    if host:
-                        attempted_hosts.add(host)
-                retry_host_hop_url = self._myrient_host_hop_fallback_url(
-                    url,
-                    error_line,
-                    tried_hosts=tuple(sorted(attempted_hosts)),
-                )
+                retry_host_hop_url = hopper.next_url(url, error_line)
                 if retry_host_hop_url and retry_host_hop_url != url:
                     try:
-                        old_host = (urlsplit(failed_rclone_url or url).netloc or urlsplit(url).netloc)
-                        new_host = urlsplit(retry_host_hop_url).netloc
+                        old_host = (
+                            _MyrientURL.parse(failed_rclone_url or url).parts.netloc
+                            or _MyrientURL.parse(url).parts.netloc
+                        )
+                        new_host = _MyrientURL.parse(retry_host_hop_url).parts.netloc
                     except Exception:
                         old_host = failed_rclone_url or url
                         new_host = retry_host_hop_url
                     monitor_action(f"[!] myrient:rclone:retry_host_hop {filename} :: {old_host} -> {new_host}")
-                    hop_hosts = set(attempted_hosts)
-                    try:
-                        hop_hosts.add((urlsplit(retry_host_hop_url).netloc or "").split("@")[-1].split(":")[0].lower())
-                    except Exception:
-                        pass
+                    self._sleep_backoff(_attempt, error_line, filename)
                     return self.download_target(
                         retry_host_hop_url,
-                        str(dest),
+                        dest_str,
                         progress_callback,
                         _attempt=_attempt + 1,
                         _use_troubleshoot_profile=True,
                         _preserve_myrient_host=True,
-                        _tried_myrient_hosts=tuple(sorted(h for h in hop_hosts if h)),
+                        _hopper=hopper,
                     )
             if should_retry and is_myrient and _attempt >= 3 and self._ps_iwr_fallback_enabled():
                 fallback_source_url = self._extract_rclone_error_url(error_line) or url
@@ -931,38 +1890,54 @@ class MyrientFetcher:
                         error_line = f"{error_line} | ps_iwr: {ps_error}"
             monitor_action(f"[!] myrient:rclone:error {filename} :: {error_line}")
             self._emit_progress(progress_callback, filename, current_pct if current_pct > 0 else 0.0, error_line, "ERROR")
-            return {"url": url, "dest_path": str(dest), "error": error_line, "status": "ERROR", "backend": "rclone", "transport": rclone_transport}
+            return {"url": url, "dest_path": dest_str, "error": error_line, "status": "ERROR", "backend": "rclone", "transport": rclone_transport}
+        except _TransferHalted:
+            # Halted while waiting for a host slot, before rclone or PowerShell started
+            return self._halted_result(url, dest_str, filename, progress_callback, current_pct)
         except FileNotFoundError as exc:
             monitor_action(f"[!] myrient:rclone:error {filename} :: {exc}")
             self._emit_progress(progress_callback, filename, 0.0, str(exc), "ERROR")
-            return {"url": url, "dest_path": str(dest), "error": str(exc), "status": "ERROR", "backend": "rclone", "transport": "copyurl"}
+            return {"url": url, "dest_path": dest_str, "error": str(exc), "status": "ERROR", "backend": "rclone", "transport": "copyurl"}
         except Exception as exc:
             monitor_action(f"[!] myrient:rclone:error {filename} :: {exc}")
             self._emit_progress(progress_callback, filename, current_pct if current_pct > 0 else 0.0, str(exc), "ERROR")
-            return {"url": url, "dest_path": str(dest), "error": str(exc), "status": "ERROR", "backend": "rclone", "transport": "copyurl"}
+            return {"url": url, "dest_path": dest_str, "error": str(exc), "status": "ERROR", "backend": "rclone", "transport": "copyurl"}
         finally:
             if proc is not None:
                 if self._cancel_event.is_set():
                     self._terminate_subprocess(proc)
-                with self._lock:
-                    self._active_processes.pop(str(dest), None)
 
     def halt(self) -> dict:
         """Gracefully stop traffic: cancel queued jobs, signal active jobs to stop."""
         self._cancel_event.set()
         with self._lock:
-            items = list(self._futures.items())
+            futures = dict.fromkeys(self._futures)
             self._futures.clear()
-            active_procs = list(self._active_processes.values())
+            active_procs = [t.proc for t in self._transfers.values()]
+            workers, self._workers = self._workers, []
+        # Drop queued jobs so idle workers do not even dequeue them
+        while True:
+            try:
+                job = self._job_queue.get_nowait()
+            except queue.Empty:
+                break
+            if job is not None:
+                futures.setdefault(job[0], None)
+        for _worker in workers:
+            self._job_queue.put(None)
         cancelled = 0
         running = 0
-        for future, _meta in items:
+        for future in futures:
             if future.cancel():
                 cancelled += 1
             elif future.running():
                 running += 1
         for proc in active_procs:
             self._terminate_subprocess(proc)
+        # Idle workers exit at once; busy ones once their job notices the cancel flag
+        deadline = time.monotonic() + self._halt_join_s
+        for worker in workers:
+            worker.join(max(0.0, deadline - time.monotonic()))
         return {"success": True, "cancelled": cancelled, "active_signalled": running}
 
 
@@ -985,12 +1960,19 @@ class CoreService:
         self.blindmatch_system = ""
         self.settings = load_settings()
         self._scan_thread: Optional[threading.Thread] = None
-        self._myrient_fetcher = MyrientFetcher()
+        self._myrient_fetcher = self._new_myrient_fetcher()
         self._local_overlay_dir = Path(DATS_DIR) / "_local"
         self._local_overlay_path = self._local_overlay_dir / "R0MM - Local Overrides.xml"
         self._local_overlay_name = "R0MM - Local Overrides"
         self._apply_settings()
 
+    def _new_myrient_fetcher(self) -> MyrientFetcher:
+        downloads = self.settings.get("downloads", {})
+        if not isinstance(downloads, dict):
+            downloads = {}
+        # MyrientFetcher clamps both to the Myrient connection policy
+        return MyrientFetcher(parallel=downloads.get("parallel"), per_host=downloads.get("per_host"))
+
     def _apply_settings(self) -> None:
         profile = get_effective_profile(self.settings)
         configure_selection_policy({
@@ -1090,6 +2072,54 @@ class CoreService:
         except Exception as exc:
             return {"error": str(exc)}
 
+    def load_dats(self, filepaths: List[str]) -> List[dict]:
+        """Load several DATs; returns one load_dat-style result per path, in order.
+
+        Parsing is CPU-bound, so multiple DATs are parsed in worker
+        processes. They are still registered in argument order (first-loaded
+        match wins) and rematched once at the end.
+        """
+        parsed: List[Any] = [None] * len(filepaths)
+        workers = min(len(filepaths), os.cpu_count() or 1)
+        if workers > 1:
+            try:
+                with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+                    futures = {
+                        pool.submit(DATParser.parse_with_info, path): i
+                        for i, path in enumerate(filepaths)
+                        if path and os.path.exists(path)
+                    }
+                    for future in concurrent.futures.as_completed(futures):
+                        try:
+                            parsed[futures[future]] = future.result()
+                        except concurrent.futures.process.BrokenProcessPool:
+                            raise
+                        except Exception as exc:
+                            parsed[futures[future]] = exc
+            except (OSError, concurrent.futures.process.BrokenProcessPool):
+                # No worker processes available here: parse in-process below
+                parsed = [None] * len(filepaths)
+
+        results: List[dict] = []
+        loaded = False
+        for i, path in enumerate(filepaths):
+            if not path or not os.path.exists(path):
+                results.append({"error": "File not found"})
+                continue
+            try:
+                outcome = parsed[i] if parsed[i] is not None else DATParser.parse_with_info(path)
+                if isinstance(outcome, Exception):
+                    raise outcome
+                dat_info, roms = outcome
+                self.multi_matcher.add_dat(dat_info, roms)
+                loaded = True
+                results.append({"success": True, "dat": dat_info.to_dict()})
+            except Exception as exc:
+                results.append({"error": str(exc)})
+        if loaded:
+            self._rematch_all()
+        return results
+
     def remove_dat(self, dat_id: str) -> dict:
         if not dat_id:
             return {"error": "dat_id required"}
@@ -1236,18 +2266,20 @@ class CoreService:
         return str(value or "").strip()
 
     @staticmethod
-    def _overlay_match_key(*, crc32: str, size: int, md5: str, sha1: str) -> str:
+    @functools.lru_cache(maxsize=65536)
+    def _overlay_match_key(*, crc32: str, size: int, md5: str, sha1: str) -> Tuple[Any, ...]:
+        # Cached: every overlay rebuild re-keys the same existing ROMs
         crc = str(crc32 or "").strip().lower()
-        md5v = str(md5 or "").strip().lower()
-        sha1v = str(sha1 or "").strip().lower()
         safe_size = max(0, int(size or 0))
         if crc and safe_size > 0:
-            return f"crc:{crc}:{safe_size}"
+            return ("crc", crc, safe_size)
+        md5v = str(md5 or "").strip().lower()
         if md5v:
-            return f"md5:{md5v}"
+            return ("md5", md5v)
+        sha1v = str(sha1 or "").strip().lower()
         if sha1v:
-            return f"sha1:{sha1v}"
-        return ""
+            return ("sha1", sha1v)
+        return ()
 
     @staticmethod
     def _clean_title_token(text: str) -> str:
@@ -1450,7 +2482,7 @@ class CoreService:
             by_scan_id[str(scanned.filename)] = scanned
 
         existing_roms = self._load_local_overlay_roms()
-        indexed: Dict[str, ROMInfo] = {}
+        indexed: Dict[Tuple[Any, ...], ROMInfo] = {}
         for rom in existing_roms:
             key = self._overlay_match_key(
                 crc32=rom.crc32,
@@ -1590,7 +2622,7 @@ class CoreService:
             return {"error": f"failed to read base DAT: {exc}"}
 
         # Deduplicate by hash key
-        existing: Dict[str, ROMInfo] = {}
+        existing: Dict[Tuple[Any, ...], ROMInfo] = {}
         for rom in base_roms:
             key = self._overlay_match_key(
                 crc32=rom.crc32,
@@ -3080,7 +4112,7 @@ if ($killed.Count -gt 0) { [string]::Join(',', $killed) }
             if not raw_url or not raw_dest:
                 errors.append({"url": raw_url, "dest_path": raw_dest, "error": "url and dest_path are required"})
                 continue
-            filename = Path(raw_dest).name or Path(urlsplit(raw_url).path).name or "download.bin"
+            filename = Path(raw_dest).name or Path(_MyrientURL.parse(raw_url).parts.path).name or "download.bin"
             accepted.append({"url": raw_url, "dest_path": raw_dest, "filename": filename})
             url_lines.append(raw_url)
             desc_lines.append(filename)
@@ -3306,24 +4338,33 @@ if ($killed.Count -gt 0) { [string]::Join(',', $killed) }
     ) -> dict:
         if not targets:
             return {"error": "targets required"}
+        fetcher = self._myrient_fetcher
         try:
-            rclone_path = self._myrient_fetcher._resolve_rclone_binary()
+            if fetcher._use_native_backend():
+                backend, rclone_path = "native", ""
+            else:
+                backend, rclone_path = "rclone", fetcher._resolve_rclone_binary()
         except Exception as exc:
             return {"error": str(exc)}
         queued = 0
         errors: List[dict] = []
+        batch: List[Tuple[str, str]] = []
         for target in targets:
             if not isinstance(target, dict):
                 errors.append({"target": target, "error": "invalid target"})
                 continue
             url = str(target.get("url", "") or "").strip()
             dest = str(target.get("dest_path", "") or "").strip()
-            res = self.myrient_queue_download(url, dest, progress_callback=progress_callback)
-            if res.get("error"):
-                errors.append({"url": url, "dest_path": dest, "error": res["error"]})
-            else:
-                queued += 1
-        return {"success": queued > 0 and not errors, "queued": queued, "errors": errors, "backend": "rclone", "rclone": rclone_path}
+            if not url or not dest:
+                errors.append({"url": url, "dest_path": dest, "error": "url and dest_path are required"})
+                continue
+            batch.append((url, dest))
+        if batch:
+            try:
+                queued = len(fetcher.submit_download_batch(batch, progress_callback=progress_callback))
+            except Exception as exc:
+                errors.extend({"url": url, "dest_path": dest, "error": str(exc)} for url, dest in batch)
+        return {"success": queued > 0 and not errors, "queued": queued, "errors": errors, "backend": backend, "rclone": rclone_path}
 
     def myrient_catalog_presets(self) -> dict:
         """
@@ -3406,7 +4447,8 @@ if ($killed.Count -gt 0) { [string]::Join(',', $killed) }
             if href in {"./"}:
                 continue
             full_url = urljoin(base, href)
-            full_url = MyrientFetcher._canonicalize_myrient_url(full_url)
+            # Uncached: listing entries would only crowd download URLs out of the parse cache
+            full_url = MyrientFetcher._canonicalize_myrient_url(_MyrientURL.split(full_url))
             parsed = urlsplit(full_url)
             name = unquote(Path(parsed.path.rstrip("/")).name)
             if href == "../":
@@ -3569,7 +4611,7 @@ if ($killed.Count -gt 0) { [string]::Join(',', $killed) }
             res = old_fetcher.halt()
         finally:
             # New fetcher instance lets future queues proceed after a halt without inheriting the cancel flag.
-            self._myrient_fetcher = MyrientFetcher()
+            self._myrient_fetcher = self._new_myrient_fetcher()
         return res
 
     # Organization
@@ -3629,8 +4671,9 @@ if ($killed.Count -gt 0) { [string]::Join(',', $killed) }
         collection = Collection(
             name=name,
             dat_infos=self.multi_matcher.get_dat_list(),
-            identified=[s.to_dict() for s in self.identified],
-            unidentified=[s.to_dict() for s in self.unidentified],
+            # ScannedFile entries are converted one at a time while saving
+            identified=list(self.identified),
+            unidentified=list(self.unidentified),
             settings=self.settings,
         )
         path = self.collection_manager.save(collection)
@@ -277,24 +277,29 @@ class MultiROMMatcher:
 
         return identified, unidentified
 
+    def _group_by_dat(self, identified: List[ScannedFile]) -> Dict[str, List[ScannedFile]]:
+        """Split identified files by the DAT of their match in a single pass."""
+        groups = {dat_id: [] for dat_id in self.matchers}
+        for f in identified:
+            if f.matched_rom:
+                group = groups.get(f.matched_rom.dat_id)
+                if group is not None:
+                    group.append(f)
+        return groups
+
     def get_missing(self, identified: List[ScannedFile]) -> List[ROMInfo]:
         """Return all ROMs missing across all DATs."""
         all_missing = []
+        groups = self._group_by_dat(identified)
         for dat_id, matcher in self.matchers.items():
-            # Filter identified to only those from this DAT
-            dat_identified = [f for f in identified
-                            if f.matched_rom and f.matched_rom.dat_id == dat_id]
-            all_missing.extend(matcher.get_missing(dat_identified))
+            all_missing.extend(matcher.get_missing(groups[dat_id]))
         return all_missing
 
     def get_missing_by_dat(self, identified: List[ScannedFile]) -> Dict[str, List[ROMInfo]]:
         """Return missing ROMs grouped by DAT id."""
-        result = {}
-        for dat_id, matcher in self.matchers.items():
-            dat_identified = [f for f in identified
-                            if f.matched_rom and f.matched_rom.dat_id == dat_id]
-            result[dat_id] = matcher.get_missing(dat_identified)
-        return result
+        groups = self._group_by_dat(identified)
+        return {dat_id: matcher.get_missing(groups[dat_id])
+                for dat_id, matcher in self.matchers.items()}
 
     def get_completeness(self, identified: List[ScannedFile]) -> Dict:
         """Return overall completeness statistics."""
@@ -311,11 +316,10 @@ class MultiROMMatcher:
     def get_completeness_by_dat(self, identified: List[ScannedFile]) -> Dict[str, Dict]:
         """Return per-DAT completeness statistics."""
         result = {}
+        groups = self._group_by_dat(identified)
         for dat_id, matcher in self.matchers.items():
             dat_info = self.dat_infos[dat_id]
-            dat_identified = [f for f in identified
-                            if f.matched_rom and f.matched_rom.dat_id == dat_id]
-            stats = matcher.get_completeness(dat_identified)
+            stats = matcher.get_completeness(groups[dat_id])
             stats['dat_name'] = dat_info.name
             stats['system_name'] = dat_info.system_name
             result[dat_id] = stats
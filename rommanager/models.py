@@ -3,7 +3,7 @@ Data models for R0MM
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Union
 
 
 @dataclass
@@ -194,11 +194,31 @@ class Collection:
     dat_filepaths: List[str] = field(default_factory=list)
     scan_folder: str = ""
     scan_options: Dict[str, bool] = field(default_factory=dict)
-    identified: List[Dict] = field(default_factory=list)
-    unidentified: List[Dict] = field(default_factory=list)
+    # Entries are dicts, or ScannedFile objects converted lazily on save
+    identified: List[Union[Dict, ScannedFile]] = field(default_factory=list)
+    unidentified: List[Union[Dict, ScannedFile]] = field(default_factory=list)
     settings: Dict[str, str] = field(default_factory=dict)
 
-    def to_dict(self) -> Dict:
+    @staticmethod
+    def _iter_file_dicts(files) -> Iterator[Dict]:
+        for f in files:
+            yield f.to_dict() if isinstance(f, ScannedFile) else f
+
+    def iter_identified(self) -> Iterator[Dict]:
+        """Yield identified entries as dicts, one at a time"""
+        return self._iter_file_dicts(self.identified)
+
+    def iter_unidentified(self) -> Iterator[Dict]:
+        """Yield unidentified entries as dicts, one at a time"""
+        return self._iter_file_dicts(self.unidentified)
+
+    def to_dict(self, stream_files: bool = False) -> Dict:
+        """With stream_files, identified/unidentified are left as iterators"""
+        identified = self.iter_identified()
+        unidentified = self.iter_unidentified()
+        if not stream_files:
+            identified = list(identified)
+            unidentified = list(unidentified)
         return {
             'version': 1,
             'name': self.name,
@@ -208,8 +228,8 @@ class Collection:
             'dat_filepaths': self.dat_filepaths,
             'scan_folder': self.scan_folder,
             'scan_options': self.scan_options,
-            'identified': self.identified,
-            'unidentified': self.unidentified,
+            'identified': identified,
+            'unidentified': unidentified,
             'settings': self.settings,
         }
 
@@ -6,6 +6,8 @@ import os
 import hashlib
 import binascii
 import zipfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Callable, Optional
 
@@ -16,6 +18,10 @@ class FileScanner:
     """Scans files and calculates checksums"""
     
     BUFFER_SIZE = 65536  # 64KB chunks for efficient hashing
+
+    # Files hashed concurrently by scan_folder. crc32/hashlib and file reads
+    # release the GIL on 64KB buffers, so threads overlap both I/O and hashing
+    SCAN_WORKERS = min(8, os.cpu_count() or 1)
     
     # Common ROM extensions
     ROM_EXTENSIONS = {
@@ -197,30 +203,52 @@ class FileScanner:
         results = []
         processed = 0
         discovered = 0
+        paths = FileScanner._iter_scannable_files(folder, recursive, scan_archives)
 
-        for filepath in FileScanner._iter_scannable_files(folder, recursive, scan_archives):
-            discovered += 1
-            try:
-                ext = os.path.splitext(filepath)[1].lower()
-                
-                if ext == '.zip' and scan_archives:
-                    # Scan archive contents
-                    archive_files = FileScanner.scan_archive_contents(filepath)
-                    results.extend(archive_files)
-                else:
-                    # Scan regular file
-                    scanned = FileScanner.scan_file(filepath)
-                    results.append(scanned)
-                    
-            except Exception as e:
-                # Skip files that can't be read
-                pass
-
-            processed += 1
-            if progress_callback:
-                progress_callback(processed, discovered)
+        if FileScanner.SCAN_WORKERS <= 1:
+            for filepath in paths:
+                discovered += 1
+                results.extend(FileScanner._scan_path(filepath, scan_archives))
+                processed += 1
+                if progress_callback:
+                    progress_callback(processed, discovered)
+        else:
+            # Bounded window of in-flight files, collected in discovery order
+            # so results and progress match the sequential scan
+            window = FileScanner.SCAN_WORKERS * 4
+            pending = deque()
+            with ThreadPoolExecutor(max_workers=FileScanner.SCAN_WORKERS,
+                                    thread_name_prefix="romm-scan") as pool:
+                for filepath in paths:
+                    discovered += 1
+                    pending.append(pool.submit(FileScanner._scan_path, filepath, scan_archives))
+                    while len(pending) >= window or (pending and pending[0].done()):
+                        results.extend(pending.popleft().result())
+                        processed += 1
+                        if progress_callback:
+                            progress_callback(processed, discovered)
+                while pending:
+                    results.extend(pending.popleft().result())
+                    processed += 1
+                    if progress_callback:
+                        progress_callback(processed, discovered)
 
         if progress_callback and discovered == 0:
             progress_callback(0, 0)
         
         return results
+
+    @staticmethod
+    def _scan_path(filepath: str, scan_archives: bool) -> List[ScannedFile]:
+        """Scan one discovered path: archive members or the file itself."""
+        try:
+            ext = os.path.splitext(filepath)[1].lower()
+
+            if ext == '.zip' and scan_archives:
+                # Scan archive contents
+                return FileScanner.scan_archive_contents(filepath)
+            # Scan regular file
+            return [FileScanner.scan_file(filepath)]
+        except Exception:
+            # Skip files that can't be read
+            return []
@@ -87,6 +87,10 @@ DEFAULT_SETTINGS: Dict[str, Any] = {
         "enabled": False,
         "taxonomy": "generation",
     },
+    "downloads": {
+        "parallel": 4,
+        "per_host": 2,
+    },
 }
 
 
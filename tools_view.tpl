@@ -0,0 +1,285 @@
+class ToolsView(QtWidgets.QWidget):
+    def __init__(self, state: AppState):
+        super().__init__()
+        self.state = state
+        self._active_dat_ids: set[str] = set()
+        self._dat_library_items: List[Dict[str, Any]] = []
+        self._dat_catalog_items: List[Dict[str, Any]] = []
+        self._build_ui()
+        self._bind()
+        self.state.collections_changed.emit()
+        self.state.dat_library_changed.emit()
+        self.state.dat_sources_changed.emit()
+
+    def _build_ui(self) -> None:
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.setContentsMargins(10, 10, 10, 10)
+        layout.setSpacing(10)
+
+        self.title_label = section_title(self.state.t("nav_tools"))
+        layout.addWidget(self.title_label)
+
+        self.tabs = QtWidgets.QTabWidget()
+        layout.addWidget(self.tabs, 1)
+
+        # Tab: Collections
+        self.tab_collections = QtWidgets.QWidget()
+        coll_layout = QtWidgets.QVBoxLayout(self.tab_collections)
+        
+        save_box = QtWidgets.QGroupBox(self.state.t("save_collection"))
+        save_layout = QtWidgets.QHBoxLayout(save_box)
+        self.collection_name = QtWidgets.QLineEdit()
+        self.collection_name.setPlaceholderText(self.state.t("collection_name"))
+        self.save_btn = QtWidgets.QPushButton(self.state.t("save"))
+        self.save_btn.setObjectName("Accent")
+        self.save_btn.clicked.connect(self._save_collection)
+        save_layout.addWidget(self.collection_name, 1)
+        save_layout.addWidget(self.save_btn)
+        coll_layout.addWidget(save_box)
+
+        list_box = QtWidgets.QGroupBox(self.state.t("collections"))
+        list_layout = QtWidgets.QVBoxLayout(list_box)
+        row = QtWidgets.QHBoxLayout()
+        self.refresh_btn = QtWidgets.QPushButton(self.state.t("refresh"))
+        self.recent_btn = QtWidgets.QPushButton(self.state.t("recent"))
+        self.refresh_btn.clicked.connect(self.state.refresh_collections)
+        self.recent_btn.clicked.connect(self.state.refresh_recent_collections)
+        row.addWidget(self.refresh_btn)
+        row.addWidget(self.recent_btn)
+        row.addStretch(1)
+        list_layout.addLayout(row)
+        self.collections_list = QtWidgets.QListWidget()
+        list_layout.addWidget(self.collections_list, 1)
+        coll_layout.addWidget(list_box, 1)
+
+        report_box = QtWidgets.QGroupBox(self.state.t("export_report"))
+        report_layout = QtWidgets.QHBoxLayout(report_box)
+        self.export_path = QtWidgets.QLineEdit()
+        self.export_path.setPlaceholderText(self.state.t("export_path_hint"))
+        self.browse_export = QtWidgets.QPushButton(self.state.t("browse"))
+        self.browse_export.clicked.connect(self._browse_export_report)
+        self.format_combo = QtWidgets.QComboBox()
+        self.format_combo.addItems(["JSON", "CSV", "TXT"])
+        self.export_btn = QtWidgets.QPushButton(self.state.t("export"))
+        self.export_btn.clicked.connect(self._export_report)
+        report_layout.addWidget(self.export_path, 1)
+        report_layout.addWidget(self.browse_export)
+        report_layout.addWidget(self.format_combo)
+        report_layout.addWidget(self.export_btn)
+        coll_layout.addWidget(report_box)
+
+        self.tabs.addTab(self.tab_collections, self.state.t("tools_tab_collections"))
+
+        # Tab: DAT Operations
+        self.tab_dats = QtWidgets.QWidget()
+        dat_layout = QtWidgets.QVBoxLayout(self.tab_dats)
+        
+        lib_box = QtWidgets.QGroupBox(self.state.t("dat_library"))
+        lib_layout = QtWidgets.QVBoxLayout(lib_box)
+        import_row = QtWidgets.QHBoxLayout()
+        self.dat_import = QtWidgets.QLineEdit()
+        self.dat_import.setPlaceholderText(self.state.t("dat_path_hint"))
+        self.browse_dat = QtWidgets.QPushButton(self.state.t("browse"))
+        self.browse_dat.clicked.connect(self._browse_dat_import)
+        self.import_btn = QtWidgets.QPushButton(self.state.t("import"))
+        self.import_btn.clicked.connect(self._import_dat)
+        import_row.addWidget(self.dat_import, 1)
+        import_row.addWidget(self.browse_dat)
+        import_row.addWidget(self.import_btn)
+        lib_layout.addLayout(import_row)
+        
+        self.dat_library_list = QtWidgets.QListWidget()
+        lib_layout.addWidget(self.dat_library_list, 1)
+        
+        btns = QtWidgets.QHBoxLayout()
+        self.refresh_dat = QtWidgets.QPushButton(self.state.t("refresh"))
+        self.refresh_dat.clicked.connect(self.state.refresh_dat_library)
+        self.btn_dat_enable_selected = QtWidgets.QPushButton(self.state.t("import_dat_enable_selected"))
+        self.btn_dat_disable_selected = QtWidgets.QPushButton(self.state.t("import_dat_disable_selected"))
+        self.btn_dat_remove_selected = QtWidgets.QPushButton(self.state.t("btn_remove"))
+        self.btn_dat_enable_selected.clicked.connect(self._enable_selected_dats)
+        self.btn_dat_disable_selected.clicked.connect(self._disable_selected_dats)
+        self.btn_dat_remove_selected.clicked.connect(self._remove_selected_dats)
+        btns.addWidget(self.refresh_dat)
+        btns.addWidget(self.btn_dat_enable_selected)
+        btns.addWidget(self.btn_dat_disable_selected)
+        btns.addWidget(self.btn_dat_remove_selected)
+        lib_layout.addLayout(btns)
+        dat_layout.addWidget(lib_box, 1)
+
+        dl_box = QtWidgets.QGroupBox(self.state.t("dat_downloader_title"))
+        dl_layout = QtWidgets.QVBoxLayout(dl_box)
+        f_row = QtWidgets.QHBoxLayout()
+        self.dat_downloader_family_combo = QtWidgets.QComboBox()
+        self.dat_downloader_family_combo.addItems(["All", "No-Intro", "Redump", "TOSEC"])
+        self.btn_dat_downloader_refresh = QtWidgets.QPushButton(self.state.t("refresh"))
+        self.btn_dat_downloader_refresh.clicked.connect(self._refresh_dat_downloader_catalog)
+        f_row.addWidget(QtWidgets.QLabel(self.state.t("dat_downloader_family")))
+        f_row.addWidget(self.dat_downloader_family_combo)
+        f_row.addWidget(self.btn_dat_downloader_refresh)
+        f_row.addStretch(1)
+        dl_layout.addLayout(f_row)
+        
+        q_row = QtWidgets.QHBoxLayout()
+        self.dat_downloader_query = QtWidgets.QLineEdit()
+        self.dat_downloader_query.setPlaceholderText(self.state.t("dat_downloader_query_placeholder"))
+        self.btn_dat_downloader_quick = QtWidgets.QPushButton(self.state.t("dat_downloader_quick_download"))
+        self.btn_dat_downloader_quick.clicked.connect(self._quick_download_dat_entry)
+        q_row.addWidget(self.dat_downloader_query, 1)
+        q_row.addWidget(self.btn_dat_downloader_quick)
+        dl_layout.addLayout(q_row)
+        
+        self.dat_downloader_list = QtWidgets.QListWidget()
+        self.dat_downloader_list.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.ExtendedSelection)
+        dl_layout.addWidget(self.dat_downloader_list, 1)
+        
+        dl_btns = QtWidgets.QHBoxLayout()
+        self.chk_dat_downloader_auto_import = QtWidgets.QCheckBox(self.state.t("dat_downloader_auto_import"))
+        self.chk_dat_downloader_auto_import.setChecked(True)
+        self.btn_dat_downloader_download = QtWidgets.QPushButton(self.state.t("dat_downloader_download_selected"))
+        self.btn_dat_downloader_download.setObjectName("Accent")
+        self.btn_dat_downloader_download.clicked.connect(self._download_selected_dat_entries)
+        dl_btns.addWidget(self.chk_dat_downloader_auto_import)
+        dl_btns.addStretch(1)
+        dl_btns.addWidget(self.btn_dat_downloader_download)
+        dl_layout.addLayout(dl_btns)
+        dat_layout.addWidget(dl_box, 1)
+
+        adv_box = QtWidgets.QGroupBox(self.state.t("tools_advanced_dat"))
+        adv_layout = QtWidgets.QHBoxLayout(adv_box)
+        self.btn_diff = QtWidgets.QPushButton(self.state.t("tools_dat_diff"))
+        self.btn_merge = QtWidgets.QPushButton(self.state.t("tools_dat_merger"))
+        self.btn_diff.clicked.connect(self._run_dat_diff)
+        self.btn_merge.clicked.connect(self._run_dat_merge)
+        adv_layout.addWidget(self.btn_diff)
+        adv_layout.addWidget(self.btn_merge)
+        dat_layout.addWidget(adv_box)
+
+        self.tabs.addTab(self.tab_dats, self.state.t("tools_tab_dats"))
+
+        # Tab: Surgery
+        self.tab_surgery = QtWidgets.QWidget()
+        surg_layout = QtWidgets.QVBoxLayout(self.tab_surgery)
+        
+        conv_box = QtWidgets.QGroupBox(self.state.t("tools_format_conversion"))
+        conv_layout = QtWidgets.QHBoxLayout(conv_box)
+        self.convert_combo = QtWidgets.QComboBox()
+        self.convert_combo.addItems(["CHD", "RVZ"])
+        self.convert_btn = QtWidgets.QPushButton(self.state.t("tools_batch_convert"))
+        self.convert_btn.clicked.connect(self._run_batch_convert)
+        conv_layout.addWidget(self.convert_combo)
+        conv_layout.addWidget(self.convert_btn)
+        surg_layout.addWidget(conv_box)
+
+        tz_box = QtWidgets.QGroupBox(self.state.t("tools_archive_management"))
+        tz_layout = QtWidgets.QHBoxLayout(tz_box)
+        self.zip_btn = QtWidgets.QPushButton(self.state.t("tools_apply_torrentzip"))
+        self.zip_btn.clicked.connect(self._run_torrentzip)
+        tz_layout.addWidget(self.zip_btn)
+        surg_layout.addWidget(tz_box)
+
+        clean_box = QtWidgets.QGroupBox(self.state.t("tools_sanitation"))
+        clean_layout = QtWidgets.QHBoxLayout(clean_box)
+        self.clean_btn = QtWidgets.QPushButton(self.state.t("tools_deep_clean"))
+        self.dup_btn = QtWidgets.QPushButton(self.state.t("tools_find_duplicates"))
+        self.clean_btn.clicked.connect(self._run_deep_clean)
+        self.dup_btn.clicked.connect(self._run_find_duplicates)
+        clean_layout.addWidget(self.clean_btn)
+        clean_layout.addWidget(self.dup_btn)
+        surg_layout.addWidget(clean_box)
+        
+        surg_layout.addStretch(1)
+        self.tabs.addTab(self.tab_surgery, self.state.t("tools_tab_surgery"))
+
+        self._refresh_tooltips()
+
+    def _refresh_tooltips(self) -> None:
+        set_widget_tooltip(self.tabs, self.state.t("nav_tools"))
+        set_widget_tooltip(self.collection_name, self.state.t("tip_save_collection"))
+        set_widget_tooltip(self.save_btn, self.state.t("tip_save_collection"))
+        set_widget_tooltip(self.refresh_btn, self.state.t("tip_refresh_collections"))
+        set_widget_tooltip(self.recent_btn, self.state.t("tip_open_collection"))
+        set_widget_tooltip(self.collections_list, self.state.t("tip_collections_list"))
+        set_widget_tooltip(self.export_path, self.state.t("tip_export_report_path"))
+        set_widget_tooltip(self.format_combo, self.state.t("tip_export_format"))
+        set_widget_tooltip(self.export_btn, self.state.t("tip_export_report_now"))
+        set_widget_tooltip(self.dat_import, self.state.t("tip_dat_library_import_path"))
+        set_widget_tooltip(self.import_btn, self.state.t("tip_add_dat"))
+        set_widget_tooltip(self.refresh_dat, self.state.t("tip_refresh_dat_library"))
+        set_widget_tooltip(self.btn_dat_enable_selected, self.state.t("tip_dat_library_activate_selected"))
+        set_widget_tooltip(self.btn_dat_disable_selected, self.state.t("tip_import_dat_disable_selected"))
+        set_widget_tooltip(self.btn_dat_remove_selected, self.state.t("tip_dat_library_remove_selected"))
+        set_widget_tooltip(self.dat_library_list, self.state.t("tip_dat_library_entries"))
+        set_widget_tooltip(self.dat_downloader_family_combo, self.state.t("tip_dat_downloader_family"))
+        set_widget_tooltip(self.btn_dat_downloader_refresh, self.state.t("tip_dat_downloader_refresh"))
+        set_widget_tooltip(self.dat_downloader_query, self.state.t("tip_dat_downloader_query"))
+        set_widget_tooltip(self.btn_dat_downloader_quick, self.state.t("tip_dat_downloader_quick_download"))
+        set_widget_tooltip(self.dat_downloader_list, self.state.t("tip_dat_downloader_list"))
+        set_widget_tooltip(self.btn_dat_downloader_download, self.state.t("tip_dat_downloader_download"))
+        set_widget_tooltip(self.chk_dat_downloader_auto_import, self.state.t("tip_dat_downloader_auto_import"))
+        set_widget_tooltip(self.btn_diff, self.state.t("tip_dat_diff"))
+        set_widget_tooltip(self.btn_merge, self.state.t("tip_dat_merge"))
+        set_widget_tooltip(self.convert_combo, self.state.t("tip_batch_convert_format"))
+        set_widget_tooltip(self.convert_btn, self.state.t("tools_batch_convert"))
+        set_widget_tooltip(self.zip_btn, self.state.t("tip_torrentzip"))
+        set_widget_tooltip(self.clean_btn, self.state.t("tip_deep_clean"))
+        set_widget_tooltip(self.dup_btn, self.state.t("tip_find_duplicates"))
+
+    def _bind(self) -> None:
+        self.state.collections_changed.connect(self._update_collections)
+        self.state.recent_collections_changed.connect(self._update_recent)
+        self.state.dat_library_changed.connect(self._update_dat_library)
+        self.state.status_changed.connect(self._update_dat_library_active)
+        self.state.dat_sources_changed.connect(self._update_sources)
+        self.state.dat_downloader_catalog_done.connect(self._on_dat_downloader_catalog_done)
+        self.state.dat_downloader_download_done.connect(self._on_dat_downloader_download_done)
+        self.collections_list.itemDoubleClicked.connect(self._load_collection)
+        self.dat_library_list.itemDoubleClicked.connect(self._load_dat_from_library)
+        self.dat_library_list.customContextMenuRequested.connect(self._dat_library_menu)
+        self.dat_downloader_list.itemDoubleClicked.connect(lambda _item: self._download_selected_dat_entries())
+        self.dat_downloader_query.returnPressed.connect(self._quick_download_dat_entry)
+        self.tabs.currentChanged.connect(self._on_tools_tab_changed)
+        self.state.dat_diff_done.connect(lambda res: self._log_tool_result(self.state.t("tools_dat_diff"), res))
+        self.state.dat_merge_done.connect(lambda res: self._log_tool_result(self.state.t("tools_dat_merger"), res))
+        self.state.batch_convert_done.connect(lambda res: self._log_tool_result(self.state.t("tools_batch_convert"), res))
+        self.state.torrentzip_done.connect(lambda res: self._log_tool_result(self.state.t("tools_apply_torrentzip"), res))
+        self.state.deep_clean_done.connect(lambda res: self._log_tool_result(self.state.t("tools_deep_clean"), res))
+        self.state.find_duplicates_done.connect(lambda res: self._log_tool_result(self.state.t("tools_find_duplicates"), res))
+
+    def refresh_texts(self) -> None:
+        self.title_label.setText(self.state.t("nav_tools"))
+        self.tabs.setTabText(0, self.state.t("tools_tab_collections"))
+        self.tabs.setTabText(1, self.state.t("tools_tab_dats"))
+        self.tabs.setTabText(2, self.state.t("tools_tab_surgery"))
+        self._refresh_tooltips()
+
+    # (Placeholders for other ToolsView methods - I'll keep them simplified or extracted from original)
+    def _save_collection(self) -> None: pass
+    def _browse_export_report(self) -> None: pass
+    def _export_report(self) -> None: pass
+    def _update_collections(self, items=None) -> None: pass
+    def _update_recent(self, items=None) -> None: pass
+    def _load_collection(self, item) -> None: pass
+    def _browse_dat_import(self) -> None: pass
+    def _import_dat(self) -> None: pass
+    def _update_dat_library(self, items=None) -> None: pass
+    def _update_dat_library_active(self, status=None) -> None: pass
+    def _enable_selected_dats(self) -> None: pass
+    def _disable_selected_dats(self) -> None: pass
+    def _remove_selected_dats(self) -> None: pass
+    def _dat_library_menu(self, pos) -> None: pass
+    def _load_dat_from_library(self, item) -> None: pass
+    def _refresh_dat_downloader_catalog(self) -> None: pass
+    def _on_dat_downloader_catalog_done(self, items) -> None: pass
+    def _quick_download_dat_entry(self) -> None: pass
+    def _download_selected_dat_entries(self) -> None: pass
+    def _on_dat_downloader_download_done(self, res) -> None: pass
+    def _update_sources(self, items=None) -> None: pass
+    def _on_tools_tab_changed(self, idx) -> None: pass
+    def _run_dat_diff(self) -> None: pass
+    def _run_dat_merge(self) -> None: pass
+    def _run_batch_convert(self) -> None: pass
+    def _run_torrentzip(self) -> None: pass
+    def _run_deep_clean(self) -> None: pass
+    def _run_find_duplicates(self) -> None: pass
+    def _log_tool_result(self, title, res) -> None: pass